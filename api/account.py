@@ -0,0 +1,73 @@
+from typing import Dict
+
+import allure
+
+from utils.ApiClient import ApiClient
+
+# Cookies lidos pelo frontend do demoqa para considerar o usuário logado
+SESSION_COOKIES = ("userID", "userName", "token", "expires")
+
+
+class AccountApi:
+    """demoqa Account API (https://demoqa.com/swagger/): users, tokens and login."""
+
+    def __init__(self, client: ApiClient):
+        self.client = client
+
+    @allure.step("API: Create user")
+    def create_user(self, username: str, password: str) -> Dict:
+        """Creates a user; the password needs upper/lower case, digit and symbol."""
+        return self.client.post(
+            "Account/v1/User",
+            json={"userName": username, "password": password},
+            expected_status=201,
+        ).json()
+
+    @allure.step("API: Generate token")
+    def generate_token(self, username: str, password: str) -> str:
+        response = self.client.post(
+            "Account/v1/GenerateToken",
+            json={"userName": username, "password": password},
+            expected_status=200,
+        ).json()
+        if response.get("status") != "Success":
+            raise RuntimeError(f"Token not generated for {username}: {response}")
+        return response["token"]
+
+    @allure.step("API: Login")
+    def login(self, username: str, password: str) -> Dict:
+        """Logs in and stores the session cookies of the frontend in the client."""
+        session = self.client.post(
+            "Account/v1/Login",
+            json={"userName": username, "password": password},
+            expected_status=200,
+        ).json()
+        if not session or not session.get("token"):
+            # O token só existe depois de um GenerateToken
+            self.generate_token(username, password)
+            session = self.client.post(
+                "Account/v1/Login",
+                json={"userName": username, "password": password},
+                expected_status=200,
+            ).json()
+
+        self.client.set_cookie("userID", session["userId"])
+        self.client.set_cookie("userName", session["username"])
+        self.client.set_cookie("token", session["token"])
+        self.client.set_cookie("expires", session["expires"])
+        return session
+
+    @allure.step("API: Login browser context")
+    def login_context(self, context, username: str, password: str) -> Dict:
+        """Logs in through the API and shares the session with a browser context."""
+        session = self.login(username, password)
+        self.client.share_cookies(context)
+        return session
+
+    @allure.step("API: Delete user")
+    def delete_user(self, user_id: str, token: str) -> None:
+        self.client.delete(
+            f"Account/v1/User/{user_id}",
+            headers={"Authorization": f"Bearer {token}"},
+            expected_status=(200, 204),
+        )
@@ -0,0 +1,76 @@
+"""
+First Navigation Benchmark
+
+Measures the latency of the first navigation of a worker with a cold HTTP cache
+(fresh browser profile) versus a warm cache (persistent profile reused between runs).
+
+Usage:
+    python benchmarks/first_navigation.py --url https://demoqa.com/ --runs 5
+
+Each run launches a new browser, as a new pytest worker would. Warm runs reuse the same
+profile folder and wipe cookies/storage before launching, exactly like the
+`persistent_context` fixture.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.browser_profile import PersistentProfile  # noqa: E402
+
+
+def first_navigation_ms(browser_type, user_data_dir: Path, url: str) -> float:
+    """Launches a persistent context and returns the first navigation time in ms."""
+    context = browser_type.launch_persistent_context(
+        user_data_dir, headless=True, args=["--disable-gpu", "--no-sandbox"]
+    )
+    try:
+        page = context.pages[0] if context.pages else context.new_page()
+        start = time.perf_counter()
+        page.goto(url, wait_until="load")
+        return (time.perf_counter() - start) * 1000
+    finally:
+        context.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="https://demoqa.com/")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--browser", default="chromium")
+    args = parser.parse_args()
+
+    cold, warm = [], []
+    with sync_playwright() as playwright, tempfile.TemporaryDirectory() as tmp:
+        browser_type = getattr(playwright, args.browser)
+
+        for run in range(args.runs):
+            cold_dir = Path(tmp) / f"cold_{run}"
+            cold.append(first_navigation_ms(browser_type, cold_dir, args.url))
+
+        profile = PersistentProfile(tmp, args.browser, "warm")
+        first_navigation_ms(browser_type, profile.prepare(), args.url)  # Prime cache
+        for _ in range(args.runs):
+            warm.append(first_navigation_ms(browser_type, profile.prepare(), args.url))
+        profile.release()
+
+    print(f"First navigation to {args.url} ({args.browser}, {args.runs} runs)")
+    for label, values in (("cold", cold), ("warm", warm)):
+        print(
+            f"  {label}: median {statistics.median(values):8.1f} ms | "
+            f"min {min(values):8.1f} ms | max {max(values):8.1f} ms"
+        )
+    speedup = statistics.median(cold) / statistics.median(warm)
+    print(f"  warm cache speedup: {speedup:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Launch Profiles Benchmark
+
+Compares the browser launch profiles of config.yaml (LAUNCH_PROFILES): launch time,
+browser memory after loading a page and the time of that first navigation.
+
+Usage:
+    python benchmarks/launch_profiles.py --url https://demoqa.com/ --runs 5
+    python benchmarks/launch_profiles.py --profiles default,ci-fast
+
+Every run launches a new headless browser, as a new pytest worker would. The memory
+columns are empty where /proc is not available. The launches of the test sessions are
+summarized from LAUNCH_PROFILE.STATS_FILE with --history.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import yaml
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.launch_profiles import (  # noqa: E402
+    LaunchMeter,
+    get_profile,
+    launch_options,
+    summarize,
+)
+
+CONFIG_YAML_PATH = "./config.yaml"
+
+
+def measure_launch(browser_type, name: str, profile: dict, url: str):
+    """Returns (launch ms, memory MB, first navigation ms) of a new browser."""
+    meter = LaunchMeter(name, browser_type.name, True)
+    browser = meter.measure(
+        browser_type.launch, **launch_options(profile, True, browser_type.name)
+    )
+    try:
+        page = browser.new_page()
+        start = time.perf_counter()
+        page.goto(url, wait_until="load")
+        navigation_ms = (time.perf_counter() - start) * 1000
+        return meter.launch_ms, meter.entry(0, 0)["end_rss_mb"], navigation_ms
+    finally:
+        browser.close()
+
+
+def main() -> int:
+    with open(CONFIG_YAML_PATH, "r") as file:
+        get_config = yaml.safe_load(file)
+    profiles = get_config.get("LAUNCH_PROFILES") or {}
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="https://demoqa.com/")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--profiles", default=",".join(profiles) or "default")
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Summarize the launches recorded by the test sessions instead",
+    )
+    args = parser.parse_args()
+
+    if args.history:
+        stats_file = (get_config.get("LAUNCH_PROFILE") or {}).get(
+            "STATS_FILE", "./.test_history/launch_profiles.jsonl"
+        )
+        for key, stats in summarize(stats_file).items():
+            print(f"  {key}: {stats}")
+        return 0
+
+    print(f"Launch profiles on {args.url} ({args.browser}, {args.runs} runs)")
+    with sync_playwright() as playwright:
+        browser_type = getattr(playwright, args.browser)
+        for name in args.profiles.split(","):
+            profile = get_profile(profiles, name.strip())
+            runs = [
+                measure_launch(browser_type, name, profile, args.url)
+                for _ in range(args.runs)
+            ]
+            launch, memory, navigation = zip(*runs)
+            memory = [value for value in memory if value is not None]
+            print(
+                f"  {name:>10}: launch median {statistics.median(launch):8.1f} ms | "
+                f"memory median "
+                + (f"{statistics.median(memory):7.1f} MB" if memory else "    n/a   ")
+                + f" | first navigation median {statistics.median(navigation):8.1f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
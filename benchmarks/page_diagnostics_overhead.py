@@ -0,0 +1,72 @@
+"""
+Page Diagnostics Overhead Benchmark
+
+Measures the cost of the `PageDiagnostics` collector attached by the page fixtures:
+navigation time with and without the listeners and the time spent in its handlers.
+
+Usage:
+    python benchmarks/page_diagnostics_overhead.py --url https://demoqa.com/ --runs 5
+
+Runs alternate between a plain page and a watched page on fresh contexts of the same
+browser, so network and cache effects hit both sides equally.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.page_diagnostics import PageDiagnostics  # noqa: E402
+
+
+def navigation_ms(browser, url: str, watch: bool):
+    """Returns (navigation ms, handler ms, events) of a navigation on a new context."""
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        diagnostics = PageDiagnostics.attach(page) if watch else None
+        start = time.perf_counter()
+        page.goto(url, wait_until="load")
+        elapsed = (time.perf_counter() - start) * 1000
+        if diagnostics:
+            return elapsed, diagnostics.overhead_ms, diagnostics.events
+        return elapsed, 0.0, 0
+    finally:
+        context.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="https://demoqa.com/")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--browser", default="chromium")
+    args = parser.parse_args()
+
+    plain, watched, handlers, events = [], [], [], []
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch(headless=True)
+        navigation_ms(browser, args.url, watch=False)  # Aquecimento
+        for _ in range(args.runs):
+            plain.append(navigation_ms(browser, args.url, watch=False)[0])
+            elapsed, handler_ms, count = navigation_ms(browser, args.url, watch=True)
+            watched.append(elapsed)
+            handlers.append(handler_ms)
+            events.append(count)
+        browser.close()
+
+    print(f"Plain navigation:   median {statistics.median(plain):.0f} ms")
+    print(f"Watched navigation: median {statistics.median(watched):.0f} ms")
+    print(
+        f"Collector handlers: median {statistics.median(handlers):.2f} ms "
+        f"for {statistics.median(events):.0f} events per navigation"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
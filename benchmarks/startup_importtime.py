@@ -0,0 +1,95 @@
+"""
+Session Startup Benchmark
+
+Measures how long the test session takes to start, using `python -X importtime` for the
+import cost of conftest.py and its plugins and wall-clock timings of pytest runs that
+never touch the browser or the database.
+
+Usage:
+    python benchmarks/startup_importtime.py --runs 5 --top 15
+    python benchmarks/startup_importtime.py --pytest-args "tests/test_database.py"
+
+The report lists:
+    - Total import time of conftest.py + plugins and the slowest modules they pull in.
+    - Median wall time of `pytest --collect-only` (and of the optional pytest args).
+"""
+
+import argparse
+import re
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+# Imports the root conftest.py and every plugin it registers, as pytest does
+CONFTEST_IMPORT = (
+    "import importlib, conftest; "
+    "[importlib.import_module(name) for name in conftest.pytest_plugins]"
+)
+
+
+def import_times(code: str):
+    """Returns [(cumulative_us, self_us, depth, module)] for the modules imported by code."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            entries.append((int(cumulative_us), int(self_us), depth, name))
+    return entries
+
+
+def pytest_wall_time_ms(args, runs: int) -> float:
+    """Median wall time of a pytest invocation without plugins that write reports."""
+    command = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *args]
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT_DIR, capture_output=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--pytest-args",
+        default="",
+        help="Extra pytest run to time, e.g. 'tests/test_database.py'",
+    )
+    args = parser.parse_args()
+
+    interpreter = {entry[3] for entry in import_times("pass")}
+    entries = [
+        entry for entry in import_times(CONFTEST_IMPORT) if entry[3] not in interpreter
+    ]
+    total = sum(entry[0] for entry in entries if entry[2] == 0)
+    print(f"conftest.py + plugins import time: {total / 1000:.1f} ms")
+    print(f"Slowest modules imported at startup (top {args.top}, cumulative):")
+    for cumulative, self_us, _, name in sorted(entries, reverse=True)[: args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {name}")
+
+    collect = pytest_wall_time_ms(["--collect-only", "-n", "0"], args.runs)
+    print(f"pytest --collect-only: median {collect:.0f} ms ({args.runs} runs)")
+
+    if args.pytest_args:
+        extra = pytest_wall_time_ms(shlex.split(args.pytest_args), args.runs)
+        print(f"pytest {args.pytest_args}: median {extra:.0f} ms ({args.runs} runs)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,227 @@
+"""
+Clean Cache
+
+Removes the Python/pytest caches of the project and applies the retention policy of the
+test artifacts (reports, screenshots, Playwright traces and videos), in a single pass
+over the tree. Runs before every `make test`.
+
+Usage:
+    python clean_cache.py
+    python clean_cache.py --dry-run
+    python clean_cache.py --keep-runs 3 --max-size 200
+
+Behavior:
+    - The tree is read once with `os.scandir`; excluded folders (CLEANUP.EXCLUDE, e.g.
+      venv and node_modules) are never entered, and cache folders are removed whole
+      without reading their content.
+    - Artifacts: files of CLEANUP.ARTIFACT_FOLDERS older than the last KEEP_RUNS runs
+      are removed, then the oldest ones until the folders fit in MAX_SIZE_MB. A run
+      starts at each execution of this script (times kept in CLEANUP.RUNS_FILE).
+    - Removals run in a thread pool (CLEANUP.WORKERS); --dry-run only reports what
+      would be removed and how many bytes would be reclaimed.
+"""
+
+import argparse
+import json
 import os
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Set, Tuple
+
+import yaml
+
+CONFIG_YAML_PATH = "./config.yaml"
+# Execuções guardadas no arquivo de execuções (suficiente para qualquer KEEP_RUNS usual)
+MAX_RECORDED_RUNS = 100
+
+
+def _tree_size(path: str) -> int:
+    """Size in bytes of a folder, read with os.scandir."""
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def scan(
+    root: str, cache_dirs: Set[str], exclude: Set[str], artifact_folders: Set[str]
+) -> Tuple[List[str], List[Tuple[float, int, str]]]:
+    """
+    Walks the tree once.
+
+    Returns:
+        (cache folders, artifact files as (mtime, size, path))
+    """
+    caches: List[str] = []
+    artifacts: List[Tuple[float, int, str]] = []
+    pending = [(root, False)]
+    while pending:
+        folder, in_artifacts = pending.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in exclude:
+                    continue
+                if entry.name in cache_dirs:
+                    caches.append(entry.path)
+                    continue
+                path = os.path.normpath(entry.path)
+                pending.append((entry.path, in_artifacts or path in artifact_folders))
+            elif in_artifacts:
+                stat = entry.stat(follow_symlinks=False)
+                artifacts.append((stat.st_mtime, stat.st_size, entry.path))
+    return caches, artifacts
+
+
+def expired_artifacts(
+    artifacts: List[Tuple[float, int, str]],
+    runs: List[float],
+    keep_runs: int,
+    max_size: int,
+) -> List[Tuple[float, int, str]]:
+    """
+    Artifacts outside the retention: older than the start of the last `keep_runs` runs,
+    then the oldest ones while the total is above `max_size` bytes (0 disables a rule).
+    """
+    cutoff = runs[-keep_runs] if keep_runs and len(runs) >= keep_runs else 0.0
+    artifacts = sorted(artifacts)
+    expired = [artifact for artifact in artifacts if artifact[0] < cutoff]
+    kept = artifacts[len(expired) :]
+    total = sum(size for _, size, _ in kept)
+    for artifact in kept:
+        if not max_size or total <= max_size:
+            break
+        expired.append(artifact)
+        total -= artifact[1]
+    return expired
+
+
+def _remove_dir(path: str) -> int:
+    size = _tree_size(path)
+    shutil.rmtree(path, ignore_errors=True)
+    return size
+
+
+def _remove_file(artifact: Tuple[float, int, str]) -> int:
+    try:
+        os.remove(artifact[2])
+    except OSError:
+        return 0
+    return artifact[1]
+
+
+def _remove_empty_dirs(expired: List[Tuple[float, int, str]], roots: Set[str]) -> None:
+    """Removes the folders left empty by the artifact removal, up to the artifact folders."""
+    folders = {os.path.normpath(os.path.dirname(path)) for _, _, path in expired}
+    for folder in sorted(folders, key=len, reverse=True):
+        while folder not in roots and folder not in ("", "."):
+            try:
+                os.rmdir(folder)
+            except OSError:
+                break
+            folder = os.path.dirname(folder)
+
+
+def _read_runs(path: Path) -> List[float]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def main() -> int:
+    with open(CONFIG_YAML_PATH, "r") as file:
+        get_config = yaml.safe_load(file)
+    settings = get_config.get("CLEANUP") or {}
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--keep-runs", type=int, default=settings.get("KEEP_RUNS", 5))
+    parser.add_argument(
+        "--max-size",
+        type=float,
+        default=settings.get("MAX_SIZE_MB", 500),
+        help="Max total size (MB) of the artifact folders, 0 disables",
+    )
+    parser.add_argument("--workers", type=int, default=settings.get("WORKERS", 8))
+    args = parser.parse_args()
+
+    artifact_folders = {
+        os.path.normpath(os.path.join(args.root, folder))
+        for folder in settings.get(
+            "ARTIFACT_FOLDERS", ["reports", "screenshots", "test-results"]
+        )
+    }
+    caches, artifacts = scan(
+        args.root,
+        set(settings.get("CACHE_DIRS", ["__pycache__", ".pytest_cache"])),
+        set(settings.get("EXCLUDE", [".git", "venv", ".venv", "node_modules"])),
+        artifact_folders,
+    )
+    runs_file = Path(settings.get("RUNS_FILE", "./.test_history/clean_runs.json"))
+    runs = _read_runs(runs_file)
+    expired = expired_artifacts(
+        artifacts, runs, args.keep_runs, int(args.max_size * 1024 * 1024)
+    )
 
+    if args.dry_run:
+        cache_bytes = sum(_tree_size(path) for path in caches)
+        artifact_bytes = sum(size for _, size, _ in expired)
+        for path in caches:
+            print(f"Would remove: {path}")
+        print(f"Cache: {len(caches)} folders, {_format_size(cache_bytes)}")
+        print(
+            f"Artifacts: {len(expired)} of {len(artifacts)} files, "
+            f"{_format_size(artifact_bytes)}"
+        )
+        print(
+            f"Dry run: {_format_size(cache_bytes + artifact_bytes)} would be reclaimed"
+        )
+        return 0
 
-def remove_cache_dirs(root_dir="."):
-    for root, dirs, files in os.walk(root_dir):
-        for dir_name in dirs:
-            if dir_name == "__pycache__":
-                cache_path = os.path.join(root, dir_name)
-                shutil.rmtree(cache_path)
-                print(f"Removed: {cache_path}")
+    with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+        cache_bytes = sum(pool.map(_remove_dir, caches))
+        artifact_bytes = sum(pool.map(_remove_file, expired))
+    _remove_empty_dirs(expired, artifact_folders)
 
+    # Início de uma nova execução, usado pela retenção das próximas limpezas
+    runs_file.parent.mkdir(parents=True, exist_ok=True)
+    runs_file.write_text(json.dumps((runs + [time.time()])[-MAX_RECORDED_RUNS:]))
 
-def remove_pytest_cache_dirs(root_dir="."):
-    for root, dirs, files in os.walk(root_dir):
-        for dir_name in dirs:
-            if dir_name == ".pytest_cache":
-                cache_path = os.path.join(root, dir_name)
-                shutil.rmtree(cache_path)
-                print(f"Removed: {cache_path}")
+    for path in caches:
+        print(f"Removed: {path}")
+    print(f"Cache: {len(caches)} folders, {_format_size(cache_bytes)}")
+    print(
+        f"Artifacts: {len(expired)} of {len(artifacts)} files, "
+        f"{_format_size(artifact_bytes)}"
+    )
+    print(f"Reclaimed {_format_size(cache_bytes + artifact_bytes)}")
+    return 0
 
 
 if __name__ == "__main__":
-    remove_cache_dirs()
-    remove_pytest_cache_dirs()
-    print("Cache directories removed!")
+    sys.exit(main())
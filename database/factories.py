@@ -0,0 +1,104 @@
+"""
+Test Data Factories
+
+Pre-allocates unique test records in bulk, so a test needing its own user gets it from
+an in-memory queue instead of inserting it with a database round trip.
+
+Classes:
+    UserFactory:
+        Hands out unique users inserted in blocks (one multi-row INSERT per block).
+
+Behavior:
+    - Every record of a session shares a prefix made of the xdist worker id and a random
+      run token (e.g. `factory_gw0_3f9a1c_`), so workers never collide.
+    - When the queue is empty a new block of `block_size` users is inserted.
+    - Users that were not changed by a test can be given back with `release()`.
+    - `cleanup()` deletes every record created with the prefix (session end).
+
+Example:
+    factory = UserFactory(UserDatabaseHandler(env, db_manager), block_size=100)
+    user = factory.create()   # {"id": 11, "username": "factory_gw0_...", ...}
+    factory.cleanup()
+"""
+
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from utils.logger import log_info
+from utils.worker_schema import worker_id
+
+from .users import UserDatabaseHandler
+
+DEFAULT_PASSWORD = "password123"
+
+
+class UserFactory:
+    """
+    Factory of unique users backed by the `users` table.
+
+    Args:
+        handler (UserDatabaseHandler): Handler used for the bulk inserts and deletes.
+        block_size (int): Users inserted per block. Defaults to 50
+        prefix (str): Username prefix of the records. Defaults to one per worker and run
+    """
+
+    def __init__(
+        self,
+        handler: UserDatabaseHandler,
+        block_size: int = 50,
+        prefix: Optional[str] = None,
+    ):
+        self.handler = handler
+        self.block_size = block_size
+        self.prefix = (
+            prefix or f"factory_{worker_id() or 'main'}_{uuid.uuid4().hex[:6]}_"
+        )
+        self._queue: Deque[Dict] = deque()
+        self._blocks = 0
+        self.created = 0
+
+    def _allocate_block(self) -> None:
+        block_prefix = f"{self.prefix}{self._blocks}_"
+        users = [
+            {
+                "username": f"{block_prefix}{index}",
+                "email": f"{block_prefix}{index}@example.com",
+                "password": DEFAULT_PASSWORD,
+            }
+            for index in range(self.block_size)
+        ]
+        self._queue.extend(self.handler.insert_users(users))
+        self._blocks += 1
+        log_info(f"Allocated block of {self.block_size} users ({block_prefix}*)")
+
+    def create(self) -> Dict:
+        """Returns an unused user, inserting a new block when the queue is empty."""
+        if not self._queue:
+            self._allocate_block()
+        self.created += 1
+        return self._queue.popleft()
+
+    def create_many(self, count: int) -> List[Dict]:
+        return [self.create() for _ in range(count)]
+
+    def release(self, user: Dict) -> None:
+        """Gives back a user the test did not change, so it can be handed out again."""
+        self._queue.append(user)
+
+    def cleanup(self) -> int:
+        """
+        Deletes every user created with the prefix.
+
+        Returns:
+            int: Number of deleted users.
+        """
+        self._queue.clear()
+        if not self._blocks:
+            return 0
+        deleted = self.handler.delete_users_by_prefix(self.prefix)
+        log_info(
+            f"Removed {deleted} factory users ({self.created} handed out, "
+            f"{self._blocks} blocks)"
+        )
+        return deleted
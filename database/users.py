@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 import allure
 
@@ -17,3 +17,47 @@ class UserDatabaseHandler:
     def get_users(self) -> Optional[dict]:
         """Fetches all users from the database."""
         return self.db_manager.execute_script("resources/sql/users.sql")
+
+    @allure.step("Inserting users in bulk")
+    def insert_users(self, users: List[Dict]) -> List[Dict]:
+        """
+        Inserts the users with a single multi-row INSERT and returns them with their ids.
+
+        Args:
+            users: Dictionaries with username, email and password
+        """
+        if not users:
+            return []
+
+        placeholders = ", ".join(["(%s, %s, %s)"] * len(users))
+        values = [
+            value
+            for user in users
+            for value in (user["username"], user["email"], user["password"])
+        ]
+        self.db_manager.execute_sql(
+            f"INSERT INTO users (username, email, password) VALUES {placeholders}",
+            values,
+        )
+        self.db_manager.connection.commit()
+
+        usernames = [user["username"] for user in users]
+        return self.db_manager.execute_sql(
+            "SELECT id, username, email, password FROM users "
+            f"WHERE username IN ({', '.join(['%s'] * len(usernames))}) ORDER BY id",
+            usernames,
+        )
+
+    @allure.step("Deleting users by username prefix")
+    def delete_users_by_prefix(self, prefix: str) -> int:
+        """Deletes the users whose username starts with the prefix."""
+        pattern = prefix.replace("\\", "\\\\").replace("_", "\\_").replace("%", "\\%")
+        count = self.db_manager.execute_sql(
+            "SELECT COUNT(*) AS total FROM users WHERE username LIKE %s",
+            [pattern + "%"],
+        )[0]["total"]
+        self.db_manager.execute_sql(
+            "DELETE FROM users WHERE username LIKE %s", [pattern + "%"]
+        )
+        self.db_manager.connection.commit()
+        return count
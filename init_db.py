@@ -8,16 +8,25 @@ This enhanced script initializes a MySQL database with:
 - Environment variable support
 - Configurable parameters
 - Type hints and documentation
+- Snapshot mode: capture the seeded tables once and restore them in bulk
+
+Usage:
+    python init_db.py                 # Replays init.sql
+    python init_db.py --snapshot      # Replays init.sql and captures a snapshot
+    python init_db.py --restore       # Restores the snapshot (init + capture if missing)
 """
 
+import argparse
 import os
-import time
 from pathlib import Path
 from typing import Optional
 
 import mysql.connector
 from dotenv import load_dotenv
 
+from utils.DatabaseSnapshot import STRATEGIES, DatabaseSnapshot
+from utils.retry import DatabaseConnectionError, RetryPolicy, connect_with_retry
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -33,7 +42,8 @@ class DatabaseInitializer:
         database (str): Database name. Defaults to 'testdb'
         init_file (str): Path to SQL initialization file. Defaults to 'init.sql'
         timeout (int): Connection timeout in seconds. Defaults to 60
-        interval (int): Retry interval in seconds. Defaults to 5
+        interval (int): Maximum retry interval in seconds. Defaults to 5
+        port (int): Database server port. Defaults to 3306
     """
 
     def __init__(
@@ -45,20 +55,30 @@ class DatabaseInitializer:
         init_file: str = "init.sql",
         timeout: int = 60,
         interval: int = 5,
+        port: int = 3306,
     ):
         self.host = os.getenv("DB_HOST", host)
         self.user = os.getenv("DB_USER", user)
         self.password = os.getenv("DB_PASSWORD", password)
         self.database = os.getenv("DB_NAME", database)
+        self.port = int(os.getenv("DB_PORT", port))
         self.init_file = Path(init_file)
         self.timeout = timeout
         self.interval = interval
         self.connection: Optional[mysql.connector.MySQLConnection] = None
 
-    def initialize(self) -> bool:
+    def initialize(
+        self, snapshot: bool = False, restore: bool = False, strategy: str = "auto"
+    ) -> bool:
         """
         Main initialization method that handles the complete process.
 
+        Args:
+            snapshot (bool): Capture a snapshot of the tables after running the script
+            restore (bool): Restore the snapshot instead of running the script. When there
+                is no snapshot yet, the script is run and the snapshot captured
+            strategy (str): Restore strategy: auto, reload or clone
+
         Returns:
             bool: True if initialization succeeded, False otherwise
         """
@@ -66,9 +86,15 @@ class DatabaseInitializer:
             if not self._connect_with_retry():
                 return False
 
+            if restore and self._restore_snapshot(strategy):
+                return True
+
             if not self._execute_init_script():
                 return False
 
+            if snapshot or restore:
+                DatabaseSnapshot(self.connection, self.database).capture()
+
             return True
 
         except Exception as e:
@@ -79,39 +105,34 @@ class DatabaseInitializer:
 
     def _connect_with_retry(self) -> bool:
         """
-        Attempts to connect to the database with retry logic.
+        Attempts to connect to the database with retry logic
+        (exponential backoff, TCP probe and fast fail on fatal errors).
 
         Returns:
-            bool: True if connection succeeded, False if timeout reached
+            bool: True if connection succeeded, False on fatal error or timeout
         """
-        start_time = time.time()
-        attempts = 0
-
-        while (time.time() - start_time) < self.timeout:
-            attempts += 1
-            try:
-                print(f"Attempt #{attempts}: Connecting to MySQL at {self.host}...")
-                self.connection = mysql.connector.connect(
+        try:
+            self.connection = connect_with_retry(
+                lambda: mysql.connector.connect(
                     host=self.host,
+                    port=self.port,
                     user=self.user,
                     password=self.password,
                     database=self.database,
                     connect_timeout=5,
-                )
-
-                if self.connection.is_connected():
-                    print(f"✅ Successfully connected to database '{self.database}'")
-                    return True
-
-            except mysql.connector.Error as e:
-                print(f"⚠️ Connection attempt failed: {e}")
-                time.sleep(self.interval)
-                continue
+                ),
+                self.host,
+                self.port,
+                RetryPolicy(timeout=self.timeout, max_delay=self.interval),
+                database=self.database,
+                user=self.user,
+            )
+            print(f"✅ Successfully connected to database '{self.database}'")
+            return True
 
-        print(
-            f"⛔ Timeout after {self.timeout} seconds. Could not connect to database."
-        )
-        return False
+        except DatabaseConnectionError as e:
+            print(f"⛔ {e}")
+            return False
 
     def _execute_init_script(self) -> bool:
         """
@@ -156,6 +177,21 @@ class DatabaseInitializer:
             self.connection.rollback()
             return False
 
+    def _restore_snapshot(self, strategy: str) -> bool:
+        """
+        Restores the tables from the snapshot captured by a previous run.
+
+        Returns:
+            bool: True if the snapshot was restored, False if there is no snapshot
+        """
+        snapshot = DatabaseSnapshot(self.connection, self.database)
+        if not snapshot.exists():
+            print("⚠️ No snapshot found, running the initialization script")
+            return False
+
+        snapshot.restore(strategy=strategy)
+        return True
+
     def _close_connection(self) -> None:
         """Closes the database connection if it exists."""
         if self.connection and self.connection.is_connected():
@@ -164,6 +200,20 @@ class DatabaseInitializer:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Initialize the test database")
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Capture a snapshot of the tables after running init.sql",
+    )
+    parser.add_argument(
+        "--restore",
+        action="store_true",
+        help="Restore the snapshot instead of replaying init.sql",
+    )
+    parser.add_argument("--strategy", choices=STRATEGIES, default="auto")
+    args = parser.parse_args()
+
     # Example usage
     initializer = DatabaseInitializer(
         host="127.0.0.1",
@@ -175,7 +225,7 @@ if __name__ == "__main__":
         interval=5,
     )
 
-    if initializer.initialize():
+    if initializer.initialize(args.snapshot, args.restore, args.strategy):
         print("🚀 Database initialization completed successfully")
         exit(0)
     else:
@@ -0,0 +1,177 @@
+"""
+Load Runner
+
+Reuses the page objects of the test suite as virtual users to measure the application
+under concurrency (see `utils/load_test.py`).
+
+Usage:
+    python load_runner.py --env rc --users 20 --processes 2 --ramp-up 30 --duration 120
+    python load_runner.py --url https://demoqa.com/ --flow home --users 5 --iterations 10 \\
+        --slo "HomePage.navigate:p95<3000" --slo "error_rate<0.01"
+
+Defaults come from the LOAD_TEST section of config.yaml. The report lists the latency
+percentiles and histogram of every step (page-object method) and flow, the throughput
+and the error rate. The exit code is 1 when an SLO is breached.
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+
+import yaml
+
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from utils.EnvironmentConfig import EnvironmentConfig
+from utils.load_test import LoadPlan, LoadStats, Slo, run_process
+
+CONFIG_YAML_PATH = "./config.yaml"
+
+
+def home(page, env_config, timed):
+    home_page = timed(HomePage(page, env_config))
+    home_page.navigate()
+    home_page.has_title()
+
+
+def login(page, env_config, timed):
+    login_page = timed(LoginPage(page, env_config))
+    login_page.navigate()
+    login_page.has_title()
+
+
+# Fluxos disponíveis: cada usuário virtual alterna entre os fluxos selecionados
+FLOWS = {"home": home, "login": login}
+
+
+def print_report(stats: LoadStats, histograms: bool) -> None:
+    print(
+        f"\n{stats.iterations} iterations in {stats.duration:.1f} s: "
+        f"{stats.throughput:.2f} it/s, {stats.error_count} errors "
+        f"({stats.error_rate:.2%})"
+    )
+    header = f"{'step':<32}{'count':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'rps':>8}"
+    for title, group in (("Steps", stats.steps), ("Flows", stats.flows)):
+        print(f"\n{title} (ms)\n{header}")
+        for name, histogram in sorted(group.items()):
+            print(
+                f"{name:<32}{histogram.count:>7}{histogram.mean:>9.0f}"
+                f"{histogram.percentile(50):>9.0f}{histogram.percentile(95):>9.0f}"
+                f"{histogram.percentile(99):>9.0f}{histogram.max:>9.0f}"
+                f"{histogram.count / stats.duration:>8.2f}"
+            )
+            if histograms:
+                for line in histogram.bars():
+                    print(f"    {line}")
+    for error, count in stats.errors.items():
+        print(f"ERROR {count}x {error}")
+
+
+def main() -> int:
+    with open(CONFIG_YAML_PATH, "r") as file:
+        get_config = yaml.safe_load(file)
+    settings = get_config.get("LOAD_TEST") or {}
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--env", default=get_config["ENVIRONMENT"])
+    parser.add_argument("--pipeline", action="store_true")
+    parser.add_argument("--url", help="Base URL, instead of the URL of the environment")
+    parser.add_argument("--flow", action="append", choices=FLOWS)
+    parser.add_argument("--users", type=int, default=settings.get("USERS", 10))
+    parser.add_argument("--processes", type=int, default=settings.get("PROCESSES", 1))
+    parser.add_argument(
+        "--ramp-up", type=float, default=settings.get("RAMP_UP", 10), help="Seconds"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=settings.get("DURATION", 60), help="Seconds"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=0, help="Iterations per user (0: duration)"
+    )
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--slo", action="append", default=None)
+    parser.add_argument("--histograms", action="store_true")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    if args.url:
+        variables = {"URL": args.url}
+    else:
+        variables = dict(EnvironmentConfig.load(args.env, args.pipeline).variables)
+    slos = [Slo.parse(text) for text in (args.slo or settings.get("SLO") or [])]
+    processes = max(1, min(args.processes, args.users))
+
+    plan = LoadPlan(
+        flows=[FLOWS[name] for name in (args.flow or FLOWS)],
+        env_name=args.env,
+        variables=variables,
+        users=args.users,
+        processes=processes,
+        ramp_up=args.ramp_up,
+        duration=args.duration,
+        iterations=args.iterations,
+        browser=args.browser,
+        context_options=get_config["WEB_CONFIG"],
+        start_at=time.time() + 1,
+    )
+    print(
+        f"Running {args.users} virtual users in {processes} process(es), "
+        f"ramp-up {args.ramp_up:g} s, flows {[flow.__name__ for flow in plan.flows]}"
+    )
+
+    stats = LoadStats()
+    if processes == 1:
+        stats.merge(run_process(0, plan))
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            for result in executor.map(
+                run_process, range(processes), [plan] * processes
+            ):
+                stats.merge(result)
+
+    print_report(stats, args.histograms)
+
+    breached = [slo for slo in slos if slo.breached(stats)]
+    for slo in slos:
+        print(
+            f"SLO {slo}: {'BREACHED' if slo in breached else 'ok'} ({slo.measure(stats)})"
+        )
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(
+                {
+                    "iterations": stats.iterations,
+                    "duration": stats.duration,
+                    "throughput": stats.throughput,
+                    "error_rate": stats.error_rate,
+                    "errors": stats.errors,
+                    "steps": {
+                        name: {
+                            "count": h.count,
+                            "mean": h.mean,
+                            "p50": h.percentile(50),
+                            "p95": h.percentile(95),
+                            "p99": h.percentile(99),
+                            "max": h.max,
+                        }
+                        for name, h in {**stats.steps, **stats.flows}.items()
+                    },
+                    "slo": {str(slo): slo not in breached for slo in slos},
+                    "plan": {
+                        key: value
+                        for key, value in asdict(plan).items()
+                        if key not in ("flows", "variables")
+                    },
+                },
+                file,
+                indent=2,
+            )
+    return 1 if breached else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Merge Reports
+
+Combines the result streams (and any Allure results and JUnit files)
+written by the shards of a run (`pytest --shard i/N` writes to `<SHARDING.FOLDER>/shard-<i>/`) into a single
+report, streaming the files so memory does not grow with the size of the suite, and
+adds the test durations measured by the shards to SHARDING.DURATIONS_FILE. The merged
+stream (`<output>/results.jsonl`) is rendered with `render_reports.py`.
+
+Usage:
+    python merge_reports.py
+    python merge_reports.py && python render_reports.py --junit test-results.xml
+    python merge_reports.py --shards-dir reports/shards --output reports --junit test-results.xml
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import yaml
+
+from plugins.shard import DURATIONS_RUN_FILE
+from utils.report_merge import merge_allure, merge_junit, merge_streams
+from utils.shard_planner import DurationHistory
+
+CONFIG_YAML_PATH = "./config.yaml"
+
+
+def main() -> int:
+    with open(CONFIG_YAML_PATH, "r") as file:
+        get_config = yaml.safe_load(file)
+    settings = get_config.get("SHARDING") or {}
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--shards-dir", default=settings.get("FOLDER", "./reports/shards")
+    )
+    parser.add_argument("--output", default="./reports")
+    parser.add_argument(
+        "--junit", help="Merged JUnit file. Defaults to <output>/junit.xml"
+    )
+    args = parser.parse_args()
+
+    shards = sorted(
+        Path(args.shards_dir).glob("shard-*"),
+        key=lambda path: int(path.name.split("-")[-1]),
+    )
+    if not shards:
+        print(f"No shard reports found in {args.shards_dir}")
+        return 1
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    streams = [path for shard in shards for path in shard.glob("*.jsonl")]
+    if streams:
+        results_file = Path(
+            (get_config.get("RESULTS") or {}).get("FILE", "./reports/results.jsonl")
+        ).name
+        count = merge_streams(streams, output / results_file)
+        print(f"Results: {count} tests from {len(streams)} shards")
+
+    allure_dirs = [path for shard in shards for path in shard.glob("allure-results")]
+    if allure_dirs:
+        count = merge_allure(allure_dirs, output / "allure-results")
+        print(f"Allure: {count} files from {len(allure_dirs)} shards")
+
+    junit_files = [path for shard in shards for path in shard.glob("*.xml")]
+    if junit_files:
+        target = Path(args.junit) if args.junit else output / "junit.xml"
+        count = merge_junit(junit_files, target)
+        print(f"JUnit: {count} suites from {len(junit_files)} shards -> {target}")
+
+    # Durações dos shards entram no histórico usado para dividir as próximas execuções
+    history = DurationHistory(
+        settings.get("DURATIONS_FILE", "./.test_history/durations.json")
+    )
+    for path in (shard / DURATIONS_RUN_FILE for shard in shards):
+        if path.exists():
+            history.merge_run(path)
+    history.save()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
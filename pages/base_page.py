@@ -2,16 +2,28 @@ import allure
 from playwright.sync_api import Page, expect
 
 from utils.decorators import capture_on_failure
+from utils.impact_selector import track_class_dependency
+from utils.page_conditions import default_timeout, wait_for_conditions
+from utils.perf_metrics import record_navigation
 
 
 class BasePage:
-    def __init__(self, page: Page):
+    # Multiplicador do TIMEOUT do config.yaml nas asserções da página (PAGE_TIMEOUTS sobrescreve)
+    timeout_factor = 1
+
+    def __init__(self, page: Page, env_config=None):
         self.page = page
+        self.env_config = env_config
+        track_class_dependency(type(self))
 
     @capture_on_failure
     @allure.step("Navigate to Page")
-    def navigate_to(self, url: str):
+    def navigate_to(self, url: str, reuse: bool = False):
+        # reuse: mantém a página já aberta na url (páginas compartilhadas por context_scope)
+        if reuse and self.page.url == url:
+            return
         self.page.goto(url)
+        record_navigation(self)
 
     @capture_on_failure
     @allure.step("Get Element")
@@ -45,10 +57,32 @@ class BasePage:
 
     @capture_on_failure
     @allure.step("Wait For Element")
-    def wait_for_element(self, selector: str, timeout: int = 5000):
-        self.page.wait_for_selector(selector, timeout=timeout)
+    def wait_for_element(self, selector: str, timeout: int = None):
+        self.page.wait_for_selector(selector, timeout=timeout or self.default_timeout)
+
+    @property
+    def default_timeout(self) -> int:
+        return default_timeout(type(self))
+
+    @capture_on_failure
+    @allure.step("Assert Page State")
+    def assert_state(self, *conditions, timeout: int = None):
+        # Todas as condições (visible, hidden, has_text, count, url_matches) avaliadas juntas no navegador;
+        # retorna o tempo (ms) que cada uma levou para ficar verdadeira
+        return wait_for_conditions(
+            self.page, conditions, timeout or self.default_timeout
+        )
 
     @capture_on_failure
     @allure.step("Validate page title")
     def check_if_page_has_title(self, title):
         expect(self.page).to_have_title(title)
+
+    @capture_on_failure
+    @allure.step("Visual Checkpoint")
+    def check_visual(self, name: str = None, ignore=()):
+        # Comparado com o baseline no fim da sessão; ignore: seletores ou (x, y, largura, altura).
+        # Sem name, o checkpoint recebe o node id do teste e a sua posição no teste
+        from utils.visual_compare import check_visual
+
+        check_visual(self, name, ignore)
@@ -7,15 +7,15 @@ from .base_page import BasePage
 
 
 class HomePage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    def __init__(self, page: Page, env_config=None):
+        super().__init__(page, env_config)
         self.page = page
-        self.url = get_base_url()
+        self.url = get_base_url(env_config)
         self.page_title = "DEMOQA"
 
     @allure.step("Open Home Page")
-    def navigate(self):
-        self.navigate_to(self.url)
+    def navigate(self, reuse: bool = False):
+        self.navigate_to(self.url, reuse)
 
     @allure.step("Validate Home Page Title")
     def has_title(self):
@@ -1,12 +1,14 @@
 import allure
 from playwright.sync_api import Page
 
+from utils.page_conditions import has_text, url_matches
+
 from .base_page import BasePage
 
 
 class LoginPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    def __init__(self, page: Page, env_config=None):
+        super().__init__(page, env_config)
         self.page = page
         self.url = "https://demoqa.com/login"
         self.page_title = "DEMOQA"
@@ -15,6 +17,13 @@ class LoginPage(BasePage):
     def navigate(self):
         self.navigate_to(self.url)
 
+    @allure.step("Validate Logged User")
+    def has_logged_user(self, username: str):
+        self.assert_state(
+            url_matches("/login"),
+            has_text("#userName-value", username),
+        )
+
     @allure.step("Validate Login Page Title")
     def has_title(self):
         self.check_if_page_has_title(self.page_title)
@@ -0,0 +1,20 @@
+"""
+Pytest plugins of the project, registered by the root conftest.py through `pytest_plugins`.
+
+Each plugin only imports its heavy dependencies (mysql.connector, Playwright, the
+database and page modules) inside the fixtures that need them, so collection-only runs
+and suites that do not use the browser or the database start faster.
+
+Plugins:
+    environment: Options, config.yaml loading and the environment fixtures.
+    browser: Playwright, browser, contexts, mobile devices and page fixtures.
+    database: Database connection fixtures.
+    pages: Page object fixtures (web_*, mobile_* and device_*), one set per page class.
+    impact: Change-impact test selection.
+    flaky: Flakiness history, retries of known-flaky tests and the quarantine lane.
+    perf: Web performance metrics of the page navigations compared to a baseline.
+    api: Pooled HTTP client of the application API, to prepare state without the UI.
+    visual: Visual checkpoints compared with the baselines at the end of the session.
+    shard: Duration-balanced split of the tests across CI nodes (--shard i/N).
+    results: Result stream (JSONL) from which render_reports.py builds the reports.
+"""
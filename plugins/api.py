@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING, Generator
+
+import pytest
+
+if TYPE_CHECKING:
+    from api.account import AccountApi
+    from utils.ApiClient import ApiClient
+
+
+@pytest.fixture(scope="session")
+def api_client(get_config, env_config) -> Generator["ApiClient", None, None]:
+    """Cliente HTTP do worker: conexões keep-alive reaproveitadas por todos os testes"""
+    from utils.ApiClient import ApiClient
+    from utils.url_helper import get_base_url
+
+    client = ApiClient.from_config(get_base_url(env_config), get_config)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="function")
+def account_api(api_client) -> Generator["AccountApi", None, None]:
+    """Account API do demoqa; os cookies de login não passam de um teste para outro"""
+    from api.account import AccountApi
+
+    yield AccountApi(api_client)
+    api_client.clear_cookies()
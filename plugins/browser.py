@@ -0,0 +1,548 @@
+import importlib
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Generator, List, Tuple
+
+import pytest
+
+from utils.logger import log_allure
+
+from .environment import CONFIG_YAML_PATH, project_config, to_bool
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, BrowserType, Page
+
+    from utils.device_registry import DeviceContextPool, DeviceRegistry
+
+
+def selected_devices(config) -> List[str]:
+    """Dispositivos mobile selecionados pelo terminal (--devices) ou pelo config.yaml"""
+    devices_option = config.getoption("--devices", default=None)
+    if devices_option:
+        return [name.strip() for name in devices_option.split(",") if name.strip()]
+    return project_config(config)["MOBILE_DEVICES"]
+
+
+def selected_browser(config) -> str:
+    """Navegador selecionado pelo terminal (--browser); chromium quando não informado"""
+    browser_option = config.getoption("--browser", default=None)
+    if not browser_option:
+        return "chromium"
+    # O pytest-playwright aceita --browser várias vezes: usa o primeiro
+    if isinstance(browser_option, list):
+        return browser_option[0].lower()
+    return str(browser_option).lower()
+
+
+CONTEXT_SCOPES = ("function", "class", "module")
+# Relatórios de setup/call/teardown do teste, usados para saber se ele falhou
+phase_report_key = pytest.StashKey[Dict[str, pytest.TestReport]]()
+
+
+def context_scope(request, get_config) -> Tuple[str, bool]:
+    """
+    Escopo do contexto/página do teste: marker context_scope ou CONTEXT_SCOPE do config.yaml.
+    Retorna (escopo, reset), onde reset limpa o estado entre testes que compartilham a página.
+    """
+    marker = request.node.get_closest_marker("context_scope")
+    scope = (
+        marker.args[0] if marker and marker.args else get_config.get("CONTEXT_SCOPE")
+    )
+    scope = scope or "function"
+    if scope not in CONTEXT_SCOPES:
+        raise ValueError(
+            f"context_scope '{scope}' não é suportado. Opções válidas: {CONTEXT_SCOPES}"
+        )
+    reset = marker.kwargs.get("reset", True) if marker else True
+    return scope, reset
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--persistent-profile",
+        action="store",
+        help="Reuse a per-worker browser profile with warm HTTP cache: true, false",
+    )
+    parser.addoption(
+        "--devices",
+        action="store",
+        help="Comma separated Playwright device names, e.g. 'Pixel 5,iPhone 13'",
+    )
+    parser.addoption(
+        "--network-mode",
+        action="store",
+        choices=("off", "record", "replay", "auto"),
+        help="Record/replay the backend API responses of each test (NETWORK_RECORDINGS)",
+    )
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        help="Browser launch profile of LAUNCH_PROFILES, e.g. ci-fast, debug",
+    )
+    parser.addoption(
+        "--network-stale",
+        action="store_true",
+        help="Run only the tests with stale or expired recordings and record them again",
+    )
+
+
+def network_settings(config) -> Dict:
+    return project_config(config).get("NETWORK_RECORDINGS") or {}
+
+
+def network_mode(config) -> str:
+    """Modo de gravação da rede: --network-mode ou NETWORK_RECORDINGS.MODE do config.yaml"""
+    if config.getoption("--network-stale"):
+        return "record"
+    return (
+        config.getoption("--network-mode")
+        or network_settings(config).get("MODE")
+        or "off"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Com --network-stale, mantém só os testes cujas gravações precisam ser refeitas"""
+    if not config.getoption("--network-stale"):
+        return
+
+    from utils.network_recorder import stale_recordings
+
+    settings = network_settings(config)
+    stale = set(
+        stale_recordings(
+            settings.get("FOLDER", "resources/recordings"),
+            settings.get("MAX_AGE_DAYS", 30),
+        )
+    )
+    selected = [item for item in items if item.nodeid in stale]
+    deselected = [item for item in items if item.nodeid not in stale]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    item.stash.setdefault(phase_report_key, {})[report.when] = report
+    if report.when == "teardown":
+        # Testes executados neste processo, para a taxa de falhas do perfil de lançamento
+        item.config.tests_run = getattr(item.config, "tests_run", 0) + 1
+
+
+def pytest_configure(config):
+    config.launch_started = time.time()
+
+
+def launch_stats_file(config) -> Path:
+    """Histórico de lançamentos dos perfis (LAUNCH_PROFILE.STATS_FILE)"""
+    return Path(
+        (project_config(config).get("LAUNCH_PROFILE") or {}).get(
+            "STATS_FILE", ".test_history/launch_profiles.jsonl"
+        )
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Resumo dos perfis de lançamento quando esta execução lançou navegadores"""
+    stats_file = launch_stats_file(config)
+    if not stats_file.exists() or stats_file.stat().st_mtime < config.launch_started:
+        return
+
+    from utils.launch_profiles import summarize
+
+    terminalreporter.section("browser launch profiles")
+    for key, stats in summarize(stats_file).items():
+        memory = f"{stats['rss_mb']} MB" if stats["rss_mb"] is not None else "n/a"
+        failure_rate = stats["failure_rate"]
+        terminalreporter.line(
+            f"{key}: launch {stats['launch_ms']} ms, memory {memory} "
+            f"(end {stats['end_rss_mb']} MB), {stats['launches']} launches, "
+            f"failure rate {'n/a' if failure_rate is None else f'{failure_rate:.1%}'}"
+        )
+
+
+@contextmanager
+def measured_launch(request, launch_profile, browser_type, is_headless):
+    """
+    Opções do perfil de lançamento e medição do lançamento; o tempo e a memória são
+    gravados no histórico dos perfis quando o navegador é fechado
+    """
+    from utils.launch_profiles import LaunchMeter, launch_options, record_launch
+
+    name, profile = launch_profile
+    headless = to_bool(is_headless)
+    meter = LaunchMeter(name, browser_type.name, headless)
+    yield meter, launch_options(profile, headless, browser_type.name)
+
+    session = request.session
+    entry = meter.entry(getattr(request.config, "tests_run", 0), session.testsfailed)
+    log_allure(str(entry), "Browser launch")
+    record_launch(launch_stats_file(request.config), entry)
+
+
+@contextmanager
+def page_diagnostics(request, page: "Page"):
+    """
+    Coleta console, erros e respostas da página durante o teste (ring buffer limitado)
+    e salva os eventos + DOM comprimido se o teste falhar (DIAGNOSTICS no config.yaml)
+    """
+    settings = request.getfixturevalue("get_config").get("DIAGNOSTICS") or {}
+    if not settings.get("ENABLED", True):
+        yield
+        return
+
+    from utils.page_diagnostics import PageDiagnostics
+
+    diagnostics = PageDiagnostics.attach(
+        page,
+        max_console=settings.get("MAX_CONSOLE", 200),
+        max_errors=settings.get("MAX_ERRORS", 50),
+        max_responses=settings.get("MAX_RESPONSES", 100),
+    )
+    diagnostics.reset()
+    yield
+
+    reports = request.node.stash.get(phase_report_key, {})
+    if any(report.failed for report in reports.values()):
+        diagnostics.dump(
+            settings.get("FOLDER", "reports/diagnostics"), request.node.nodeid
+        )
+
+
+@contextmanager
+def network_recording(request, page: "Page"):
+    """Grava ou reproduz as respostas da API vistas pela página durante o teste"""
+    mode = network_mode(request.config)
+    if mode == "off":
+        yield
+        return
+
+    from utils.network_recorder import NetworkRecorder, recording_path
+
+    settings = network_settings(request.config)
+    nodeid = request.node.nodeid
+    recorder = NetworkRecorder(
+        page,
+        recording_path(settings.get("FOLDER", "resources/recordings"), nodeid),
+        nodeid,
+        mode,
+        url_pattern=settings.get("URL_PATTERN", "**/*"),
+        resource_types=settings.get("RESOURCE_TYPES", ["xhr", "fetch"]),
+        max_age_days=settings.get("MAX_AGE_DAYS", 30),
+    ).start()
+    try:
+        yield
+    finally:
+        recorder.stop()
+
+
+def pytest_generate_tests(metafunc):
+    """Parametriza os testes que usam device_page com cada dispositivo selecionado"""
+    if "device_name" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "device_name", selected_devices(metafunc.config), scope="session"
+        )
+
+
+@pytest.fixture(scope="session")
+def playwright_instance():
+    """Fixture para gerenciar a instância do Playwright"""
+    from playwright.sync_api import sync_playwright
+
+    playwright = sync_playwright().start()
+    yield playwright
+    playwright.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_type(request, playwright_instance) -> "BrowserType":
+    """Fixture para selecionar o tipo de navegador"""
+    browser_name = selected_browser(request.config)
+
+    # Mapeamento dos navegadores suportados
+    browser_map = {
+        "chromium": playwright_instance.chromium,
+        "firefox": playwright_instance.firefox,
+        "webkit": playwright_instance.webkit,
+    }
+
+    # Verifica se o navegador solicitado é suportado
+    if browser_name not in browser_map:
+        raise ValueError(
+            f"Navegador '{browser_name}' não é suportado. "
+            f"Opções válidas: {list(browser_map.keys())}"
+        )
+
+    return browser_map[browser_name]
+
+
+@pytest.fixture(scope="session")
+def launch_profile(request, get_config, is_pipeline) -> Tuple[str, Dict]:
+    """Perfil de lançamento do navegador: --launch-profile ou o do ambiente (LAUNCH_PROFILE)"""
+    from utils.launch_profiles import get_profile
+
+    profile_option = request.config.getoption("--launch-profile", default=None)
+    if profile_option:
+        log_allure(
+            f"Select launch profile by terminal: LAUNCH_PROFILE {profile_option}"
+        )
+        name = profile_option
+    else:
+        environment = "PIPELINE" if to_bool(is_pipeline) else "LOCAL"
+        name = (get_config.get("LAUNCH_PROFILE") or {}).get(environment, "default")
+        log_allure(
+            f"Select launch profile by config file -> {CONFIG_YAML_PATH}: LAUNCH_PROFILE {environment} {name}"
+        )
+    return name, get_profile(get_config.get("LAUNCH_PROFILES"), name)
+
+
+@pytest.fixture(scope="session")
+def browser(
+    request, browser_type, is_headless, launch_profile
+) -> Generator["Browser", None, None]:
+    """Fixture principal do Playwright com suporte a headless mode"""
+    with measured_launch(request, launch_profile, browser_type, is_headless) as (
+        meter,
+        options,
+    ):
+        browser = meter.measure(browser_type.launch, **options)
+        yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def persistent_context(
+    request, browser_type, is_headless, launch_profile, get_config
+) -> Generator["BrowserContext", None, None]:
+    """
+    Contexto persistente por worker: mantém o cache HTTP em disco entre execuções
+    e remove cookies/storage antes de iniciar.
+    """
+    from utils.browser_profile import PersistentProfile
+
+    profile = PersistentProfile(get_config["PROFILES_FOLDER"], browser_type.name)
+    with measured_launch(request, launch_profile, browser_type, is_headless) as (
+        meter,
+        options,
+    ):
+        context = meter.measure(
+            browser_type.launch_persistent_context,
+            profile.prepare(),
+            **options,
+            **get_config["WEB_CONFIG"],
+        )
+        yield context
+    context.close()
+    profile.release()
+
+
+@pytest.fixture(scope="session")
+def use_persistent_profile(request, get_config) -> bool:
+
+    profile_option = request.config.getoption("--persistent-profile", default=None)
+    if profile_option:
+        log_allure(
+            f"Select persistent profile by terminal: PERSISTENT_PROFILE {profile_option.upper()}"
+        )
+        return to_bool(profile_option)
+
+    log_allure(
+        f'Select persistent profile by config file -> {CONFIG_YAML_PATH}: PERSISTENT_PROFILE {get_config["PERSISTENT_PROFILE"]}'
+    )
+    return to_bool(get_config["PERSISTENT_PROFILE"])
+
+
+@pytest.fixture(scope="function")
+def web_page(
+    request, get_config, use_persistent_profile, browser_type
+) -> Generator["Page", None, None]:
+    """Creates a new page with web configuration"""
+    web_config = get_config["WEB_CONFIG"]
+    timeout = web_config.get("TIMEOUT")
+
+    scope, reset = context_scope(request, get_config)
+    if scope != "function":
+        # Página compartilhada pelos testes da classe/módulo
+        page = request.getfixturevalue(f"{scope}_web_page")
+        with page_diagnostics(request, page), network_recording(request, page):
+            yield page
+        if reset:
+            _reset_shared_page(page, browser_type.name)
+        return
+
+    if use_persistent_profile:
+        # Reutiliza o contexto persistente do worker e limpa o estado ao final
+        context = request.getfixturevalue("persistent_context")
+        yield from _pooled_page(context, timeout, browser_type.name, request)
+        return
+
+    # Cria o contexto com todas as configurações do WEB_CONFIG
+    browser = request.getfixturevalue("browser")
+    context = browser.new_context(**web_config)
+    page = context.new_page()
+    page.set_default_timeout(timeout)
+    with page_diagnostics(request, page), network_recording(request, page):
+        yield page
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def device_registry(
+    request, playwright_instance, browser_type, get_config
+) -> "DeviceRegistry":
+    """Valida e congela os perfis dos dispositivos mobile uma única vez por sessão"""
+    from utils.device_registry import DeviceRegistry
+
+    registry = DeviceRegistry(
+        playwright_instance.devices,
+        overrides=get_config["MOBILE_CONFIG"],
+        browser_name=browser_type.name,
+    )
+    return registry.select(selected_devices(request.config))
+
+
+@pytest.fixture(scope="session")
+def device_context_pool(browser) -> Generator["DeviceContextPool", None, None]:
+    """Mantém um contexto por dispositivo, reutilizado pelos testes do worker"""
+    from utils.device_registry import DeviceContextPool
+
+    pool = DeviceContextPool(browser)
+    yield pool
+    pool.close_all()
+
+
+def _shared_page(
+    request, context_options: Dict, timeout
+) -> Generator["Page", None, None]:
+    """
+    Página da classe/módulo em um contexto próprio, fechado no fim do escopo: o contexto
+    persistente e o pool de dispositivos são limpos pelos testes de escopo function
+    """
+    context = request.getfixturevalue("browser").new_context(**context_options)
+    page = context.new_page()
+    page.set_default_timeout(timeout)
+    yield page
+    context.close()
+
+
+def _shared_web_page(request, get_config) -> Generator["Page", None, None]:
+    web_config = get_config["WEB_CONFIG"]
+    yield from _shared_page(request, web_config, web_config.get("TIMEOUT"))
+
+
+def _shared_mobile_page(request, get_config) -> Generator["Page", None, None]:
+    registry = request.getfixturevalue("device_registry")
+    yield from _shared_page(
+        request, registry.default.context_options(), get_config["TIMEOUT"]
+    )
+
+
+@pytest.fixture(scope="class")
+def class_web_page(request, get_config) -> Generator["Page", None, None]:
+    """Página web compartilhada pelos testes de uma classe (context_scope("class"))"""
+    yield from _shared_web_page(request, get_config)
+
+
+@pytest.fixture(scope="module")
+def module_web_page(request, get_config) -> Generator["Page", None, None]:
+    """Página web compartilhada pelos testes de um módulo (context_scope("module"))"""
+    yield from _shared_web_page(request, get_config)
+
+
+@pytest.fixture(scope="class")
+def class_mobile_page(request, get_config) -> Generator["Page", None, None]:
+    """Página mobile compartilhada pelos testes de uma classe (context_scope("class"))"""
+    yield from _shared_mobile_page(request, get_config)
+
+
+@pytest.fixture(scope="module")
+def module_mobile_page(request, get_config) -> Generator["Page", None, None]:
+    """Página mobile compartilhada pelos testes de um módulo (context_scope("module"))"""
+    yield from _shared_mobile_page(request, get_config)
+
+
+def _reset_shared_page(page: "Page", browser_name: str) -> None:
+    """Fecha as páginas abertas pelo teste (popups) e limpa cookies/storage do contexto"""
+    from utils.browser_profile import reset_context_state
+
+    for other in page.context.pages:
+        if other is not page:
+            other.close()
+    reset_context_state(page.context, browser_name)
+
+
+def _pooled_page(
+    context: "BrowserContext", timeout, browser_name: str, request=None
+) -> Generator["Page", None, None]:
+    """Nova página em um contexto reaproveitado; com request, coleta diagnósticos do teste"""
+    from utils.browser_profile import reset_context_state
+
+    page = context.new_page()
+    page.set_default_timeout(timeout)
+    if request:
+        with page_diagnostics(request, page), network_recording(request, page):
+            yield page
+    else:
+        yield page
+    reset_context_state(context, browser_name)
+    page.close()
+
+
+@pytest.fixture(scope="function")
+def mobile_page(
+    request, device_registry, device_context_pool, get_config, browser_type
+) -> Generator["Page", None, None]:
+    """Creates a new page on the default mobile device"""
+    scope, reset = context_scope(request, get_config)
+    if scope != "function":
+        page = request.getfixturevalue(f"{scope}_mobile_page")
+        with page_diagnostics(request, page), network_recording(request, page):
+            yield page
+        if reset:
+            _reset_shared_page(page, browser_type.name)
+        return
+
+    context = device_context_pool.acquire(device_registry.default)
+    yield from _pooled_page(context, get_config["TIMEOUT"], browser_type.name, request)
+
+
+@pytest.fixture(scope="function")
+def device_page(
+    request, device_name, device_registry, device_context_pool, get_config, browser_type
+) -> Generator["Page", None, None]:
+    """Creates a new page for each selected mobile device (parametrized test)"""
+    context = device_context_pool.acquire(device_registry.get(device_name))
+    yield from _pooled_page(context, get_config["TIMEOUT"], browser_type.name, request)
+
+
+def create_page_fixture(page_class):
+    """
+    Função auxiliar para criar fixtures de pages. Com o caminho da classe
+    ("pages.home_page:HomePage"), o page object (e o playwright) só é importado quando
+    um teste usa a fixture
+    """
+
+    def build(page, env_config):
+        cls = page_class
+        if isinstance(cls, str):
+            module, name = cls.split(":")
+            cls = getattr(importlib.import_module(module), name)
+        return cls(page, env_config)
+
+    @pytest.fixture
+    def web_fixture(web_page, env_config):
+        return build(web_page, env_config)
+
+    @pytest.fixture
+    def mobile_fixture(mobile_page, env_config):
+        return build(mobile_page, env_config)
+
+    @pytest.fixture
+    def device_fixture(device_page, env_config):
+        return build(device_page, env_config)
+
+    return web_fixture, mobile_fixture, device_fixture
@@ -0,0 +1,159 @@
+import os
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--db-restore",
+        action="store_true",
+        help="Restore the database snapshot (python init_db.py --snapshot) before each test module",
+    )
+    parser.addoption(
+        "--db-per-worker",
+        action="store_true",
+        help="Give each xdist worker its own database schema cloned from DB_NAME",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--db-per-worker", default=False):
+        from utils.worker_schema import PER_WORKER_ENV
+
+        # Lido pelos gerenciadores de banco deste processo (cada worker repete o configure)
+        os.environ[PER_WORKER_ENV] = "true"
+
+
+@pytest.fixture(scope="session")
+def worker_database(get_config, env, env_config):
+    """
+    Creates the database schema of the xdist worker (DB_PER_WORKER) and drops it at the
+    end of the session. Yields the schema name, or None when the shared schema is used.
+    """
+    from utils.worker_schema import is_per_worker_enabled, worker_id
+
+    if not is_per_worker_enabled(get_config) or not worker_id():
+        yield None
+        return
+
+    from utils.Common import Common
+    from utils.DatabaseManager import DatabaseManager
+    from utils.logger import log_allure
+    from utils.worker_schema import WorkerSchema, worker_schema_name
+
+    admin = DatabaseManager(
+        Common(env, get_config, env_config).get_db_config(),
+        get_config,
+        route_to_worker=False,
+    )
+    admin.connect()
+    schema = WorkerSchema(
+        admin.connection, admin.DB_NAME, worker_schema_name(admin.DB_NAME), log_allure
+    )
+    schema.create()
+    try:
+        yield schema.name
+    finally:
+        schema.drop()
+        admin.close_connection()
+
+
+@pytest.fixture(scope="module")
+def db_manager(request, get_config, env, env_config, worker_database):
+    """Fixture that provides a database connection for tests."""
+    from utils.Common import Common
+    from utils.DatabaseManager import DatabaseManager
+    from utils.retry import DatabaseUnavailableError
+
+    common = Common(env, get_config, env_config)
+    db = None
+
+    try:
+        db = common.get_db_manager()
+        if not db or not db.connection.is_connected():
+            pytest.skip("Database connection could not be established")
+
+        if request.config.getoption("--db-restore"):
+            db.restore_snapshot()
+
+        yield db
+
+    except DatabaseUnavailableError as e:
+        # Outro worker já detectou o banco fora do ar: pula sem esperar o timeout
+        pytest.skip(str(e))
+
+    except Exception as e:
+        pytest.fail(f"Database setup failed: {str(e)}")
+
+    finally:
+        if db and isinstance(db, DatabaseManager):
+            try:
+                db.close_connection()
+            except Exception as e:
+                print(f"Warning: Error closing connection: {e}")
+
+
+@pytest.fixture(scope="session")
+def user_factory(get_config, env, env_config, worker_database):
+    """
+    Session factory of unique users, inserted in blocks of USER_FACTORY_BLOCK_SIZE and
+    deleted at the end of the session (see `database/factories.py`).
+    """
+    from database.factories import UserFactory
+    from database.users import UserDatabaseHandler
+    from utils.Common import Common
+    from utils.retry import DatabaseUnavailableError
+
+    try:
+        db = Common(env, get_config, env_config).get_db_manager()
+    except DatabaseUnavailableError as e:
+        # Outro worker já detectou o banco fora do ar: pula sem esperar o timeout
+        pytest.skip(str(e))
+    if not db.connection or not db.connection.is_connected():
+        pytest.skip("Database connection could not be established")
+
+    factory = UserFactory(
+        UserDatabaseHandler(env, db),
+        block_size=get_config.get("USER_FACTORY_BLOCK_SIZE", 50),
+    )
+    try:
+        yield factory
+    finally:
+        try:
+            factory.cleanup()
+        finally:
+            db.close_connection()
+
+
+@pytest.fixture(scope="module")
+def async_db(get_config, env, env_config, worker_database):
+    """
+    Fixture that provides an async database manager running on a background event loop,
+    so database checks can be submitted and run concurrently with the browser actions.
+    """
+    from utils.AsyncDatabaseManager import BackgroundDatabaseRunner
+    from utils.Common import Common
+    from utils.retry import DatabaseUnavailableError
+
+    common = Common(env, get_config, env_config)
+    runner = None
+
+    try:
+        runner = BackgroundDatabaseRunner(common.get_async_db_manager())
+        runner.run(runner.manager.connect())
+
+        yield runner
+
+    except DatabaseUnavailableError as e:
+        # Outro worker já detectou o banco fora do ar: pula sem esperar o timeout
+        pytest.skip(str(e))
+
+    except Exception as e:
+        pytest.fail(f"Async database setup failed: {str(e)}")
+
+    finally:
+        if runner:
+            try:
+                runner.close()
+            except Exception as e:
+                print(f"Warning: Error closing connection pool: {e}")
@@ -0,0 +1,147 @@
+from typing import TYPE_CHECKING, Dict, List
+
+import pytest
+
+from utils.logger import log_allure
+from utils.url_helper import set_pytest_config
+
+if TYPE_CHECKING:
+    from utils.EnvironmentConfig import EnvironmentConfig
+
+CONFIG_YAML_PATH = "./config.yaml"
+
+
+def to_bool(value) -> bool:
+    """Converte valores 'true'/'false' vindos do terminal ou do config.yaml"""
+    return value.lower() == "true" if isinstance(value, str) else bool(value)
+
+
+def project_config(config) -> Dict:
+    """
+    Lê o config.yaml durante a coleta, fora de qualquer teste
+    (o log_allure da fixture get_config só pode ser usado dentro de um teste)
+    """
+    if not hasattr(config, "project_config"):
+        import yaml
+
+        with open(CONFIG_YAML_PATH, "r") as file:
+            config.project_config = yaml.safe_load(file)
+    return config.project_config
+
+
+def selected_environments(config) -> List[str]:
+    """Ambientes selecionados pelo terminal (--env rc,uat) ou pelo config.yaml"""
+    environments = (
+        config.getoption("--env", default=None) or project_config(config)["ENVIRONMENT"]
+    )
+    if isinstance(environments, list):
+        return environments
+    return [name.strip() for name in str(environments).split(",") if name.strip()]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--env",
+        action="store",
+        help="Execution environment: rc, uat. Comma separated runs all, e.g. rc,uat",
+    )
+    parser.addoption(
+        "--pipeline", action="store", help="Run tests in pipeline: true, false"
+    )
+    parser.addoption(
+        "--headless", action="store", help="Run tests in headless mode: true, false"
+    )
+
+
+def pytest_configure(config):
+    """Configure pytest"""
+    set_pytest_config(config)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametriza os testes com cada ambiente selecionado (quando há mais de um)"""
+    if "env" not in metafunc.fixturenames:
+        return
+
+    environments = selected_environments(metafunc.config)
+    if len(environments) > 1:
+        metafunc.parametrize(
+            "env",
+            environments,
+            indirect=True,
+            scope="session",
+            ids=[name.upper() for name in environments],
+        )
+
+
+@pytest.fixture(scope="session")
+def get_config() -> Dict:
+    """Retorna as configurações do arquivo config.yaml"""
+    from utils.ReadFile import ReadFile
+
+    read_file = ReadFile()
+    return read_file.load_yaml_file(CONFIG_YAML_PATH)
+
+
+@pytest.fixture(scope="session")
+def env(request, get_config):
+
+    if hasattr(request, "param"):
+        log_allure(
+            f"Select environment by multi-environment execution: ENVIRONMENT {request.param.upper()}"
+        )
+        return request.param
+
+    env_option = request.config.getoption("--env", default=None)
+    if env_option:
+        log_allure(f"Select environment by terminal: ENVIRONMENT {env_option.upper()}")
+        return env_option
+
+    log_allure(
+        f'Select environment by config file -> {CONFIG_YAML_PATH}: ENVIRONMENT {get_config["ENVIRONMENT"]}'
+    )
+    return get_config["ENVIRONMENT"]
+
+
+@pytest.fixture(scope="session")
+def is_pipeline(request, get_config):
+
+    pipeline_option = request.config.getoption("--pipeline", default=None)
+    if pipeline_option:
+        log_allure(
+            f"Select pipeline execution by terminal: PIPELINE {pipeline_option.upper()}"
+        )
+        return pipeline_option
+
+    log_allure(
+        f'Select pipeline execution by config file -> {CONFIG_YAML_PATH}: PIPELINE {get_config["PIPELINE"]}'
+    )
+    return get_config["PIPELINE"]
+
+
+@pytest.fixture(scope="session")
+def is_headless(request, get_config):
+
+    headless_option = request.config.getoption("--headless", default=None)
+    if headless_option:
+        log_allure(
+            f"Select headless execution by terminal: HEADLESS {headless_option.upper()}"
+        )
+        return headless_option
+
+    log_allure(
+        f'Select headless execution by config file -> {CONFIG_YAML_PATH}: HEADLESS {get_config["HEADLESS"]}'
+    )
+    return get_config["HEADLESS"]
+
+
+@pytest.fixture(scope="session")
+def env_config(env, is_pipeline, is_headless) -> "EnvironmentConfig":
+    """
+    Loads the environment variables of the selected environment.
+    The variables are kept in the returned object; os.environ is not changed, so
+    several environments can run in the same session.
+    """
+    from utils.EnvironmentConfig import EnvironmentConfig
+
+    return EnvironmentConfig.load(env, to_bool(is_pipeline), to_bool(is_headless))
@@ -0,0 +1,145 @@
+import pytest
+
+from utils.logger import log_info
+
+from .environment import project_config
+
+LANES = ("all", "critical", "quarantine")
+ATTEMPTS_PROPERTY = "flaky_attempts"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--lane",
+        action="store",
+        default="all",
+        choices=LANES,
+        help="all; critical (skips quarantined flaky tests); quarantine (only them)",
+    )
+    parser.addoption(
+        "--no-flaky-retry",
+        action="store_true",
+        help="Do not retry known-flaky tests",
+    )
+
+
+def pytest_configure(config):
+    from utils.flaky_history import FlakyHistory
+
+    config.flaky_history = FlakyHistory.from_config(project_config(config))
+    # O histórico é gravado só no processo principal (o xdist repassa os relatórios dos workers)
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            FlakyRecorder(config.flaky_history), "flaky_recorder"
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Separa os testes em quarentena (score alto) do caminho crítico"""
+    lane = config.getoption("--lane")
+    if lane == "all":
+        return
+
+    history = config.flaky_history
+    want_quarantined = lane == "quarantine"
+    selected, deselected = [], []
+    for item in items:
+        if history.is_quarantined(item.nodeid) == want_quarantined:
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Executa novamente, no mesmo processo, os testes conhecidos como instáveis.
+    Testes estáveis seguem o protocolo padrão do pytest (sem retry).
+    """
+    if item.config.getoption("--no-flaky-retry") or not isinstance(
+        item, pytest.Function
+    ):
+        return None
+    retries = item.config.flaky_history.retries_for(item.nodeid)
+    if not retries:
+        return None
+
+    from _pytest.runner import runtestprotocol
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    for attempt in range(1, retries + 2):
+        item.user_properties[:] = [
+            prop for prop in item.user_properties if prop[0] != ATTEMPTS_PROPERTY
+        ]
+        item.user_properties.append((ATTEMPTS_PROPERTY, attempt))
+        # Saída capturada só da tentativa final
+        item._report_sections.clear()
+
+        # Protocolo completo a cada tentativa: fixtures de função (contexto e página) são
+        # recriadas; as de classe/módulo só quando o próximo teste não as usa
+        reports = runtestprotocol(item, log=False, nextitem=nextitem)
+        if (
+            attempt > retries
+            or not any(report.failed for report in reports)
+            or item.session.shouldfail
+            or item.session.shouldstop
+        ):
+            break
+        log_info(f"Retrying flaky test {item.nodeid} (attempt {attempt + 1})")
+
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+class FlakyRecorder:
+    """Grava o resultado final de cada teste no histórico de instabilidade"""
+
+    def __init__(self, history):
+        self.history = history
+        self.failed = set()
+        self.skipped = set()
+        self.retried = {}
+
+    def pytest_runtest_logreport(self, report):
+        from utils.flaky_history import FAILED, FLAKY, PASSED
+
+        if report.failed:
+            self.failed.add(report.nodeid)
+        elif report.skipped:
+            self.skipped.add(report.nodeid)
+        if report.when == "call" and report.passed:
+            attempts = dict(report.user_properties).get(ATTEMPTS_PROPERTY, 1)
+            if attempts > 1:
+                self.retried[report.nodeid] = attempts
+        if report.when != "teardown":
+            return
+
+        if report.nodeid in self.failed:
+            self.history.record(report.nodeid, FAILED)
+        elif report.nodeid in self.retried:
+            self.history.record(report.nodeid, FLAKY)
+        elif report.nodeid not in self.skipped:
+            self.history.record(report.nodeid, PASSED)
+        self.failed.discard(report.nodeid)
+        self.skipped.discard(report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        flaky = self.history.flaky_tests()
+        if not flaky and not self.retried:
+            return
+
+        terminalreporter.section("flaky tests")
+        for nodeid, attempts in self.retried.items():
+            terminalreporter.line(f"passed after {attempts} attempts: {nodeid}")
+        for nodeid, score in flaky.items():
+            lane = "quarantine" if self.history.is_quarantined(nodeid) else "retry"
+            terminalreporter.line(f"{score:.2f} [{lane}] {nodeid}")
@@ -0,0 +1,71 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--impact-record",
+        action="store_true",
+        help="Record the test dependency graph used by --impact-since",
+    )
+    parser.addoption(
+        "--impact-since",
+        action="store",
+        help="Run only tests impacted by files changed since a git ref, e.g. origin/main",
+    )
+
+
+def _is_recording_impact(config) -> bool:
+    return bool(
+        config.getoption("--impact-record") or config.getoption("--impact-since")
+    )
+
+
+def pytest_configure(config):
+    config.impact_selector = None
+    if _is_recording_impact(config):
+        from utils.impact_selector import ImpactSelector
+
+        config.impact_selector = ImpactSelector(config.rootpath)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselects the tests not impacted by the changes since --impact-since"""
+    base_ref = config.getoption("--impact-since")
+    if not base_ref:
+        return
+
+    selector = config.impact_selector
+    changed = selector.changed_files(base_ref)
+    selected, deselected = selector.select(items, changed)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    if item.config.impact_selector:
+        item.config.impact_selector.start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    selector = item.config.impact_selector
+    if selector:
+        selector.collect_item_dependencies(item)
+    yield
+    if selector:
+        selector.stop_test(item)
+
+
+def pytest_sessionfinish(session):
+    """Stores the dependency graph recorded by this process and merges the workers graphs"""
+    config = session.config
+    if not config.impact_selector:
+        return
+
+    worker_input = getattr(config, "workerinput", None)
+    worker_id = worker_input["workerid"] if worker_input else "main"
+    config.impact_selector.save_partial(worker_id)
+    if not worker_input:
+        config.impact_selector.merge_partials()
@@ -0,0 +1,19 @@
+from .browser import create_page_fixture
+from .environment import project_config
+
+
+def pytest_configure(config):
+    """Timeout padrão das asserções de cada page object (TIMEOUT e PAGE_TIMEOUTS)"""
+    from utils.page_conditions import configure_timeouts
+
+    settings = project_config(config)
+    configure_timeouts(settings.get("TIMEOUT"), settings.get("PAGE_TIMEOUTS"))
+
+
+# Criar fixtures para cada page (classes importadas só quando a fixture é usada)
+web_home_page, mobile_home_page, device_home_page = create_page_fixture(
+    "pages.home_page:HomePage"
+)
+web_login_page, mobile_login_page, device_login_page = create_page_fixture(
+    "pages.login_page:LoginPage"
+)
@@ -0,0 +1,103 @@
+from .browser import selected_browser
+from .environment import project_config
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        help="Collect web performance metrics on every page object navigation",
+    )
+    parser.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        help="Store the performance metrics of this run as the new baseline",
+    )
+
+
+def _perf_settings(config) -> dict:
+    return project_config(config).get("PERF_METRICS") or {}
+
+
+def pytest_configure(config):
+    config.perf_collector = None
+    config.perf_regressions = []
+    enabled = (
+        config.getoption("--perf-metrics")
+        or config.getoption("--perf-update-baseline")
+        or _perf_settings(config).get("ENABLED", False)
+    )
+    if not enabled:
+        return
+
+    from utils.perf_metrics import PARTIAL_PREFIX, PerfCollector, set_active_collector
+
+    collector = PerfCollector.from_config(
+        project_config(config), browser_name=selected_browser(config)
+    )
+    if not hasattr(config, "workerinput"):
+        # Remove parciais de uma execução interrompida antes de os workers começarem
+        for path in collector.output_folder.glob(f"{PARTIAL_PREFIX}*.json"):
+            path.unlink()
+    config.perf_collector = collector
+    set_active_collector(collector)
+
+
+def pytest_unconfigure(config):
+    if getattr(config, "perf_collector", None):
+        from utils.perf_metrics import set_active_collector
+
+        set_active_collector(None)
+
+
+def pytest_sessionfinish(session):
+    """Merges the workers metrics and compares the run against the baseline"""
+    config = session.config
+    collector = config.perf_collector
+    if not collector:
+        return
+
+    worker_input = getattr(config, "workerinput", None)
+    collector.save_partial(worker_input["workerid"] if worker_input else "main")
+    if worker_input:
+        return
+
+    settings = _perf_settings(config)
+    baseline_path = settings.get("BASELINE", "./resources/perf/baseline.json")
+    summary = collector.merge_partials()
+    config.perf_summary = summary
+    if config.getoption("--perf-update-baseline"):
+        collector.save_baseline(baseline_path, summary)
+        return
+
+    config.perf_regressions = collector.compare(
+        summary, collector.load_baseline(baseline_path)
+    )
+    if (
+        config.perf_regressions
+        and settings.get("FAIL_ON_REGRESSION", False)
+        and session.exitstatus == 0
+    ):
+        session.exitstatus = 1
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = getattr(config, "perf_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.section("performance metrics")
+    terminalreporter.line(
+        f"{summary['navigations']} navigations on {len(summary['pages'])} pages, "
+        f"collector overhead {summary['collect_ms']} ms"
+    )
+    if config.getoption("--perf-update-baseline"):
+        terminalreporter.line("baseline updated")
+    for regression in config.perf_regressions:
+        change = regression["change"]
+        terminalreporter.line(
+            f"REGRESSION {regression['page']} {regression['metric']}: "
+            f"{regression['baseline']:.1f} -> {regression['current']:.1f}"
+            + (f" (+{change:.0%})" if change is not None else ""),
+            red=True,
+        )
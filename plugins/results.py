@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import pytest
+
+from .environment import project_config, selected_environments
+
+# Marcadores do próprio pytest, que não viram tags nos relatórios
+BUILTIN_MARKERS = {
+    "parametrize",
+    "skip",
+    "skipif",
+    "xfail",
+    "usefixtures",
+    "filterwarnings",
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--results-file",
+        action="store",
+        help="Result stream (JSONL) rendered by render_reports.py. Defaults to RESULTS.FILE",
+    )
+
+
+def _results_settings(config) -> dict:
+    return project_config(config).get("RESULTS") or {}
+
+
+def pytest_configure(config):
+    config.stream_collector = None
+    settings = _results_settings(config)
+    # Sem testes executados (--collect-only, --help) o stream da última execução é mantido
+    if (
+        not settings.get("ENABLED", True)
+        or config.option.collectonly
+        or config.option.help
+    ):
+        return
+
+    import allure_commons
+
+    from utils.result_stream import StreamCollector
+
+    path = Path(
+        config.getoption("--results-file")
+        or settings.get("FILE", "./reports/results.jsonl")
+    )
+    # Steps e anexos (allure.step, allure.attach) de cada processo que executa testes
+    collector = StreamCollector(path.parent)
+    allure_commons.plugin_manager.register(collector, "result_stream")
+    config.stream_collector = collector
+
+    # O stream é escrito só no processo principal, que recebe os relatórios dos workers
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ResultStreamReporter(path), "result_stream")
+
+
+def pytest_unconfigure(config):
+    collector = getattr(config, "stream_collector", None)
+    if collector:
+        import allure_commons
+
+        allure_commons.plugin_manager.unregister(collector)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    if item.config.stream_collector:
+        item.config.stream_collector.start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Anexa ao relatório de cada fase os steps e anexos do teste; os dados viajam com o
+    relatório dos workers do xdist até o processo principal
+    """
+    outcome = yield
+    collector = item.config.stream_collector
+    if not collector:
+        return
+
+    report = outcome.get_result()
+    data = collector.take()
+    if report.when == "setup":
+        data["title"] = getattr(
+            getattr(item, "function", None), "__allure_display_name__", None
+        )
+        data["markers"] = sorted(
+            {marker.name for marker in item.iter_markers()} - BUILTIN_MARKERS
+        )
+    elif report.when == "teardown":
+        collector.stop_test()
+    report.stream_data = data
+
+
+class ResultStreamReporter:
+    """Escreve o stream de resultados com os relatórios de todos os workers"""
+
+    def __init__(self, path):
+        from utils.result_stream import ResultStreamWriter
+
+        self.writer = ResultStreamWriter(path)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self, session):
+        import shutil
+
+        from pytest_metadata.plugin import metadata_key
+
+        from utils.result_stream import ATTACHMENTS_FOLDER
+
+        # Anexos de execuções anteriores saem antes de os workers do xdist começarem
+        shutil.rmtree(self.writer.path.parent / ATTACHMENTS_FOLDER, ignore_errors=True)
+
+        config = session.config
+        environment = {
+            str(key): value
+            for key, value in config.stash.get(metadata_key, {}).items()
+            if isinstance(value, (str, int, float))
+        }
+        environment["Environments"] = ",".join(selected_environments(config))
+        self.writer.session_start(environment, config.invocation_params.args)
+
+    def pytest_runtest_logreport(self, report):
+        self.writer.add_report(report)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.writer.session_finish(session.exitstatus)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep(
+            "-", f"result stream: {self.writer.path} (python render_reports.py)"
+        )
@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+
+from .environment import project_config
+
+DURATIONS_RUN_FILE = "durations.json"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shard",
+        action="store",
+        help="Run only the part i of N of the tests, balanced by duration, e.g. 2/4",
+    )
+
+
+def _shard_settings(config) -> dict:
+    return project_config(config).get("SHARDING") or {}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Lê o --shard e direciona os relatórios (stream de resultados, Allure, HTML e JUnit) para a pasta do shard,
+    antes de os plugins de relatório lerem as opções
+    """
+    from utils.shard_planner import DurationHistory, parse_shard
+
+    settings = _shard_settings(config)
+    config.shard = None
+    folder = None
+    shard_option = config.getoption("--shard")
+    if shard_option:
+        try:
+            config.shard = parse_shard(shard_option)
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+
+        folder = (
+            Path(settings.get("FOLDER", "reports/shards")) / f"shard-{config.shard[0]}"
+        )
+        # Stream de resultados do shard (o caminho padrão vem do config.yaml)
+        config.option.results_file = config.option.results_file or (
+            project_config(config).get("RESULTS") or {}
+        ).get("FILE")
+        for option in ("results_file", "allure_report_dir", "htmlpath", "xmlpath"):
+            path = getattr(config.option, option, None)
+            if path:
+                setattr(config.option, option, str(folder / Path(path).name))
+
+    config.duration_history = DurationHistory(
+        settings.get("DURATIONS_FILE", ".test_history/durations.json")
+    )
+    # As durações são gravadas só no processo principal (recebe os relatórios dos workers).
+    # Um shard não altera o histórico lido pelos outros nós: grava as durações na sua pasta
+    if not hasattr(config, "workerinput"):
+        run_file = folder / DURATIONS_RUN_FILE if config.shard else None
+        config.pluginmanager.register(
+            DurationRecorder(config.duration_history, run_file), "duration_recorder"
+        )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Mantém só os testes do shard (depois das outras seleções, iguais em todos os nós)"""
+    if not config.shard:
+        return
+
+    from utils.shard_planner import partition
+
+    index, total = config.shard
+    groups = partition(
+        [item.nodeid for item in items],
+        config.duration_history.durations,
+        total,
+        default=_shard_settings(config).get("DEFAULT_DURATION", 5),
+    )
+    selected_ids = set(groups[index - 1])
+    selected = [item for item in items if item.nodeid in selected_ids]
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_report_header(config):
+    if config.shard:
+        return f"shard: {config.shard[0]}/{config.shard[1]}"
+
+
+class DurationRecorder:
+    """Soma setup + call + teardown de cada teste e grava no histórico de durações"""
+
+    def __init__(self, history, run_file=None):
+        self.history = history
+        self.run_file = run_file
+
+    def pytest_runtest_logreport(self, report):
+        if not report.skipped:
+            self.history.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        if self.run_file:
+            self.history.save_run(self.run_file)
+        else:
+            self.history.save()
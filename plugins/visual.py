@@ -0,0 +1,92 @@
+import pytest
+
+from .environment import project_config
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--visual-update",
+        action="store_true",
+        help="Replace the visual baselines with the screenshots of this run",
+    )
+
+
+def pytest_configure(config):
+    config.visual_checker = None
+    config.visual_results = None
+    settings = project_config(config).get("VISUAL") or {}
+    # Sem testes executados (--collect-only) não há capturas nem parciais para limpar
+    if not settings.get("ENABLED", True) or config.option.collectonly:
+        return
+
+    from utils.visual_compare import (
+        PARTIAL_PREFIX,
+        VisualChecker,
+        set_active_checker,
+    )
+
+    checker = VisualChecker.from_config(
+        project_config(config), update=config.getoption("--visual-update")
+    )
+    if not hasattr(config, "workerinput"):
+        # Remove parciais de uma execução interrompida antes de os workers começarem
+        for path in checker.output_folder.glob(f"{PARTIAL_PREFIX}*.json"):
+            path.unlink()
+    config.visual_checker = checker
+    set_active_checker(checker)
+
+
+def pytest_unconfigure(config):
+    if getattr(config, "visual_checker", None):
+        from utils.visual_compare import set_active_checker
+
+        set_active_checker(None)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    if item.config.visual_checker:
+        item.config.visual_checker.current_test = item.nodeid
+
+
+def pytest_sessionfinish(session):
+    """Compara as capturas pendentes (pool de processos) e junta os resultados dos workers"""
+    config = session.config
+    checker = config.visual_checker
+    if not checker:
+        return
+
+    checker.run_pending()
+    worker_input = getattr(config, "workerinput", None)
+    checker.save_partial(worker_input["workerid"] if worker_input else "main")
+    if worker_input:
+        return
+
+    config.visual_results = checker.merge_partials()
+    failed = [
+        result for result in config.visual_results["results"] if not result["passed"]
+    ]
+    if failed and session.exitstatus == 0:
+        session.exitstatus = 1
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = getattr(config, "visual_results", None)
+    if not results or not (results["results"] or results["new_baselines"]):
+        return
+
+    terminalreporter.section("visual comparison")
+    compared = results["results"]
+    skipped = sum(1 for result in compared if result["prefilter"])
+    terminalreporter.line(
+        f"{len(compared)} screenshots compared ({skipped} by prefilter), "
+        f"{len(results['new_baselines'])} new baselines"
+    )
+    for result in compared:
+        if not result["passed"]:
+            reason = result["reason"] or f"{result['diff_ratio']:.2%} pixels"
+            terminalreporter.line(
+                f"DIFF {result['test']} [{result['name']}]: {reason} "
+                f"-> {result.get('diff', result['actual'])}",
+                red=True,
+            )
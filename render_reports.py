@@ -0,0 +1,74 @@
+"""
+Render Reports
+
+Builds the HTML, Allure and JUnit reports from the result stream written by pytest
+(RESULTS.FILE, `reports/results.jsonl`), reading it line by line. Without options the
+HTML report and the Allure results are rendered next to the stream.
+
+Usage:
+    python render_reports.py
+    python render_reports.py --allure
+    python render_reports.py --html --allure --junit test-results.xml
+    python render_reports.py --results reports/quarantine/results.jsonl
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import yaml
+
+from utils.report_render import render_allure, render_html, render_junit
+
+CONFIG_YAML_PATH = "./config.yaml"
+
+
+def main() -> int:
+    with open(CONFIG_YAML_PATH, "r") as file:
+        get_config = yaml.safe_load(file)
+    settings = get_config.get("RESULTS") or {}
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--results", default=settings.get("FILE", "./reports/results.jsonl")
+    )
+    parser.add_argument(
+        "--html",
+        nargs="?",
+        const="",
+        help="HTML report. Defaults to <results folder>/report.html",
+    )
+    parser.add_argument(
+        "--allure",
+        nargs="?",
+        const="",
+        help="Allure results folder. Defaults to <results folder>/allure-results",
+    )
+    parser.add_argument("--junit", help="JUnit XML file")
+    args = parser.parse_args()
+
+    results = Path(args.results)
+    if not results.exists():
+        print(f"No result stream found in {results}")
+        return 1
+    if args.html is None and args.allure is None and args.junit is None:
+        args.html = args.allure = ""
+
+    if args.html is not None:
+        target = Path(args.html or results.parent / "report.html")
+        count = render_html(results, target)
+        print(f"HTML: {count} tests -> {target}")
+
+    if args.allure is not None:
+        target = Path(args.allure or results.parent / "allure-results")
+        count = render_allure(results, target)
+        print(f"Allure: {count} tests -> {target}")
+
+    if args.junit:
+        count = render_junit(results, args.junit)
+        print(f"JUnit: {count} tests -> {args.junit}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
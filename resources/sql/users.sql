@@ -1 +1,2 @@
+-- @cacheable: reference rows seeded by init.sql
 SELECT * FROM users;
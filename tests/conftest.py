@@ -1,8 +1,33 @@
+import uuid
+from typing import TYPE_CHECKING
+
 import pytest
 
-from database.users import UserDatabaseHandler
+if TYPE_CHECKING:
+    from api.account import AccountApi
+    from database.factories import UserFactory
+    from database.users import UserDatabaseHandler
 
 
 @pytest.fixture(scope="function")
-def database_users(env, db_manager) -> UserDatabaseHandler:
+def database_users(env, db_manager) -> "UserDatabaseHandler":
+    from database.users import UserDatabaseHandler
+
     return UserDatabaseHandler(env, db_manager)
+
+
+@pytest.fixture(scope="function")
+def new_user(user_factory: "UserFactory") -> dict:
+    """Unique user of the test, taken from the pre-allocated block of the worker."""
+    return user_factory.create()
+
+
+@pytest.fixture(scope="function")
+def api_user(account_api: "AccountApi") -> dict:
+    """demoqa user created through the API and deleted at the end of the test."""
+    username = f"api_{uuid.uuid4().hex[:12]}"
+    password = f"Pw!{uuid.uuid4().hex[:10]}A1"
+    created = account_api.create_user(username, password)
+    yield {"username": username, "password": password, "user_id": created["userID"]}
+    token = account_api.generate_token(username, password)
+    account_api.delete_user(created["userID"], token)
@@ -1,8 +1,15 @@
 import allure
+import pymysql
+import pytest
+from mysql.connector import errors as connector_errors
 
+from database.factories import UserFactory
 from database.users import UserDatabaseHandler
+from utils.AsyncDatabaseManager import BackgroundDatabaseRunner
+from utils.columnar import ColumnarResult, compare
 from utils.DatabaseManager import DatabaseManager
 from utils.logger import log_allure
+from utils.retry import is_fatal_error, is_host_error
 
 
 class TestDataBase:
@@ -31,7 +38,50 @@ class TestDataBase:
         )
         print(result)
 
+    @allure.title("Should be possible to compare SQL Query results column by column")
+    def test_database_query_columnar(self, db_manager: DatabaseManager):
+        actual = db_manager.execute_script_columnar("resources/sql/users.sql")
+        rows = db_manager.execute_script("resources/sql/users.sql")
+        expected = ColumnarResult.from_rows(
+            list(rows[0]), [tuple(row.values()) for row in rows]
+        )
+        compare(actual, expected, key="id").assert_equal()
+
     @allure.title("Should be possible to retrieve users from the database")
     def test_get_users(self, database_users: UserDatabaseHandler):
         users = database_users.get_users()
         print(users)
+
+    @allure.title("Should be possible to get a unique user from the factory")
+    def test_factory_user(self, new_user: dict, user_factory: UserFactory):
+        # Lido pela conexão da factory: a do db_manager mantém o snapshot (REPEATABLE READ)
+        # das consultas anteriores do módulo e não vê o usuário inserido
+        result = user_factory.handler.db_manager.execute_sql(
+            "SELECT email FROM users WHERE id = %s", [new_user["id"]]
+        )
+        assert result[0]["email"] == new_user["email"]
+
+    @allure.title("Should be possible to run SQL Queries concurrently")
+    def test_database_concurrent_queries(self, env, async_db: BackgroundDatabaseRunner):
+        users, users_env = async_db.gather(
+            async_db.manager.execute_script("resources/sql/users.sql"),
+            async_db.manager.execute_script_by_environment(env, "users_env.sql"),
+        )
+        assert len(users) == len(users_env)
+
+    @allure.title("Should not retry connection errors that retrying cannot fix")
+    @pytest.mark.parametrize(
+        "error, fatal, host",
+        [
+            (connector_errors.ProgrammingError(errno=1045, msg="denied"), True, False),
+            (pymysql.err.OperationalError(1045, "denied"), True, False),
+            (pymysql.err.OperationalError(1049, "unknown database"), True, False),
+            (pymysql.err.OperationalError(2005, "unknown host"), True, True),
+            (connector_errors.InterfaceError(errno=2003, msg="refused"), False, False),
+            (pymysql.err.OperationalError(2003, "refused"), False, False),
+            (pymysql.err.OperationalError("lost connection"), False, False),
+        ],
+    )
+    def test_database_fatal_connection_errors(self, error, fatal, host):
+        assert is_fatal_error(error) == fatal
+        assert is_host_error(error) == host
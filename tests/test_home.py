@@ -1,15 +1,29 @@
 import allure
+import pytest
 
 from pages.home_page import HomePage
 
 
+# Testes somente leitura: uma página por classe, sem navegar de novo se já estiver na home
+@pytest.mark.context_scope("class", reset=False)
 class TestHome:
     @allure.title("Check Page Title - Web")
     def test_check_page_title_web(self, web_home_page: HomePage):
-        web_home_page.navigate()
+        web_home_page.navigate(reuse=True)
         web_home_page.has_title()
 
     @allure.title("Check Page Title - Mobile")
     def test_check_page_title_mobile(self, mobile_home_page: HomePage):
-        mobile_home_page.navigate()
+        mobile_home_page.navigate(reuse=True)
         mobile_home_page.has_title()
+
+    @allure.title("Check Page Title - Mobile Devices")
+    def test_check_page_title_devices(self, device_home_page: HomePage):
+        device_home_page.navigate()
+        device_home_page.has_title()
+
+    @allure.title("Visual Checkpoint - Home Web")
+    def test_home_visual_web(self, web_home_page: HomePage):
+        web_home_page.navigate(reuse=True)
+        # Banner fixo de anúncios muda a cada carregamento
+        web_home_page.check_visual("home", ignore=["#fixedban"])
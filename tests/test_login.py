@@ -13,3 +13,14 @@ class TestLogin:
     def test_check_page_title_login_mobile(self, mobile_login_page: LoginPage):
         mobile_login_page.navigate()
         mobile_login_page.has_title()
+
+    @allure.title("Login Through API - Web")
+    def test_login_through_api_web(
+        self, web_login_page: LoginPage, account_api, api_user
+    ):
+        # O login é feito pela API e os cookies são compartilhados com o contexto do navegador
+        account_api.login_context(
+            web_login_page.page.context, api_user["username"], api_user["password"]
+        )
+        web_login_page.navigate()
+        web_login_page.has_logged_user(api_user["username"])
@@ -0,0 +1,189 @@
+"""
+API Client
+
+HTTP client used to prepare test state through the application API (users, login,
+data) instead of the UI, so UI tests can start from a state created in milliseconds.
+
+Classes:
+    ApiClient:
+        Keep-alive `requests.Session` with a sized connection pool, retries of idempotent
+        requests and cookie sharing with Playwright browser contexts.
+
+Behavior:
+    - One client per xdist worker (session fixture `api_client`): connections to the
+      base URL are reused by every test of the worker.
+    - GET/PUT/DELETE/HEAD/OPTIONS are retried on 502/503/504 and connection errors; POST
+      is never retried.
+    - `share_cookies(context)` copies the session cookies (e.g. the login cookies) into a
+      Playwright context; `load_cookies(context)` does the opposite.
+    - `requests.Session` is not thread-safe: use one client per thread.
+
+Example:
+    client = ApiClient("https://demoqa.com/")
+    client.post("Account/v1/Login", json={...}, expected_status=200)
+    client.share_cookies(page.context)
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import urljoin, urlsplit
+
+import allure
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .logger import log_allure
+
+
+class ApiClient:
+    """
+    Pooled HTTP client of the application API.
+
+    Args:
+        base_url (str): Base URL of the application (e.g. https://demoqa.com/).
+        pool_size (int): Keep-alive connections kept per host. Defaults to 10
+        timeout (float): Timeout of each request in seconds. Defaults to 30
+        retries (int): Retries of idempotent requests. Defaults to 2
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 10,
+        timeout: float = 30,
+        retries: int = 2,
+    ):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.domain = urlsplit(self.base_url).hostname
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def from_config(cls, base_url: str, get_config: dict) -> "ApiClient":
+        """Builds the client from the API_CLIENT section of config.yaml."""
+        settings = (get_config or {}).get("API_CLIENT") or {}
+        return cls(
+            base_url,
+            pool_size=settings.get("POOL_SIZE", 10),
+            timeout=settings.get("TIMEOUT", 30),
+            retries=settings.get("RETRIES", 2),
+        )
+
+    def url(self, path: str) -> str:
+        return urljoin(self.base_url, path.lstrip("/"))
+
+    @allure.step("API Request")
+    def request(
+        self,
+        method: str,
+        path: str,
+        expected_status: Optional[Union[int, Iterable[int]]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Sends a request to `base_url + path`.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the base URL.
+            expected_status: Accepted status code(s); any other status raises an error.
+            **kwargs: Arguments of `requests.Session.request` (json, params, headers...).
+
+        Raises:
+            RuntimeError: If the status is not one of `expected_status`.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(path)
+        start = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        log_allure(f"{method} {url} -> {response.status_code} ({elapsed_ms:.0f} ms)")
+
+        if expected_status is not None:
+            accepted = (
+                {expected_status}
+                if isinstance(expected_status, int)
+                else set(expected_status)
+            )
+            if response.status_code not in accepted:
+                raise RuntimeError(
+                    f"{method} {url} returned {response.status_code}, expected "
+                    f"{sorted(accepted)}: {response.text[:500]}"
+                )
+        return response
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def set_cookie(self, name: str, value: str, path: str = "/") -> None:
+        """Sets a cookie of the application domain (shared with the browser later)."""
+        # rest={}: o requests marca os cookies criados manualmente como HttpOnly,
+        # o que impediria o frontend de lê-los depois de compartilhados
+        self.session.cookies.set(name, value, domain=self.domain, path=path, rest={})
+
+    def playwright_cookies(self) -> List[Dict]:
+        """Session cookies in the format of `BrowserContext.add_cookies`."""
+        cookies = []
+        for cookie in self.session.cookies:
+            cookies.append(
+                {
+                    "name": cookie.name,
+                    "value": cookie.value or "",
+                    "domain": cookie.domain or self.domain,
+                    "path": cookie.path or "/",
+                    "expires": float(cookie.expires) if cookie.expires else -1,
+                    "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+                    "secure": bool(cookie.secure),
+                }
+            )
+        return cookies
+
+    @allure.step("Share API Cookies With Browser Context")
+    def share_cookies(self, context) -> None:
+        """Copies the session cookies into a Playwright context."""
+        cookies = self.playwright_cookies()
+        if cookies:
+            context.add_cookies(cookies)
+        log_allure(f"{len(cookies)} cookies shared with the browser context")
+
+    def load_cookies(self, context) -> None:
+        """Copies the cookies of a Playwright context into the session (UI -> API)."""
+        for cookie in context.cookies():
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie["domain"],
+                path=cookie["path"],
+                secure=cookie["secure"],
+                rest={"HttpOnly": None} if cookie["httpOnly"] else {},
+            )
+
+    def clear_cookies(self) -> None:
+        self.session.cookies.clear()
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,265 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional, Union
+
+import aiomysql
+
+from .impact_selector import track_dependency
+from .logger import log_info
+from .retry import RetryPolicy, connect_with_retry_async
+from .string_utils import replace_values
+from .worker_schema import routed_schema
+
+
+class AsyncDatabaseManager:
+    """
+    Asyncio-native counterpart of `DatabaseManager`, backed by an aiomysql connection pool.
+
+    Every query takes its own connection from the pool, so several checks can run
+    concurrently with `asyncio.gather` (or alongside Playwright async page actions).
+
+    Only `log_info` is used for logging: Allure steps and attachments are bound to the
+    thread of the running test and cannot be recorded from concurrent coroutines.
+
+    Args:
+        db_config (dict): Database configuration containing:
+            - DB_HOST: Database server hostname
+            - DB_PORT: Database server port
+            - DB_NAME: Database name
+            - DB_USER: Database username
+            - DB_PASSWORD: Database password
+        get_config (dict): Main configuration dictionary. With DB_PER_WORKER enabled the
+            pool connects to the schema of the xdist worker once it was created by this
+            process (see `utils/worker_schema.py`)
+        pool_size (int): Maximum number of pooled connections. Defaults to 5
+    """
+
+    def __init__(self, db_config: dict, get_config: dict, pool_size: int = 5):
+        self.config = get_config
+        self.TIMEOUT = 60  # Maximum waiting time in seconds
+        self.retry_policy = RetryPolicy(timeout=self.TIMEOUT)
+        self.POOL_SIZE = pool_size
+        self.DB_HOST = db_config["DB_HOST"]
+        self.DB_PORT = db_config["DB_PORT"]
+        self.DB_NAME = db_config["DB_NAME"]
+        self.DB_NAME = routed_schema(self.DB_NAME)
+        self.DB_USER = db_config["DB_USER"]
+        self.DB_PASSWORD = db_config["DB_PASSWORD"]
+        self.pool: Optional[aiomysql.Pool] = None
+
+    async def connect(self) -> None:
+        """
+        Creates the connection pool with the retry logic of `DatabaseManager.connect`
+        (exponential backoff, TCP probe and fast fail, see `utils/retry.py`).
+
+        Raises:
+            DatabaseUnavailableError: If another worker already flagged the database as down
+            DatabaseConnectionError: If a fatal error happens or the timeout expires
+        """
+        log_info("Attempting to create MySQL connection pool...")
+        self.pool = await connect_with_retry_async(
+            lambda: aiomysql.create_pool(
+                host=self.DB_HOST,
+                port=self.DB_PORT,
+                user=self.DB_USER,
+                password=self.DB_PASSWORD,
+                db=self.DB_NAME,
+                connect_timeout=5,
+                autocommit=True,
+                minsize=1,
+                maxsize=self.POOL_SIZE,
+            ),
+            self.DB_HOST,
+            self.DB_PORT,
+            self.retry_policy,
+            log_info,
+            database=self.DB_NAME,
+            user=self.DB_USER,
+        )
+        log_info("✅ Successfully created MySQL connection pool!")
+
+    async def execute_sql(self, sql: str, params=None) -> List[Dict]:
+        """
+        Executes raw SQL on a pooled connection and returns the rows as dictionaries.
+
+        Args:
+            sql: SQL statement, optionally with %s / %(name)s placeholders
+            params: Values for the placeholders
+        """
+        if not self.pool:
+            raise RuntimeError("Database connection is not established")
+
+        async with self.pool.acquire() as connection:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(sql, params)
+                return list(await cursor.fetchall()) if cursor.description else []
+
+    async def execute_script(self, script_path: Union[str, Path]) -> List[Dict]:
+        """
+        Executes a SQL script from file and returns results as dictionaries.
+
+        Args:
+            script_path: Path to the SQL script file
+
+        Returns:
+            List of dictionaries representing query results or message if empty
+
+        Raises:
+            RuntimeError: If execution fails or connection is not established
+        """
+        if not self.pool:
+            raise RuntimeError("Database connection is not established")
+
+        track_dependency(script_path)
+        try:
+            sql = Path(script_path).read_text().strip()
+            if not sql:
+                raise ValueError("Script file is empty")
+
+            async with self.pool.acquire() as connection:
+                async with connection.cursor(aiomysql.DictCursor) as cursor:
+                    log_info(f"Executing SQL: {sql}")
+                    await cursor.execute(sql)
+
+                    if cursor.description:
+                        results = list(await cursor.fetchall())
+                        log_info(f"Query results: {results}")
+                        return results
+
+                    return [
+                        {
+                            "message": "Query executed successfully",
+                            "affected_rows": cursor.rowcount,
+                        }
+                    ]
+
+        except Exception as err:
+            log_info(f"Error executing script: {err}")
+            raise RuntimeError(f"Script execution failed: {err}")
+
+    async def replace_values_and_execute_script(
+        self, script_path: Union[str, Path], values: List[str]
+    ) -> List[Dict]:
+        """
+        Replaces placeholders in script and executes it.
+
+        Args:
+            script_path: Path to SQL script file
+            values: List of values to replace placeholders
+
+        Returns:
+            List of dictionaries with query results
+        """
+        if not self.pool:
+            await self.connect()
+
+        track_dependency(script_path)
+        try:
+            sql = Path(script_path).read_text().strip()
+            replaced_sql = replace_values(sql, "$$", values)
+            return await self.execute_sql(replaced_sql)
+
+        except Exception as err:
+            log_info(f"Error in value replacement: {err}")
+            raise RuntimeError(f"Script execution failed: {err}")
+
+    async def execute_script_by_environment(
+        self, environment: str, script_name: str
+    ) -> List[Dict]:
+        """
+        Executes a script from environment-specific folder.
+
+        Args:
+            environment: Target environment (e.g., 'uat', 'prod')
+            script_name: Name of SQL script file
+        """
+        script_path = Path(
+            f"{self.config['SQL_SCRIPTS_FOLDER']}/{environment}/{script_name}"
+        )
+        return await self.execute_script(script_path)
+
+    async def replace_values_and_execute_script_by_environment(
+        self, environment: str, script_name: str, values: List[str]
+    ) -> List[Dict]:
+        """
+        Replaces values in environment-specific script and executes it.
+
+        Args:
+            environment: Target environment
+            script_name: SQL script filename
+            values: Values for placeholder replacement
+        """
+        script_path = Path(
+            f"{self.config['SQL_SCRIPTS_FOLDER']}/{environment}/{script_name}"
+        )
+        return await self.replace_values_and_execute_script(script_path, values)
+
+    async def close_connection(self) -> None:
+        """Closes the pool and waits for its connections to be released."""
+        if self.pool:
+            self.pool.close()
+            await self.pool.wait_closed()
+            log_info("Database connection pool closed")
+            self.pool = None
+
+    async def __aenter__(self):
+        """Async context manager entry point."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit point."""
+        await self.close_connection()
+
+
+class BackgroundDatabaseRunner:
+    """
+    Runs an `AsyncDatabaseManager` on its own event loop in a background thread.
+
+    Lets synchronous tests (and the sync Playwright API, which cannot share a running
+    event loop) submit database checks that run concurrently while the test keeps
+    driving the browser, collecting the results later.
+
+    Args:
+        manager (AsyncDatabaseManager): Manager to connect and run on the background loop.
+
+    Example:
+        pending = async_db.submit(async_db.manager.execute_sql("SELECT ..."))
+        web_home_page.navigate()
+        rows = pending.result()
+    """
+
+    def __init__(self, manager: AsyncDatabaseManager):
+        self.manager = manager
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="async-db-loop", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coroutine: Awaitable) -> Future:
+        """Schedules a coroutine on the background loop and returns its future."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Awaitable) -> Any:
+        """Runs a coroutine on the background loop and waits for its result."""
+        return self.submit(coroutine).result()
+
+    def gather(self, *coroutines: Awaitable) -> List[Any]:
+        """Runs several coroutines concurrently and returns their results in order."""
+
+        async def _gather():
+            return await asyncio.gather(*coroutines)
+
+        return self.run(_gather())
+
+    def close(self) -> None:
+        """Closes the manager pool and stops the background loop."""
+        try:
+            self.run(self.manager.close_connection())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
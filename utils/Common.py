@@ -1,9 +1,13 @@
 import os
+from typing import TYPE_CHECKING
 
 import allure
 
 from .DatabaseManager import DatabaseManager
 
+if TYPE_CHECKING:
+    from .AsyncDatabaseManager import AsyncDatabaseManager
+
 CONFIG_YAML_PATH = "./config.yaml"
 
 
@@ -16,15 +20,43 @@ class Common:
         environment (str): The execution environment (e.g., 'uat', 'rc', 'prod').
     """
 
-    def __init__(self, environment, get_config):
+    def __init__(self, environment, get_config, env_config=None):
         """
         Initializes the Common class with the provided environment and loads the configuration from a YAML file.
 
         Args:
             environment (str): The execution environment.
+            env_config (EnvironmentConfig): Variables of the environment. When omitted,
+                the database settings are read from `os.environ`.
         """
         self.config = get_config
         self.environment = environment
+        self.env_config = env_config
+
+    def get_db_config(self) -> dict:
+        """
+        Returns the database settings of the environment.
+
+        Raises:
+            RuntimeError: If a database setting is missing.
+        """
+        if self.env_config:
+            db_config = self.env_config.db_config
+        else:
+            db_config = {
+                "DB_NAME": os.getenv("DB_NAME"),
+                "DB_USER": os.getenv("DB_USER"),
+                "DB_PASSWORD": os.getenv("DB_PASSWORD"),
+                "DB_HOST": os.getenv("DB_HOST"),
+                "DB_PORT": int(os.getenv("DB_PORT", "3306")),  # Conversão explícita
+            }
+
+        # Verificação de configuração mínima
+        if not all(db_config.values()):
+            missing = [k for k, v in db_config.items() if not v]
+            raise RuntimeError(f"Missing database configuration: {', '.join(missing)}")
+
+        return db_config
 
     @allure.step("Get DB Manager")
     def get_db_manager(self) -> DatabaseManager:
@@ -37,19 +69,19 @@ class Common:
         Raises:
             RuntimeError: If there is an error connecting to the database.
         """
-        db_config = {
-            "DB_NAME": os.getenv("DB_NAME"),
-            "DB_USER": os.getenv("DB_USER"),
-            "DB_PASSWORD": os.getenv("DB_PASSWORD"),
-            "DB_HOST": os.getenv("DB_HOST"),
-            "DB_PORT": int(os.getenv("DB_PORT", "3306")),  # Conversão explícita
-        }
-
-        # Verificação de configuração mínima
-        if not all(db_config.values()):
-            missing = [k for k, v in db_config.items() if not v]
-            raise RuntimeError(f"Missing database configuration: {', '.join(missing)}")
-
-        db = DatabaseManager(db_config, self.config)
+        db = DatabaseManager(self.get_db_config(), self.config)
         db.connect()
         return db
+
+    @allure.step("Get Async DB Manager")
+    def get_async_db_manager(self, pool_size: int = 5) -> "AsyncDatabaseManager":
+        """
+        Returns an asyncio database manager for the environment. The pool is created
+        by awaiting `connect()` on the event loop that will run the queries.
+
+        Args:
+            pool_size (int): Maximum number of pooled connections.
+        """
+        from .AsyncDatabaseManager import AsyncDatabaseManager
+
+        return AsyncDatabaseManager(self.get_db_config(), self.config, pool_size)
@@ -1,13 +1,21 @@
-import time
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import allure
-import mysql.connector
 
 from utils.string_utils import replace_string
 
+from .DatabaseSnapshot import DatabaseSnapshot
+from .impact_selector import track_dependency
 from .logger import log_allure, log_info
+from .query_cache import QueryCache, is_cacheable_script, is_write
+from .retry import RetryPolicy, connect_with_retry
+from .worker_schema import routed_schema
+
+if TYPE_CHECKING:
+    from mysql.connector import MySQLConnection
+
+    from .columnar import ColumnarResult
 
 
 class DatabaseManager:
@@ -22,58 +30,68 @@ class DatabaseManager:
             - DB_NAME: Database name
             - DB_USER: Database username
             - DB_PASSWORD: Database password
-        get_config (dict): Main configuration dictionary
+        get_config (dict): Main configuration dictionary. Its optional QUERY_CACHE
+            section enables the read cache (see `utils/query_cache.py`).
+        route_to_worker (bool): Connect to the schema of the xdist worker once it was
+            created by this process (DB_PER_WORKER, see `utils/worker_schema.py`).
+            Defaults to True
     """
 
-    def __init__(self, db_config: dict, get_config: dict):
+    def __init__(self, db_config: dict, get_config: dict, route_to_worker: bool = True):
         """
         Initializes the database manager with configuration settings.
         """
         self.config = get_config
         self.TIMEOUT = 60  # Maximum waiting time in seconds
-        self.INTERVAL = 5  # Time between connection attempts
-        self.ELAPSE_TIME = 0  # Tracks elapsed time
+        self.retry_policy = RetryPolicy(timeout=self.TIMEOUT)
         self.DB_HOST = db_config["DB_HOST"]
         self.DB_PORT = db_config["DB_PORT"]
         self.DB_NAME = db_config["DB_NAME"]
+        if route_to_worker:
+            self.DB_NAME = routed_schema(self.DB_NAME)
         self.DB_USER = db_config["DB_USER"]
         self.DB_PASSWORD = db_config["DB_PASSWORD"]
-        self.connection: Optional[mysql.connector.MySQLConnection] = None
+        self.connection: Optional["MySQLConnection"] = None
+        self.query_cache: Optional[QueryCache] = QueryCache.from_config(
+            get_config, (self.DB_HOST, self.DB_PORT, self.DB_NAME)
+        )
 
     @allure.step("Connect To Database")
     def connect(self) -> None:
         """
-        Establishes a connection to the MySQL database with retry logic.
+        Establishes a connection to the MySQL database with retry logic
+        (exponential backoff, TCP probe and fast fail, see `utils/retry.py`).
 
         Raises:
-            RuntimeError: If connection fails after timeout period
-        """
-        start_time = time.time()
-
-        while (time.time() - start_time) < self.TIMEOUT:
-            try:
-                log_allure("Attempting to connect to MySQL database...")
-                self.connection = mysql.connector.connect(
-                    host=self.DB_HOST,
-                    port=self.DB_PORT,
-                    user=self.DB_USER,
-                    password=self.DB_PASSWORD,
-                    database=self.DB_NAME,
-                    connect_timeout=5,
-                )
-
-                if self.connection.is_connected():
-                    log_info("✅ Successfully connected to MySQL database!")
-                    return
-
-            except mysql.connector.Error as err:
-                log_info(f"⚠️ Connection attempt failed: {err}")
-                time.sleep(self.INTERVAL)
-                continue
-
-        raise RuntimeError(
-            f"Failed to connect to database after {self.TIMEOUT} seconds"
+            DatabaseUnavailableError: If another worker already flagged the database as down
+            DatabaseConnectionError: If a fatal error happens or the timeout expires
+        """
+        import mysql.connector  # Imported on first connection to keep startup fast
+
+        def _connect():
+            connection = mysql.connector.connect(
+                host=self.DB_HOST,
+                port=self.DB_PORT,
+                user=self.DB_USER,
+                password=self.DB_PASSWORD,
+                database=self.DB_NAME,
+                connect_timeout=5,
+            )
+            if not connection.is_connected():
+                raise mysql.connector.Error("Connection is not open")
+            return connection
+
+        log_allure("Attempting to connect to MySQL database...")
+        self.connection = connect_with_retry(
+            _connect,
+            self.DB_HOST,
+            self.DB_PORT,
+            self.retry_policy,
+            log_info,
+            database=self.DB_NAME,
+            user=self.DB_USER,
         )
+        log_info("✅ Successfully connected to MySQL database!")
 
     @allure.step("Execute Query")
     def execute_script(self, script_path: Union[str, Path]) -> List[Dict]:
@@ -92,6 +110,7 @@ class DatabaseManager:
         if not self.connection or not self.connection.is_connected():
             raise RuntimeError("Database connection is not established")
 
+        track_dependency(script_path)
         try:
             with open(script_path, "r") as file:
                 sql = file.read().strip()
@@ -99,13 +118,25 @@ class DatabaseManager:
             if not sql:
                 raise ValueError("Script file is empty")
 
+            # Scripts marked with the '-- @cacheable' header are served from the cache
+            cache_key = None
+            if self.query_cache and is_cacheable_script(sql):
+                cache_key = self.query_cache.key(sql)
+                cached = self.query_cache.get(cache_key)
+                if cached is not None:
+                    log_info(f"Query results (cached): {cached}")
+                    return cached
+
             with self.connection.cursor(dictionary=True) as cursor:
                 log_info(f"Executing SQL: {sql}")
                 cursor.execute(sql)
+                self._invalidate_cache(sql)
 
                 if cursor.with_rows:
                     results = cursor.fetchall()
                     log_info(f"Query results: {results}")
+                    if cache_key:
+                        self.query_cache.put(cache_key, results)
                     return results
 
                 return [
@@ -119,6 +150,61 @@ class DatabaseManager:
             log_info(f"Error executing script: {err}")
             raise RuntimeError(f"Script execution failed: {err}")
 
+    @allure.step("Execute Query (Columnar)")
+    def execute_script_columnar(
+        self, script_path: Union[str, Path], chunk_size: int = 10000
+    ) -> "ColumnarResult":
+        """
+        Executes a SQL script from file and returns the result column by column
+        (one typed numpy array per column, see `utils/columnar.py`), for large result
+        sets compared with `columnar.compare`.
+
+        Args:
+            script_path: Path to the SQL script file
+            chunk_size: Rows fetched per round trip
+
+        Raises:
+            RuntimeError: If execution fails or connection is not established
+        """
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("Database connection is not established")
+
+        track_dependency(script_path)
+        try:
+            with open(script_path, "r") as file:
+                sql = file.read().strip()
+
+            if not sql:
+                raise ValueError("Script file is empty")
+
+            return self.execute_sql_columnar(sql, chunk_size=chunk_size)
+
+        except Exception as err:
+            log_info(f"Error executing script: {err}")
+            raise RuntimeError(f"Script execution failed: {err}")
+
+    def execute_sql_columnar(
+        self, sql: str, params=None, chunk_size: int = 10000
+    ) -> "ColumnarResult":
+        """
+        Executes raw SQL and returns the result column by column.
+
+        Args:
+            sql: SQL statement, optionally with %s / %(name)s placeholders
+            params: Values for the placeholders
+            chunk_size: Rows fetched per round trip
+        """
+        from .columnar import ColumnarResult  # numpy só é importado quando usado
+
+        with self.connection.cursor() as cursor:
+            log_info(f"Executing SQL (columnar): {sql}")
+            cursor.execute(sql, params)
+            self._invalidate_cache(sql)
+            result = ColumnarResult.from_cursor(cursor, chunk_size)
+
+        log_info(f"Columnar result: {len(result)} rows, {result.column_names}")
+        return result
+
     @allure.step("Replace Values And Execute Query")
     def replace_values_and_execute_script(
         self, script_path: Union[str, Path], values: List[str]
@@ -136,6 +222,7 @@ class DatabaseManager:
         if not self.connection or not self.connection.is_connected():
             self.connect()
 
+        track_dependency(script_path)
         try:
             with open(script_path, "r") as file:
                 sql = file.read().strip()
@@ -183,9 +270,35 @@ class DatabaseManager:
         )
         return self.replace_values_and_execute_script(script_path, values)
 
+    @allure.step("Restore Database Snapshot")
+    def restore_snapshot(self, strategy: Optional[str] = None) -> Dict[str, float]:
+        """
+        Restores the tables captured by `python init_db.py --snapshot`
+        (see `utils/DatabaseSnapshot.py`) and clears the query cache.
+
+        Args:
+            strategy: "auto", "reload" or "clone". Defaults to DB_SNAPSHOT.STRATEGY
+
+        Returns:
+            Restore time in seconds of each rewritten table
+        """
+        if not self.connection or not self.connection.is_connected():
+            self.connect()
+
+        snapshot_config = (self.config or {}).get("DB_SNAPSHOT") or {}
+        timings = DatabaseSnapshot(self.connection, self.DB_NAME, log_allure).restore(
+            strategy=strategy or snapshot_config.get("STRATEGY", "auto"),
+            only_changed=snapshot_config.get("ONLY_CHANGED", True),
+        )
+        if self.query_cache:
+            self.query_cache.clear()
+        return timings
+
     @allure.step("Disconnect From Database")
     def close_connection(self) -> None:
         """Closes the database connection if it exists and is open."""
+        if self.query_cache:
+            log_allure(f"Query cache stats: {self.query_cache.stats()}")
         if self.connection and self.connection.is_connected():
             self.connection.close()
             log_allure("Database connection closed")
@@ -201,8 +314,32 @@ class DatabaseManager:
         if self.connection and self.connection.is_connected():
             self.close_connection()
 
-    def execute_sql(self, sql: str) -> List[Dict]:
-        """Internal method to execute raw SQL."""
+    def execute_sql(self, sql: str, params=None, cacheable: bool = False) -> List[Dict]:
+        """
+        Internal method to execute raw SQL.
+
+        Args:
+            sql: SQL statement, optionally with %s / %(name)s placeholders
+            params: Values for the placeholders
+            cacheable: Serve this read from the query cache (when enabled)
+        """
+        cache_key = None
+        if cacheable and self.query_cache and not is_write(sql):
+            cache_key = self.query_cache.key(sql, params)
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         with self.connection.cursor(dictionary=True) as cursor:
-            cursor.execute(sql)
-            return cursor.fetchall() if cursor.with_rows else []
+            cursor.execute(sql, params)
+            self._invalidate_cache(sql)
+            results = cursor.fetchall() if cursor.with_rows else []
+
+        if cache_key:
+            self.query_cache.put(cache_key, results)
+        return results
+
+    def _invalidate_cache(self, sql: str) -> None:
+        """Drops cached reads of the tables changed by a write statement."""
+        if self.query_cache and is_write(sql):
+            self.query_cache.invalidate(sql)
@@ -0,0 +1,231 @@
+"""
+Database Snapshot
+
+Captures the seeded tables of a schema once and restores them in bulk, so the database
+can be reset between runs (or test modules) without replaying `init.sql` statement by
+statement.
+
+Classes:
+    DatabaseSnapshot:
+        Captures the tables into snapshot copies (`__snap_<table>`) and restores them.
+
+Strategies:
+    - "reload": `TRUNCATE <table>` + `INSERT INTO <table> SELECT * FROM __snap_<table>`.
+      Keeps the table definition; fastest when the table still has the snapshot columns.
+    - "clone": `CREATE TABLE ... LIKE __snap_<table>` + `INSERT ... SELECT`, then an atomic
+      `RENAME TABLE`. Rebuilds tables that were dropped or altered since the capture.
+    - "auto": "reload" when the table definition still matches the snapshot, "clone"
+      otherwise.
+
+Behavior:
+    - With `only_changed=True`, tables whose `CHECKSUM TABLE` matches the snapshot are
+      skipped, so restoring an untouched schema costs one statement.
+    - Foreign key checks are disabled while the tables are rewritten.
+    - `restore()` returns the time spent per table and logs the total restore time.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+SNAPSHOT_PREFIX = "__snap_"
+STRATEGIES = ("auto", "reload", "clone")
+
+
+class DatabaseSnapshot:
+    """
+    Snapshot of the tables of a schema, stored as tables of the same schema.
+
+    Args:
+        connection: Open DB-API connection (mysql.connector) to the schema.
+        database (str): Schema name.
+        log (Callable): Function used to report progress. Defaults to print
+    """
+
+    def __init__(self, connection, database: str, log: Callable[[str], None] = print):
+        self.connection = connection
+        self.database = database
+        self.log = log
+
+    @staticmethod
+    def snapshot_name(table: str) -> str:
+        return f"{SNAPSHOT_PREFIX}{table}"
+
+    def _execute(self, *statements: str) -> None:
+        with self.connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def _query(self, sql: str, params=None) -> List[tuple]:
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def all_tables(self) -> List[str]:
+        """Tables of the schema, including the snapshot copies."""
+        rows = self._query(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = %s AND table_type = 'BASE TABLE'",
+            (self.database,),
+        )
+        return [row[0] for row in rows]
+
+    def tables(self) -> List[str]:
+        """Tables of the schema, without the snapshot copies."""
+        return [
+            name for name in self.all_tables() if not name.startswith(SNAPSHOT_PREFIX)
+        ]
+
+    def captured_tables(self) -> List[str]:
+        """Tables that have a snapshot copy."""
+        return [
+            name[len(SNAPSHOT_PREFIX) :]
+            for name in self.all_tables()
+            if name.startswith(SNAPSHOT_PREFIX)
+        ]
+
+    def exists(self) -> bool:
+        return bool(self.captured_tables())
+
+    def _columns(self) -> Dict[str, List[tuple]]:
+        """Column definitions of every table of the schema, in ordinal order."""
+        rows = self._query(
+            "SELECT table_name, column_name, column_type, is_nullable, column_key "
+            "FROM information_schema.columns WHERE table_schema = %s "
+            "ORDER BY table_name, ordinal_position",
+            (self.database,),
+        )
+        columns: Dict[str, List[tuple]] = {}
+        for table, *definition in rows:
+            columns.setdefault(table, []).append(tuple(definition))
+        return columns
+
+    def _checksums(self, tables: Iterable[str]) -> Dict[str, Optional[int]]:
+        names = ", ".join(f"`{table}`" for table in tables)
+        if not names:
+            return {}
+        # Retorna "<schema>.<tabela>" na primeira coluna
+        return {
+            name.split(".", 1)[-1]: checksum
+            for name, checksum in self._query(f"CHECKSUM TABLE {names}")
+        }
+
+    def capture(self, tables: Optional[Iterable[str]] = None) -> float:
+        """
+        Copies the tables (all by default) into their snapshot tables.
+
+        Returns:
+            float: Capture time in seconds.
+        """
+        start = time.perf_counter()
+        tables = list(tables or self.tables())
+        for table in tables:
+            snapshot = self.snapshot_name(table)
+            self._execute(
+                f"DROP TABLE IF EXISTS `{snapshot}`",
+                f"CREATE TABLE `{snapshot}` LIKE `{table}`",
+                f"INSERT INTO `{snapshot}` SELECT * FROM `{table}`",
+            )
+        self.connection.commit()
+
+        elapsed = time.perf_counter() - start
+        self.log(
+            f"✅ Snapshot captured in {elapsed * 1000:.0f} ms ({len(tables)} tables)"
+        )
+        return elapsed
+
+    def restore(
+        self,
+        tables: Optional[Iterable[str]] = None,
+        strategy: str = "auto",
+        only_changed: bool = True,
+    ) -> Dict[str, float]:
+        """
+        Restores the tables (all captured tables by default) from the snapshot.
+
+        Args:
+            tables: Tables to restore.
+            strategy: "auto", "reload" or "clone" (see the module docstring).
+            only_changed: Skip tables whose checksum matches the snapshot.
+
+        Returns:
+            Dict[str, float]: Restore time in seconds of each rewritten table.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+            RuntimeError: If there is no snapshot of a requested table.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown snapshot strategy '{strategy}': {STRATEGIES}")
+
+        start = time.perf_counter()
+        captured = self.captured_tables()
+        tables = list(tables or captured)
+        missing = [table for table in tables if table not in captured]
+        if missing:
+            raise RuntimeError(f"No snapshot captured for: {', '.join(missing)}")
+
+        columns = self._columns()
+        existing = [table for table in tables if table in columns]
+        if only_changed and existing:
+            checksums = self._checksums(
+                existing + [self.snapshot_name(table) for table in existing]
+            )
+            tables = [
+                table
+                for table in tables
+                if table not in existing
+                or checksums.get(table) != checksums.get(self.snapshot_name(table))
+                or columns[table] != columns[self.snapshot_name(table)]
+            ]
+
+        timings = {}
+        self._execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table in tables:
+                table_start = time.perf_counter()
+                same_definition = columns.get(table) == columns.get(
+                    self.snapshot_name(table)
+                )
+                if strategy == "reload" or (strategy == "auto" and same_definition):
+                    self._reload(table)
+                else:
+                    self._clone(table, table in columns)
+                timings[table] = time.perf_counter() - table_start
+            self.connection.commit()
+        finally:
+            self._execute("SET FOREIGN_KEY_CHECKS = 1")
+
+        elapsed = time.perf_counter() - start
+        self.log(
+            f"✅ Snapshot restored in {elapsed * 1000:.0f} ms "
+            f"({len(timings)} of {len(captured)} tables rewritten, strategy '{strategy}')"
+        )
+        return timings
+
+    def _reload(self, table: str) -> None:
+        self._execute(
+            f"TRUNCATE TABLE `{table}`",
+            f"INSERT INTO `{table}` SELECT * FROM `{self.snapshot_name(table)}`",
+        )
+
+    def _clone(self, table: str, exists: bool) -> None:
+        snapshot = self.snapshot_name(table)
+        staging = f"{snapshot}_new"
+        self._execute(
+            f"DROP TABLE IF EXISTS `{staging}`",
+            f"CREATE TABLE `{staging}` LIKE `{snapshot}`",
+            f"INSERT INTO `{staging}` SELECT * FROM `{snapshot}`",
+        )
+        if exists:
+            old = f"{snapshot}_old"
+            self._execute(
+                f"RENAME TABLE `{table}` TO `{old}`, `{staging}` TO `{table}`",
+                f"DROP TABLE `{old}`",
+            )
+        else:
+            self._execute(f"RENAME TABLE `{staging}` TO `{table}`")
+
+    def drop(self) -> None:
+        """Removes the snapshot tables."""
+        for table in self.captured_tables():
+            self._execute(f"DROP TABLE IF EXISTS `{self.snapshot_name(table)}`")
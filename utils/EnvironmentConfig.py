@@ -0,0 +1,89 @@
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+import allure
+from dotenv import dotenv_values
+
+from .logger import log_allure
+
+DB_KEYS = ["DB_NAME", "DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT"]
+
+
+@dataclass(frozen=True)
+class EnvironmentConfig:
+    """
+    Read-only configuration of one execution environment (e.g. RC, UAT).
+
+    Unlike `SetDotEnv.set_project_environment_variables`, building an EnvironmentConfig
+    never changes `os.environ`, so several environments can be used in the same process.
+
+    Args:
+        name (str): Environment name as selected by --env or config.yaml.
+        variables (Mapping): Environment variables of this environment.
+        headless (bool): Headless mode selected for the session.
+    """
+
+    name: str
+    variables: Mapping[str, str]
+    headless: bool = False
+
+    @classmethod
+    @allure.step("Load Environment Config")
+    def load(
+        cls, environment: str, pipeline: bool = False, headless: bool = False
+    ) -> "EnvironmentConfig":
+        """
+        Loads the variables of an environment without touching `os.environ`.
+
+        1. Pipeline Mode (`pipeline=True`): Reads the OS environment. Variables prefixed
+           with the environment name (e.g. `UAT_DB_HOST`) override unprefixed ones, so
+           a single pipeline job can provide several environments.
+        2. File Environment Mode (`pipeline=False`): Reads `<environment>.env`.
+
+        Raises:
+            FileNotFoundError: If the `.env` file of the environment is not found.
+            ValueError: If no variables are found.
+        """
+        if pipeline:
+            prefix = f"{environment.upper()}_"
+            variables = dict(os.environ)
+            variables.update(
+                {
+                    key[len(prefix) :]: value
+                    for key, value in os.environ.items()
+                    if key.startswith(prefix)
+                }
+            )
+            log_allure(f"Run tests on Pipeline: {pipeline} ({environment.upper()})")
+        else:
+            env_file = f"{environment.lower()}.env"
+            if not os.path.exists(env_file):
+                raise FileNotFoundError(f"Environment file '{env_file}' not found.")
+            variables = {k: v for k, v in dotenv_values(env_file).items() if v}
+            log_allure(f"Loaded Environment file: {env_file}")
+
+        if not variables:
+            raise ValueError(f"No environment variables found for {environment}.")
+
+        return cls(environment, MappingProxyType(variables), headless)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self.variables.get(key, default)
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """The `URL` variable of the environment, if set."""
+        return self.get("URL")
+
+    @property
+    def db_config(self) -> Dict:
+        """Database settings in the format expected by `DatabaseManager`."""
+        return {
+            "DB_NAME": self.get("DB_NAME"),
+            "DB_USER": self.get("DB_USER"),
+            "DB_PASSWORD": self.get("DB_PASSWORD"),
+            "DB_HOST": self.get("DB_HOST"),
+            "DB_PORT": int(self.get("DB_PORT", "3306")),
+        }
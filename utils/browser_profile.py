@@ -0,0 +1,196 @@
+"""
+Persistent Browser Profile Utility
+
+This module manages the per-worker user data directories used by the persistent
+browser context mode, so the HTTP disk cache survives between runs while cookies and
+storage are wiped to keep the tests isolated.
+
+Classes:
+    PersistentProfile:
+        Resolves the profile folder of a worker and wipes its cookies and storage.
+
+Functions:
+    reset_context_state(context, browser_name):
+        Clears cookies, permissions and the origin storage of a context shared between
+        tests.
+
+Behavior:
+    - Each xdist worker gets its own folder: `<PROFILES_FOLDER>/<browser>_<worker>`.
+      The folder is locked while the browser uses it; another pytest process running at
+      the same time (e.g. `make lanes`) takes the next free slot
+      (`<browser>_<worker>-1`, ...), so each slot keeps its warm cache between runs.
+    - Cache folders (`Cache`, `Code Cache`, `cache2`, ...) are never removed.
+    - Cookies, local/session storage, IndexedDB and service workers are removed before
+      the browser starts.
+    - Between tests, the storage of every origin of the context (local/session storage,
+      IndexedDB, Cache Storage and service workers) is cleared: through CDP
+      (`Storage.clearDataForOrigin`) on chromium, and by a script in the open pages on
+      the other browsers.
+"""
+
+import itertools
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Set
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import allure
+from playwright.sync_api import BrowserContext
+
+from .logger import log_allure
+
+# Cookie and storage entries of Chromium ("Default/...") and Firefox profiles
+STATE_ENTRIES = [
+    "Default/Cookies",
+    "Default/Cookies-journal",
+    "Default/Network/Cookies",
+    "Default/Network/Cookies-journal",
+    "Default/Local Storage",
+    "Default/Session Storage",
+    "Default/IndexedDB",
+    "Default/Service Worker",
+    "Default/WebStorage",
+    "cookies.sqlite",
+    "cookies.sqlite-wal",
+    "webappsstore.sqlite",
+    "storage",
+    "sessionstore-backups",
+]
+
+CLEAR_STORAGE_SCRIPT = """async () => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+    try {
+        const databases = await indexedDB.databases();
+        databases.forEach((database) => indexedDB.deleteDatabase(database.name));
+    } catch (e) {}
+    try {
+        const keys = await caches.keys();
+        await Promise.all(keys.map((key) => caches.delete(key)));
+    } catch (e) {}
+    try {
+        const registrations = await navigator.serviceWorker.getRegistrations();
+        await Promise.all(registrations.map((registration) => registration.unregister()));
+    } catch (e) {}
+}"""
+
+
+class PersistentProfile:
+    """
+    Per-worker browser profile that keeps the HTTP cache between runs.
+
+    Args:
+        profiles_folder (str): Root folder of all profiles.
+        browser_name (str): Browser the profile belongs to (chromium, firefox, webkit).
+        worker_id (str): xdist worker id. Defaults to PYTEST_XDIST_WORKER or 'main'.
+    """
+
+    def __init__(self, profiles_folder: str, browser_name: str, worker_id: str = None):
+        worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.folder = Path(profiles_folder)
+        self.name = f"{browser_name}_{worker_id}"
+        self.path = self.folder / self.name
+        self._lock = None
+
+    @allure.step("Prepare Persistent Browser Profile")
+    def prepare(self) -> Path:
+        """
+        Creates the profile folder and wipes cookies and storage left by the last run.
+
+        Returns:
+            Path: The user data directory to pass to `launch_persistent_context`.
+        """
+        self._acquire()
+        warm = self.path.exists()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.wipe_state()
+        log_allure(
+            f"Persistent profile {'warm' if warm else 'cold'} start: {self.path}"
+        )
+        return self.path
+
+    def release(self) -> None:
+        """Frees the profile slot for the next pytest process (after the browser closed)."""
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    def _acquire(self) -> None:
+        """Locks the first profile slot not used by another running process."""
+        if self._lock is not None:
+            return
+        self.folder.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            # Sem lock de arquivo: pasta por processo (sempre inicia com cache frio)
+            self.path = self.folder / f"{self.name}-{os.getpid()}"
+            return
+        for slot in itertools.count():
+            name = self.name if slot == 0 else f"{self.name}-{slot}"
+            lock = open(self.folder / f"{name}.lock", "w")
+            try:
+                # Liberado pelo sistema se o processo terminar sem release()
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                continue
+            self.path, self._lock = self.folder / name, lock
+            return
+
+    def wipe_state(self) -> None:
+        """Removes cookies and storage from the profile, keeping the disk cache."""
+        for entry in STATE_ENTRIES:
+            target = self.path / entry
+            if target.is_dir():
+                shutil.rmtree(target, ignore_errors=True)
+            elif target.exists():
+                target.unlink()
+
+
+def _origin(url: str) -> Optional[str]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def reset_context_state(context: BrowserContext, browser_name: str) -> None:
+    """
+    Clears cookies, permissions and origin storage so the next test starts with a clean
+    state.
+
+    Args:
+        context (BrowserContext): Context shared between tests.
+        browser_name (str): chromium, firefox or webkit (`context.browser` is None for
+            persistent contexts).
+    """
+    pages = [
+        page
+        for page in context.pages
+        if not page.is_closed() and _origin(page.url) is not None
+    ]
+    for page in pages:
+        page.evaluate(CLEAR_STORAGE_SCRIPT)
+
+    if browser_name == "chromium" and context.pages:
+        # Também limpa as origens com storage de páginas já fechadas
+        origins: Set[str] = {_origin(page.url) for page in pages}
+        origins.update(
+            origin["origin"] for origin in context.storage_state()["origins"]
+        )
+        session = context.new_cdp_session(context.pages[0])
+        try:
+            for origin in origins:
+                session.send(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"},
+                )
+        finally:
+            session.detach()
+    context.clear_cookies()
+    context.clear_permissions()
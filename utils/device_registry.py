@@ -0,0 +1,156 @@
+"""
+Mobile Device Registry
+
+This module builds the mobile device profiles used by the tests from Playwright's
+device descriptors, and pools one browser context per device.
+
+Classes:
+    DeviceProfile:
+        Frozen, validated context options of a single device.
+
+    DeviceRegistry:
+        Selects devices by name from Playwright's descriptors and freezes their options.
+
+    DeviceContextPool:
+        Keeps one browser context per device, reused by every test of the worker.
+
+Behavior:
+    - Devices are selected by their Playwright name (e.g. 'Nexus 5', 'iPhone 13').
+      Devices list: https://github.com/microsoft/playwright/blob/main/packages/playwright-core/src/server/deviceDescriptorsSource.json
+    - Unknown names fail at session start with the list of valid names.
+    - `MOBILE_CONFIG` options from config.yaml are applied on top of every device.
+    - Options not supported by the running browser (`is_mobile` on Firefox) are dropped.
+"""
+
+import copy
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from playwright.sync_api import Browser, BrowserContext
+
+from .logger import log_allure
+
+UNSUPPORTED_OPTIONS = {"firefox": {"is_mobile"}}
+
+
+@dataclass(frozen=True)
+class DeviceProfile:
+    """
+    Context options of a device, computed once at session start.
+
+    Args:
+        name (str): Playwright device name.
+        default_browser_type (str): Browser the descriptor was captured with.
+        options (Mapping): Read-only options passed to `browser.new_context`.
+    """
+
+    name: str
+    default_browser_type: str
+    options: Mapping[str, Any]
+
+    def context_options(self) -> Dict[str, Any]:
+        """Returns a mutable copy of the options for `browser.new_context`."""
+        return copy.deepcopy(dict(self.options))
+
+
+class DeviceRegistry:
+    """
+    Registry of the device profiles selected for the session.
+
+    Args:
+        descriptors (dict): Playwright device descriptors (`playwright.devices`).
+        overrides (dict): Options applied on top of every device (MOBILE_CONFIG).
+        browser_name (str): Browser running the tests.
+    """
+
+    def __init__(
+        self,
+        descriptors: Dict[str, Dict],
+        overrides: Optional[Dict] = None,
+        browser_name: str = "chromium",
+    ):
+        self.descriptors = descriptors
+        self.overrides = overrides or {}
+        self.browser_name = browser_name
+        self._profiles: Mapping[str, DeviceProfile] = MappingProxyType({})
+
+    def select(self, names: Iterable[str]) -> "DeviceRegistry":
+        """
+        Validates and freezes the profiles of the given devices.
+
+        Raises:
+            ValueError: If a device name is not a Playwright descriptor.
+        """
+        names = list(names)
+        unknown = [name for name in names if name not in self.descriptors]
+        if unknown:
+            raise ValueError(
+                f"Unknown mobile devices: {unknown}. "
+                f"Valid options: {sorted(self.descriptors)}"
+            )
+        if not names:
+            raise ValueError("At least one mobile device must be selected")
+
+        self._profiles = MappingProxyType(
+            {name: self._build_profile(name) for name in names}
+        )
+        log_allure(f"Mobile devices selected: {names}")
+        return self
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._profiles)
+
+    @property
+    def default(self) -> DeviceProfile:
+        """The first selected device, used by the `mobile_page` fixture."""
+        return next(iter(self._profiles.values()))
+
+    def get(self, name: str) -> DeviceProfile:
+        """
+        Returns the profile of a selected device.
+
+        Raises:
+            KeyError: If the device was not selected for this session.
+        """
+        if name not in self._profiles:
+            raise KeyError(f"Device '{name}' is not selected. Selected: {self.names}")
+        return self._profiles[name]
+
+    def _build_profile(self, name: str) -> DeviceProfile:
+        options = copy.deepcopy(self.descriptors[name])
+        default_browser_type = options.pop("default_browser_type", "chromium")
+        options.update(copy.deepcopy(self.overrides))
+
+        for option in UNSUPPORTED_OPTIONS.get(self.browser_name, set()):
+            options.pop(option, None)
+
+        return DeviceProfile(name, default_browser_type, MappingProxyType(options))
+
+
+class DeviceContextPool:
+    """
+    Lazily creates and keeps one browser context per device.
+
+    Args:
+        browser (Browser): Browser of the worker.
+    """
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self._contexts: Dict[str, BrowserContext] = {}
+
+    def acquire(self, profile: DeviceProfile) -> BrowserContext:
+        """Returns the pooled context of the device, creating it on first use."""
+        if profile.name not in self._contexts:
+            self._contexts[profile.name] = self.browser.new_context(
+                **profile.context_options()
+            )
+        return self._contexts[profile.name]
+
+    def close_all(self) -> None:
+        """Closes every pooled context."""
+        for context in self._contexts.values():
+            context.close()
+        self._contexts.clear()
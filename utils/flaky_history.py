@@ -0,0 +1,153 @@
+"""
+Flaky Test History
+
+Stores the recent outcomes of every test across runs and scores how flaky it is, so the
+retry engine (`plugins/flaky.py`) only retries tests known to be flaky and the most
+unstable ones can be moved to a quarantine lane.
+
+Classes:
+    FlakyHistory:
+        Outcome window per test (JSON file), flakiness score and retry/quarantine policy.
+
+Outcomes:
+    - "p": passed on the first attempt.
+    - "f": failed (every attempt).
+    - "x": failed and then passed on a retry (flaky).
+
+Score:
+    (retried passes + pass/fail flips in the window) / window length, from 0 (stable,
+    including tests that always fail) to 1 (flips on every run).
+
+Behavior:
+    - A test is only retried or quarantined once its window holds at least `min_runs`
+      outcomes, so a single failure (a regression fixed in the next run) is not taken
+      for flakiness.
+    - Only this run's outcomes are kept in memory; `save()` re-reads the file and merges
+      them, so parallel lanes writing the same history do not drop each other's runs.
+    - The file is written atomically (temporary file + rename).
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Union
+
+PASSED = "p"
+FAILED = "f"
+FLAKY = "x"
+
+
+class FlakyHistory:
+    """
+    History of test outcomes.
+
+    Args:
+        path (str | Path): JSON file of the history.
+        window (int): Outcomes kept per test. Defaults to 20
+        retry_threshold (float): Minimum score to retry a failing test. Defaults to 0.1
+        quarantine_threshold (float): Minimum score to quarantine a test. Defaults to 0.3
+        max_retries (int): Retries of a known-flaky test. Defaults to 2
+        min_runs (int): Outcomes needed before a test is retried or quarantined.
+            Defaults to 5
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        window: int = 20,
+        retry_threshold: float = 0.1,
+        quarantine_threshold: float = 0.3,
+        max_retries: int = 2,
+        min_runs: int = 5,
+    ):
+        self.path = Path(path)
+        self.window = window
+        self.retry_threshold = retry_threshold
+        self.quarantine_threshold = quarantine_threshold
+        self.max_retries = max_retries
+        self.min_runs = min_runs
+        self.outcomes: Dict[str, str] = self._read()
+        self.new_outcomes: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_config(cls, get_config: dict) -> "FlakyHistory":
+        """Builds the history from the FLAKY section of config.yaml."""
+        settings = (get_config or {}).get("FLAKY") or {}
+        return cls(
+            settings.get("HISTORY_FILE", ".test_history/flaky_history.json"),
+            window=settings.get("WINDOW", 20),
+            retry_threshold=settings.get("RETRY_THRESHOLD", 0.1),
+            quarantine_threshold=settings.get("QUARANTINE_THRESHOLD", 0.3),
+            max_retries=settings.get("MAX_RETRIES", 2),
+            min_runs=settings.get("MIN_RUNS", 5),
+        )
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def score(self, nodeid: str) -> float:
+        outcomes = self.outcomes.get(nodeid, "")
+        if not outcomes:
+            return 0.0
+        settled = outcomes.replace(FLAKY, PASSED)
+        flips = sum(1 for a, b in zip(settled, settled[1:]) if a != b)
+        return round((outcomes.count(FLAKY) + flips) / len(outcomes), 3)
+
+    def has_enough_runs(self, nodeid: str) -> bool:
+        return len(self.outcomes.get(nodeid, "")) >= self.min_runs
+
+    def retries_for(self, nodeid: str) -> int:
+        """Retries of the test: only known-flaky tests are retried."""
+        if not self.has_enough_runs(nodeid):
+            return 0
+        return self.max_retries if self.score(nodeid) >= self.retry_threshold else 0
+
+    def is_quarantined(self, nodeid: str) -> bool:
+        return (
+            self.has_enough_runs(nodeid)
+            and self.score(nodeid) >= self.quarantine_threshold
+        )
+
+    def record(self, nodeid: str, outcome: str) -> None:
+        """Adds an outcome (PASSED, FAILED or FLAKY) of this run."""
+        self.new_outcomes.setdefault(nodeid, []).append(outcome)
+        self.outcomes[nodeid] = (self.outcomes.get(nodeid, "") + outcome)[
+            -self.window :
+        ]
+
+    def flaky_tests(self) -> Dict[str, float]:
+        """Score of the tests above the retry threshold, most flaky first."""
+        scores = {
+            nodeid: self.score(nodeid)
+            for nodeid in self.outcomes
+            if self.has_enough_runs(nodeid)
+        }
+        return dict(
+            sorted(
+                (item for item in scores.items() if item[1] >= self.retry_threshold),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        )
+
+    def save(self) -> None:
+        """Merges this run's outcomes into the file on disk and writes it atomically."""
+        if not self.new_outcomes:
+            return
+        merged = self._read()
+        for nodeid, outcomes in self.new_outcomes.items():
+            merged[nodeid] = (merged.get(nodeid, "") + "".join(outcomes))[
+                -self.window :
+            ]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump(merged, file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.outcomes = merged
+        self.new_outcomes = {}
@@ -0,0 +1,235 @@
+"""
+Change Impact Selector
+
+This module records which project files every test touches at runtime and uses that
+dependency graph to select only the tests impacted by a git diff.
+
+Classes:
+    ImpactSelector:
+        Records, stores and queries the test dependency graph.
+
+Functions:
+    track_dependency(path):
+        Records a file (page object, SQL script, ...) as touched by the running test.
+
+    track_class_dependency(cls):
+        Records the modules defining a class and its base classes.
+
+Behavior:
+    - Dependencies are collected per test from the fixtures it requested, the files
+      those fixtures are defined in, the classes of the fixture values (page objects,
+      database handlers) and the SQL scripts executed through `DatabaseManager`.
+    - The graph is stored in `.test_impact/dependency_graph.json` between runs. Each
+      xdist worker writes its own partial graph, merged by the controller at session end.
+    - Tests missing from the graph and changes to global files (config, pytest.ini,
+      requirements or unknown Python modules) always select the whole suite.
+"""
+
+import inspect
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .logger import log_info
+
+GRAPH_FOLDER = ".test_impact"
+GRAPH_FILE = "dependency_graph.json"
+GLOBAL_FILES = {"pytest.ini", "config.yaml", "requirements.txt"}
+
+_current_dependencies: Optional[Set[str]] = None
+
+
+def track_dependency(path) -> None:
+    """
+    Records a file as a dependency of the test currently running.
+
+    Args:
+        path (str | Path): File touched by the test. Ignored when no test is being recorded.
+    """
+    if _current_dependencies is not None:
+        _current_dependencies.add(str(Path(path).resolve()))
+
+
+def track_class_dependency(cls) -> None:
+    """
+    Records the files defining a class and all its base classes.
+
+    Args:
+        cls (type): Class used by the test, e.g. a page object or database handler.
+    """
+    if _current_dependencies is None:
+        return
+    for base in cls.__mro__:
+        source = _source_file(base)
+        if source:
+            track_dependency(source)
+
+
+class ImpactSelector:
+    """
+    Builds the test dependency graph and selects impacted tests from a git diff.
+
+    Args:
+        root_dir (Path): Project root; only files inside it are recorded.
+        graph_folder (str): Folder (relative to root_dir) where the graph is stored.
+    """
+
+    def __init__(self, root_dir: Path, graph_folder: str = GRAPH_FOLDER):
+        self.root_dir = Path(root_dir).resolve()
+        self.graph_folder = self.root_dir / graph_folder
+        self.graph_path = self.graph_folder / GRAPH_FILE
+        self.recorded: Dict[str, Dict[str, List[str]]] = {}
+
+    def load_graph(self) -> Dict[str, Dict[str, List[str]]]:
+        """Returns the stored graph as {nodeid: {"fixtures": [...], "files": [...]}}."""
+        if not self.graph_path.exists():
+            return {}
+        with open(self.graph_path, "r") as file:
+            return json.load(file)
+
+    def start_test(self) -> None:
+        """Starts recording the dependencies of a new test."""
+        global _current_dependencies
+        _current_dependencies = set()
+
+    def collect_item_dependencies(self, item) -> None:
+        """
+        Records the static dependencies of a test: its own file, the files defining the
+        fixtures it requested and the modules of the classes of its fixture values.
+        Must be called before teardown, while `item.funcargs` is still populated.
+        """
+        track_dependency(item.path)
+
+        for defs in item._fixtureinfo.name2fixturedefs.values():
+            source = _source_file(defs[-1].func)
+            if source:
+                track_dependency(source)
+
+        for value in (item.funcargs or {}).values():
+            track_class_dependency(type(value))
+
+    def stop_test(self, item) -> None:
+        """Finishes recording a test and stores its dependencies."""
+        global _current_dependencies
+        dependencies = _current_dependencies or set()
+        _current_dependencies = None
+
+        self.recorded[item.nodeid] = {
+            "fixtures": sorted(item.fixturenames),
+            "files": sorted(self._relative_files(dependencies)),
+        }
+
+    def save_partial(self, worker_id: str) -> None:
+        """Writes the dependencies recorded by this process to a partial graph file."""
+        if not self.recorded:
+            return
+        self.graph_folder.mkdir(parents=True, exist_ok=True)
+        with open(self.graph_folder / f"partial_{worker_id}.json", "w") as file:
+            json.dump(self.recorded, file)
+
+    def merge_partials(self) -> None:
+        """Merges every partial graph into the stored graph and removes the partials."""
+        partials = sorted(self.graph_folder.glob("partial_*.json"))
+        if not partials:
+            return
+
+        graph = self.load_graph()
+        for partial in partials:
+            with open(partial, "r") as file:
+                graph.update(json.load(file))
+            partial.unlink()
+
+        with open(self.graph_path, "w") as file:
+            json.dump(graph, file, indent=2, sort_keys=True)
+        log_info(f"Impact graph updated with {len(graph)} tests: {self.graph_path}")
+
+    def changed_files(self, base_ref: str) -> Set[str]:
+        """
+        Returns the files changed since `base_ref`, including uncommitted and untracked files.
+
+        Raises:
+            RuntimeError: If git is not available or the reference is invalid.
+        """
+        commands = [
+            ["git", "diff", "--name-only", base_ref],
+            ["git", "ls-files", "--others", "--exclude-standard"],
+        ]
+        changed = set()
+        for command in commands:
+            result = subprocess.run(
+                command, cwd=self.root_dir, capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"Could not list changed files with '{' '.join(command)}': "
+                    f"{result.stderr.strip()}"
+                )
+            changed.update(line.strip() for line in result.stdout.splitlines())
+        return {path for path in changed if path}
+
+    def select(self, items: Iterable, changed: Set[str]) -> Tuple[List, List]:
+        """
+        Splits the collected items into (selected, deselected) for the changed files.
+
+        Args:
+            items: Collected pytest items.
+            changed: Changed file paths relative to the project root.
+        """
+        items = list(items)
+        graph = self.load_graph()
+        known_files = {path for entry in graph.values() for path in entry["files"]}
+        test_files = {self._relative(item.path) for item in items}
+
+        if not graph or self._requires_full_run(changed, known_files, test_files):
+            return items, []
+
+        selected, deselected = [], []
+        for item in items:
+            entry = graph.get(item.nodeid)
+            if (
+                entry is None
+                or self._relative(item.path) in changed
+                or changed.intersection(entry["files"])
+            ):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        return selected, deselected
+
+    @staticmethod
+    def _requires_full_run(
+        changed: Set[str], known_files: Set[str], test_files: Set[str]
+    ) -> bool:
+        """A global file or a Python module the graph knows nothing about was changed."""
+        for path in changed:
+            if Path(path).name in GLOBAL_FILES:
+                return True
+            if (
+                path.endswith(".py")
+                and path not in known_files
+                and path not in test_files
+            ):
+                return True
+        return False
+
+    def _relative_files(self, paths: Iterable[str]) -> Set[str]:
+        relative = set()
+        for path in paths:
+            if "site-packages" in Path(path).parts:
+                continue  # Virtualenvs created inside the project
+            try:
+                relative.add(self._relative(path))
+            except ValueError:
+                continue  # Outside the project (stdlib, global packages)
+        return relative
+
+    def _relative(self, path) -> str:
+        return Path(path).resolve().relative_to(self.root_dir).as_posix()
+
+
+def _source_file(obj) -> Optional[str]:
+    try:
+        return inspect.getsourcefile(obj)
+    except TypeError:
+        return None  # Builtins have no source file
@@ -0,0 +1,226 @@
+"""
+Browser Launch Profiles
+
+Named browser launch settings (LAUNCH_PROFILES in config.yaml, e.g. `ci-fast` and
+`debug`) and the launch time / memory measurements used to compare them.
+
+Classes:
+    LaunchMeter:
+        Measures the launch time and memory of a browser and records them on close.
+
+Functions:
+    get_profile(profiles, name):
+        Settings of a profile, with a clear error for unknown names.
+    launch_options(profile, headless, browser_name):
+        Keyword arguments of `launch` / `launch_persistent_context` for a profile.
+    browser_rss(pid=None):
+        Resident memory (bytes) of the browser processes started by this process.
+    record_launch(path, entry):
+        Appends the measurements of a launch to the history (JSON lines).
+    summarize(path):
+        Median launch time, memory and failure rate of each profile in the history.
+
+Profile keys:
+    ARGS: Chromium switches (other browsers do not receive them).
+    HEADLESS_SHELL: Headless runs use the lightweight chromium headless shell (true) or
+        the full chromium in the new headless mode (false).
+    DEV_SHM: false adds `--disable-dev-shm-usage`, for containers with a small /dev/shm.
+    SLOW_MO: Delay (ms) between actions, only applied when the browser is visible.
+
+Behavior:
+    - Memory is read from /proc: the Playwright driver is a child of this process and the
+      browser processes are its descendants, so each xdist worker only counts its own
+      browser. Where /proc is not available the memory is recorded as null.
+    - The history is append-only (one line per launch, written in a single call), so
+      workers running at the same time never overwrite each other.
+"""
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+DEFAULT_PROFILE = {
+    "ARGS": ["--disable-gpu", "--no-sandbox"],
+    "HEADLESS_SHELL": True,
+    "DEV_SHM": True,
+    "SLOW_MO": 100,
+}
+
+
+def get_profile(profiles: Optional[Dict], name: str) -> Dict:
+    """Settings of the profile `name`, over the defaults."""
+    profiles = profiles or {}
+    if name not in profiles:
+        if name == "default":
+            return dict(DEFAULT_PROFILE)
+        raise ValueError(
+            f"Unknown launch profile '{name}'. Valid options: {list(profiles)}"
+        )
+    return {**DEFAULT_PROFILE, **(profiles[name] or {})}
+
+
+def launch_options(profile: Dict, headless: bool, browser_name: str) -> Dict:
+    """Launch options of a profile for the given browser."""
+    options = {
+        "headless": headless,
+        "slow_mo": 0 if headless else profile["SLOW_MO"],
+    }
+    if browser_name != "chromium":
+        return options
+
+    args = list(profile["ARGS"])
+    if not profile["DEV_SHM"] and "--disable-dev-shm-usage" not in args:
+        args.append("--disable-dev-shm-usage")
+    options["args"] = args
+    if headless and not profile["HEADLESS_SHELL"]:
+        # Chromium completo no novo modo headless em vez do headless shell (padrão)
+        options["channel"] = "chromium"
+    return options
+
+
+def _parent_pids() -> Dict[int, int]:
+    parents = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat") as file:
+                stat = file.read()
+        except OSError:
+            continue
+        # O nome do processo (entre parênteses) pode conter espaços
+        parents[int(entry.name)] = int(stat[stat.rfind(")") + 2 :].split()[1])
+    return parents
+
+
+def _rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def browser_rss(pid: Optional[int] = None) -> Optional[int]:
+    """
+    Sums the resident memory of the descendants of the Playwright driver (children of
+    `pid`, this process by default), i.e. the browser processes. None without /proc.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    pid = pid or os.getpid()
+    children: Dict[int, List[int]] = {}
+    for child, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(child)
+
+    # Filhos diretos são o driver do Playwright; o navegador fica abaixo dele
+    pending = [
+        grandchild
+        for child in children.get(pid, [])
+        for grandchild in children.get(child, [])
+    ]
+    total = 0
+    while pending:
+        current = pending.pop()
+        total += _rss(current)
+        pending.extend(children.get(current, []))
+    return total
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / 1024 / 1024, 1)
+
+
+class LaunchMeter:
+    """
+    Launch time and memory of one browser of a profile.
+
+    Args:
+        profile (str): Name of the launch profile.
+        browser_name (str): chromium, firefox or webkit.
+        headless (bool): Headless or visible browser.
+    """
+
+    def __init__(self, profile: str, browser_name: str, headless: bool):
+        self.profile = profile
+        self.browser_name = browser_name
+        self.headless = headless
+        self.launch_ms = 0.0
+        self._before: Optional[int] = None
+        self.rss: Optional[int] = None
+
+    def measure(self, launch, *args, **options):
+        """Calls `launch(*args, **options)` and measures it; returns the launched browser."""
+        self._before = browser_rss()
+        start = time.perf_counter()
+        launched = launch(*args, **options)
+        self.launch_ms = (time.perf_counter() - start) * 1000
+        self.rss = self._memory()
+        return launched
+
+    def _memory(self) -> Optional[int]:
+        # Desconta navegadores lançados antes pelo mesmo processo
+        current = browser_rss()
+        if current is None or self._before is None:
+            return None
+        return max(current - self._before, 0)
+
+    def entry(self, tests: int, failed: int) -> Dict:
+        """Measurements of the launch, with the memory at the end of the session."""
+        return {
+            "time": time.time(),
+            "profile": self.profile,
+            "browser": self.browser_name,
+            "mode": "headless" if self.headless else "headed",
+            "launch_ms": round(self.launch_ms, 1),
+            "rss_mb": _mb(self.rss),
+            "end_rss_mb": _mb(self._memory()),
+            "tests": tests,
+            "failed": failed,
+        }
+
+
+def record_launch(path: Union[str, Path], entry: Dict) -> None:
+    """Appends a launch to the history."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as file:
+        file.write(json.dumps(entry) + "\n")
+
+
+def summarize(path: Union[str, Path]) -> Dict[str, Dict]:
+    """Median launch time and memory and failure rate of each profile/browser."""
+    grouped: Dict[str, List[Dict]] = {}
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                key = f"{entry['profile']} ({entry['browser']}, {entry['mode']})"
+                grouped.setdefault(key, []).append(entry)
+
+    summary = {}
+    for key, entries in grouped.items():
+        memory = [entry["rss_mb"] for entry in entries if entry["rss_mb"] is not None]
+        end = [
+            entry["end_rss_mb"] for entry in entries if entry["end_rss_mb"] is not None
+        ]
+        tests = sum(entry["tests"] for entry in entries)
+        summary[key] = {
+            "launches": len(entries),
+            "launch_ms": round(statistics.median(e["launch_ms"] for e in entries), 1),
+            "rss_mb": round(statistics.median(memory), 1) if memory else None,
+            "end_rss_mb": round(statistics.median(end), 1) if end else None,
+            "tests": tests,
+            "failure_rate": (
+                round(sum(entry["failed"] for entry in entries) / tests, 3)
+                if tests
+                else None
+            ),
+        }
+    return summary
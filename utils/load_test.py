@@ -0,0 +1,339 @@
+"""
+Load Test Engine
+
+Runs the page-object flows (HomePage, LoginPage, ...) as concurrent virtual users to
+measure the application under load. Used by `load_runner.py`.
+
+Classes:
+    LatencyHistogram:
+        Log-bucketed latency histogram (~5% resolution) that merges across threads and
+        processes without keeping every sample.
+
+    LoadStats:
+        Histograms per step and per flow, error counts and run duration.
+
+    TimedPageObject:
+        Proxy around a page object that times every public method call as a step
+        (e.g. "HomePage.navigate").
+
+    Slo:
+        Service level objective such as "HomePage.navigate:p95<2000" or "error_rate<0.01".
+
+Functions:
+    run_process(process_index, plan):
+        Runs the virtual users assigned to a process, one thread per user.
+
+Behavior:
+    - Each process launches one chromium and its virtual users share it: every user
+      thread connects to it over CDP and runs each iteration in a new (lightweight)
+      context. The Playwright sync API is not thread-safe, so each thread still has its
+      own Playwright connection (a driver process, much lighter than a browser), which
+      keeps the page objects of the suite usable as they are.
+    - Firefox and WebKit have no CDP endpoint: there each virtual user launches its own
+      browser.
+    - Users start spread over the ramp-up period; the schedule uses wall-clock time so
+      users of several processes ramp up together.
+"""
+
+import math
+import re
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from .EnvironmentConfig import EnvironmentConfig
+
+BUCKET_GROWTH = 1.1
+_SLO = re.compile(
+    r"^(?:(?P<step>[^:<>]+):)?(?P<metric>\w+)\s*(?P<op>[<>])\s*(?P<value>[\d.]+)$"
+)
+
+
+class LatencyHistogram:
+    """Latency histogram in milliseconds with logarithmic buckets."""
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, ms: float) -> None:
+        bucket = int(math.log(max(ms, 0.01), BUCKET_GROWTH))
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Approximate percentile (geometric middle of the bucket)."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                value = BUCKET_GROWTH ** (bucket + 0.5)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def bars(self, rows: int = 8, width: int = 30) -> List[str]:
+        """ASCII histogram grouped in `rows` ranges."""
+        if not self.count:
+            return []
+        low, high = min(self.buckets), max(self.buckets)
+        step = max(1, math.ceil((high - low + 1) / rows))
+        lines = []
+        for start in range(low, high + 1, step):
+            count = sum(self.buckets.get(b, 0) for b in range(start, start + step))
+            bar = "#" * round(width * count / self.count)
+            lines.append(
+                f"{BUCKET_GROWTH ** start:9.0f} - {BUCKET_GROWTH ** (start + step):9.0f} ms "
+                f"| {bar} {count}"
+            )
+        return lines
+
+
+@dataclass
+class LoadStats:
+    """Latencies and errors of a load run."""
+
+    steps: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    flows: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    started: float = 0.0
+    finished: float = 0.0
+
+    def record_step(self, name: str, ms: float) -> None:
+        self.steps.setdefault(name, LatencyHistogram()).record(ms)
+
+    def record_flow(self, name: str, ms: float) -> None:
+        self.flows.setdefault(name, LatencyHistogram()).record(ms)
+
+    def record_error(self, name: str, error: Exception) -> None:
+        key = f"{name}: {type(error).__name__}"
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def merge(self, other: "LoadStats") -> None:
+        for target, source in ((self.steps, other.steps), (self.flows, other.flows)):
+            for name, histogram in source.items():
+                target.setdefault(name, LatencyHistogram()).merge(histogram)
+        for key, count in other.errors.items():
+            self.errors[key] = self.errors.get(key, 0) + count
+        self.started = min(filter(None, (self.started, other.started)), default=0.0)
+        self.finished = max(self.finished, other.finished)
+
+    @property
+    def duration(self) -> float:
+        return max(self.finished - self.started, 1e-9)
+
+    @property
+    def iterations(self) -> int:
+        return sum(histogram.count for histogram in self.flows.values())
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        total = self.iterations + self.error_count
+        return self.error_count / total if total else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Successful flow iterations per second."""
+        return self.iterations / self.duration
+
+
+class TimedPageObject:
+    """
+    Wraps a page object so each public method call is recorded as a step.
+
+    Args:
+        page_object: HomePage, LoginPage or any other BasePage subclass instance.
+        stats (LoadStats): Where the step latencies are recorded.
+    """
+
+    def __init__(self, page_object, stats: LoadStats):
+        self._page_object = page_object
+        self._stats = stats
+        self._prefix = type(page_object).__name__
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._page_object, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = attribute(*args, **kwargs)
+            self._stats.record_step(
+                f"{self._prefix}.{name}", (time.perf_counter() - start) * 1000
+            )
+            return result
+
+        return timed
+
+
+@dataclass(frozen=True)
+class Slo:
+    """Objective over a step/flow percentile ("<step>:p95<2000") or the whole run."""
+
+    step: Optional[str]
+    metric: str
+    op: str
+    value: float
+
+    @classmethod
+    def parse(cls, text: str) -> "Slo":
+        match = _SLO.match(text.strip())
+        if not match:
+            raise ValueError(
+                f"Invalid SLO '{text}', e.g. 'HomePage.navigate:p95<2000', 'error_rate<0.01'"
+            )
+        return cls(match["step"], match["metric"], match["op"], float(match["value"]))
+
+    def measure(self, stats: LoadStats) -> Optional[float]:
+        if self.step is None:
+            return getattr(stats, self.metric, None)
+        histogram = stats.steps.get(self.step) or stats.flows.get(self.step)
+        if histogram is None:
+            return None
+        if self.metric.startswith("p"):
+            return histogram.percentile(float(self.metric[1:]))
+        return getattr(histogram, self.metric, None)
+
+    def breached(self, stats: LoadStats) -> bool:
+        value = self.measure(stats)
+        if value is None:
+            return True
+        return not (value < self.value if self.op == "<" else value > self.value)
+
+    def __str__(self) -> str:
+        step = f"{self.step}:" if self.step else ""
+        return f"{step}{self.metric}{self.op}{self.value:g}"
+
+
+@dataclass(frozen=True)
+class LoadPlan:
+    """Settings of a load run, shared by every process."""
+
+    flows: Sequence[Callable]
+    env_name: str
+    variables: Dict[str, str]
+    users: int
+    processes: int
+    ramp_up: float
+    duration: float
+    iterations: int
+    browser: str
+    context_options: Dict
+    start_at: float
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def _shared_browser(plan: LoadPlan) -> Iterator[Optional[str]]:
+    """Launches the chromium shared by the users of the process; yields its CDP endpoint."""
+    if plan.browser != "chromium":
+        yield None
+        return
+
+    from playwright.sync_api import sync_playwright
+
+    port = _free_port()
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=True, args=[f"--remote-debugging-port={port}"]
+        )
+        try:
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            browser.close()
+
+
+def _virtual_user(
+    user: int, plan: LoadPlan, stats: LoadStats, endpoint: Optional[str]
+) -> None:
+    from playwright.sync_api import sync_playwright
+
+    env_config = EnvironmentConfig(plan.env_name, plan.variables, True)
+    time.sleep(max(0.0, plan.start_at + plan.ramp_up * user / plan.users - time.time()))
+    deadline = time.time() + plan.duration
+    with sync_playwright() as playwright:
+        browser_type = getattr(playwright, plan.browser)
+        if endpoint:
+            browser = browser_type.connect_over_cdp(endpoint)
+        else:
+            browser = browser_type.launch(headless=True)
+        try:
+            iteration = 0
+            while time.time() < deadline and (
+                not plan.iterations or iteration < plan.iterations
+            ):
+                flow = plan.flows[(user + iteration) % len(plan.flows)]
+                context = browser.new_context(**plan.context_options)
+                try:
+                    page = context.new_page()
+                    start = time.perf_counter()
+                    flow(page, env_config, lambda po: TimedPageObject(po, stats))
+                    stats.record_flow(
+                        flow.__name__, (time.perf_counter() - start) * 1000
+                    )
+                except Exception as error:
+                    stats.record_error(flow.__name__, error)
+                finally:
+                    context.close()
+                iteration += 1
+        finally:
+            # Conectado por CDP, só desconecta: o navegador compartilhado continua aberto
+            browser.close()
+
+
+def run_process(process_index: int, plan: LoadPlan) -> LoadStats:
+    """Runs the users assigned to the process (index, index + processes, ...)."""
+    users = range(process_index, plan.users, plan.processes)
+    per_user = {user: LoadStats() for user in users}
+    stats = LoadStats(started=plan.start_at)
+    with _shared_browser(plan) as endpoint:
+        threads = [
+            threading.Thread(
+                target=_virtual_user,
+                args=(user, plan, per_user[user], endpoint),
+                daemon=True,
+            )
+            for user in users
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    stats.finished = time.time()
+
+    for user_stats in per_user.values():
+        stats.merge(user_stats)
+    return stats
@@ -0,0 +1,200 @@
+"""
+Network Record/Replay
+
+Records the backend API responses seen by a test (Playwright routing) into a per-test
+compressed store and serves them back without network, so frontend-focused suites run
+fast and deterministically on isolated CI machines.
+
+Classes:
+    NetworkRecorder:
+        Routes the requests of a page, recording or replaying them from the store.
+
+Modes:
+    - "record": every matching request goes to the network and its response is stored.
+    - "replay": responses are served from the store; requests not recorded are aborted
+      and the recording is marked as stale.
+    - "auto": replays fresh recordings; missing, stale or expired recordings are
+      re-recorded, and requests missing from a recording are fetched and added to it.
+
+Behavior:
+    - Requests are matched by method, URL and the hash of the request body.
+    - Only the resource types in `resource_types` (default xhr and fetch) are recorded;
+      documents, scripts and images still load normally unless added to the list.
+    - One `<test>.json.gz` file per test in the store folder, written when the test ends
+      and only if something changed.
+    - A recording is stale when it is older than `max_age_days` or when a replay missed
+      a request; `stale_recordings()` lists them for a selective re-record.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from playwright.sync_api import Error, Page, Route
+
+from .logger import log_info
+
+MODES = ("off", "record", "replay", "auto")
+# Cabeçalhos que não valem para o corpo já decodificado pelo Playwright
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    body_hash = hashlib.sha1(body or b"").hexdigest()
+    return hashlib.sha1(f"{method} {url} {body_hash}".encode()).hexdigest()
+
+
+def recording_path(folder: Union[str, Path], nodeid: str) -> Path:
+    safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in nodeid)
+    return Path(folder) / f"{safe_name}.json.gz"
+
+
+def stale_recordings(folder: Union[str, Path], max_age_days: float = 30) -> List[str]:
+    """Tests (node ids) whose recordings are stale or expired."""
+    stale = []
+    for path in sorted(Path(folder).glob("*.json.gz")):
+        with gzip.open(path, "rt") as file:
+            store = json.load(file)
+        if store.get("stale") or _expired(store, max_age_days):
+            stale.append(store["test"])
+    return stale
+
+
+def _expired(store: Dict, max_age_days: float) -> bool:
+    return time.time() - store.get("recorded_at", 0) > max_age_days * 86400
+
+
+class NetworkRecorder:
+    """
+    Record/replay of the network of a page during one test.
+
+    Args:
+        page (Page): Page whose requests are routed.
+        path (str | Path): Store file of the test (see `recording_path`).
+        nodeid (str): Test node id, kept in the store.
+        mode (str): "record", "replay" or "auto".
+        url_pattern (str): Glob of the routed URLs. Defaults to "**/*"
+        resource_types (Sequence[str]): Recorded resource types. Defaults to xhr, fetch
+        max_age_days (float): Age after which "auto" re-records. Defaults to 30
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        path: Union[str, Path],
+        nodeid: str,
+        mode: str,
+        url_pattern: str = "**/*",
+        resource_types: Sequence[str] = ("xhr", "fetch"),
+        max_age_days: float = 30,
+    ):
+        if mode not in MODES[1:]:
+            raise ValueError(f"Network mode '{mode}' is not supported: {MODES}")
+        self.page = page
+        self.path = Path(path)
+        self.nodeid = nodeid
+        self.url_pattern = url_pattern
+        self.resource_types = set(resource_types)
+        self.entries: Dict[str, Dict] = {}
+        self.stale = False
+        self.changed = False
+        self.hits = 0
+        self.misses: List[str] = []
+
+        store = self._read()
+        if mode == "auto":
+            fresh = (
+                store and not store.get("stale") and not _expired(store, max_age_days)
+            )
+            mode = "replay" if fresh else "record"
+            self.lenient = True
+        else:
+            self.lenient = False
+        self.mode = mode
+        self.recorded_at = time.time()
+        if mode == "replay" and store:
+            self.entries = store["entries"]
+            # Completar uma gravação não renova a data original
+            self.recorded_at = store["recorded_at"]
+
+    def _read(self) -> Optional[Dict]:
+        try:
+            with gzip.open(self.path, "rt") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def start(self) -> "NetworkRecorder":
+        self.page.route(self.url_pattern, self._handle)
+        return self
+
+    def stop(self) -> None:
+        """Removes the route and writes the store if it changed."""
+        try:
+            self.page.unroute(self.url_pattern, self._handle)
+        except Error:
+            pass  # Página já fechada
+        if self.changed:
+            self.save()
+        log_info(
+            f"Network {self.mode}: {len(self.entries)} responses, {self.hits} replayed, "
+            f"{len(self.misses)} missing ({self.path.name})"
+        )
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        if request.resource_type not in self.resource_types:
+            route.fallback()
+            return
+
+        key = request_key(request.method, request.url, request.post_data_buffer)
+        entry = self.entries.get(key) if self.mode == "replay" else None
+        if entry:
+            self.hits += 1
+            route.fulfill(
+                status=entry["status"],
+                headers=entry["headers"],
+                body=base64.b64decode(entry["body"]),
+            )
+            return
+
+        if self.mode == "replay" and not self.lenient:
+            # Offline: a gravação não cobre a requisição e precisa ser refeita
+            self.misses.append(f"{request.method} {request.url}")
+            self.stale = self.changed = True
+            route.abort("internetdisconnected")
+            return
+
+        if self.mode == "replay":
+            self.misses.append(f"{request.method} {request.url}")
+        response = route.fetch()
+        body = response.body()
+        self.entries[key] = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+            "body": base64.b64encode(body).decode(),
+        }
+        self.changed = True
+        route.fulfill(response=response, body=body)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        store = {
+            "test": self.nodeid,
+            "recorded_at": self.recorded_at,
+            "stale": self.stale,
+            "misses": self.misses if self.stale else [],
+            "entries": self.entries,
+        }
+        with gzip.open(self.path, "wt", compresslevel=6) as file:
+            json.dump(store, file)
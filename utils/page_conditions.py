@@ -0,0 +1,268 @@
+"""
+Page Conditions
+
+Composite page assertions evaluated inside the browser: several selectors, text
+patterns and URL conditions are checked together by a single `page.wait_for_function`,
+instead of Python loops polling `is_visible` / `get_text` with sleeps.
+
+Classes:
+    Condition:
+        One condition of the page state (frozen), built with the functions below.
+    ConditionsNotMet:
+        AssertionError raised when the conditions are not all true before the timeout.
+
+Functions:
+    visible(selector) / hidden(selector):
+        At least one / none of the elements of a CSS selector is visible.
+    has_text(selector, pattern):
+        An element of the selector has a text containing `pattern` (str) or matching it
+        (compiled regular expression).
+    count(selector, expected):
+        Number of elements of the selector.
+    url_matches(pattern):
+        Current URL contains / matches `pattern`.
+    wait_for_conditions(page, conditions, timeout):
+        Waits until all conditions are true at the same time; returns how long each one
+        took to become true (ms).
+    configure_timeouts(timeout, page_timeouts) / default_timeout(page_class):
+        Default timeout of the assertions of each page class (config TIMEOUT and
+        PAGE_TIMEOUTS).
+
+Behavior:
+    - Conditions are re-evaluated on every animation frame, all in one browser call; the
+      time of each one is counted from the first evaluation in the browser until it
+      became (and stayed) true, so a flickering condition reports its last transition.
+      Both times come from the browser clock (`performance.timeOrigin + now()`), so the
+      round trip from Python is not counted.
+    - Selectors are CSS selectors (`document.querySelectorAll`); visibility follows
+      Playwright: a non-empty bounding box and no `visibility: hidden`.
+    - Regular expression flags IGNORECASE and MULTILINE are passed to the browser; other
+      flags raise ValueError, as JavaScript has no equivalent.
+    - A navigation during the wait is fine: the conditions are evaluated again on the new
+      document and the start time is kept in sessionStorage. After a navigation to
+      another origin (no access to that storage) times are counted from the first
+      evaluation on the new document.
+"""
+
+import re
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Pattern, Sequence, Union
+
+from .logger import log_allure
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+_default_timeout = 15000
+_page_timeouts: Dict[str, int] = {}
+
+# Flags de expressão regular com equivalente em JavaScript (re.UNICODE é o padrão de str)
+REGEX_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m"}
+
+CONDITIONS_SCRIPT = """(spec) => {
+  const now = performance.timeOrigin + performance.now();
+  const state = (window.__pageConditions = window.__pageConditions || {});
+  const key = "__pageConditions:" + spec.id;
+  if (!state[spec.id]) {
+    // Início da espera no sessionStorage: mantido após uma navegação na mesma origem
+    let started = now;
+    try {
+      started = Number(sessionStorage.getItem(key)) || now;
+      sessionStorage.setItem(key, String(started));
+    } catch (error) {}
+    state[spec.id] = { started: started, since: {} };
+  }
+  const since = state[spec.id].since;
+  const elapsed = now - state[spec.id].started;
+  const finish = () => {
+    delete state[spec.id];
+    try {
+      sessionStorage.removeItem(key);
+    } catch (error) {}
+  };
+  const matches = (value, pattern) =>
+    pattern.regex
+      ? new RegExp(pattern.source, pattern.flags).test(value)
+      : value.includes(pattern.source);
+  const isVisible = (element) => {
+    const rect = element.getBoundingClientRect();
+    return (
+      rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden"
+    );
+  };
+  const met = spec.conditions.map((condition, index) => {
+    const elements = condition.selector
+      ? Array.from(document.querySelectorAll(condition.selector))
+      : [];
+    let ok = false;
+    if (condition.kind === "visible") ok = elements.some(isVisible);
+    else if (condition.kind === "hidden") ok = !elements.some(isVisible);
+    else if (condition.kind === "text")
+      ok = elements.some((element) =>
+        matches(element.innerText || element.textContent || "", condition.pattern)
+      );
+    else if (condition.kind === "count") ok = elements.length === condition.count;
+    else if (condition.kind === "url") ok = matches(location.href, condition.pattern);
+    if (!ok) delete since[index];
+    else if (!(index in since)) since[index] = elapsed;
+    return ok;
+  });
+  if (spec.report) {
+    finish();
+    return { met: met, since: since };
+  }
+  if (!met.every(Boolean)) return false;
+  finish();
+  return since;
+}"""
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    A condition of the page state.
+
+    Args:
+        kind (str): visible, hidden, text, count or url.
+        selector (str): CSS selector (not used by url). Defaults to None
+        pattern (str | Pattern): Text or URL pattern. Defaults to None
+        expected (int): Element count of `count`. Defaults to None
+    """
+
+    kind: str
+    selector: Optional[str] = None
+    pattern: Union[str, Pattern, None] = None
+    expected: Optional[int] = None
+
+    def __post_init__(self):
+        if isinstance(self.pattern, re.Pattern):
+            unsupported = self.pattern.flags & ~(re.UNICODE | sum(REGEX_FLAGS))
+            if unsupported:
+                raise ValueError(
+                    f"Regular expression flags {re.RegexFlag(unsupported)!r} are not "
+                    "supported in the browser (only IGNORECASE and MULTILINE)"
+                )
+
+    def __str__(self) -> str:
+        pattern = getattr(self.pattern, "pattern", self.pattern)
+        if self.kind == "url":
+            return f"url ~ {pattern!r}"
+        if self.kind == "text":
+            return f"{self.selector} text ~ {pattern!r}"
+        if self.kind == "count":
+            return f"{self.selector} count == {self.expected}"
+        return f"{self.selector} {self.kind}"
+
+    def to_spec(self) -> Dict:
+        """Serializable form evaluated by the browser."""
+        spec = {"kind": self.kind, "selector": self.selector, "count": self.expected}
+        if isinstance(self.pattern, re.Pattern):
+            flags = "".join(
+                letter
+                for flag, letter in REGEX_FLAGS.items()
+                if self.pattern.flags & flag
+            )
+            spec["pattern"] = {
+                "regex": True,
+                "source": self.pattern.pattern,
+                "flags": flags,
+            }
+        elif self.pattern is not None:
+            spec["pattern"] = {"regex": False, "source": self.pattern}
+        return spec
+
+
+class ConditionsNotMet(AssertionError):
+    """The page did not reach the expected state before the timeout."""
+
+
+def visible(selector: str) -> Condition:
+    return Condition("visible", selector)
+
+
+def hidden(selector: str) -> Condition:
+    return Condition("hidden", selector)
+
+
+def has_text(selector: str, pattern: Union[str, Pattern]) -> Condition:
+    return Condition("text", selector, pattern)
+
+
+def count(selector: str, expected: int) -> Condition:
+    return Condition("count", selector, expected=expected)
+
+
+def url_matches(pattern: Union[str, Pattern]) -> Condition:
+    return Condition("url", pattern=pattern)
+
+
+def configure_timeouts(
+    timeout: Optional[int], page_timeouts: Optional[Dict[str, int]] = None
+) -> None:
+    """Sets the default timeout (config TIMEOUT) and the timeouts per page class name."""
+    global _default_timeout, _page_timeouts
+    if timeout:
+        _default_timeout = int(timeout)
+    _page_timeouts = dict(page_timeouts or {})
+
+
+def default_timeout(page_class: type) -> int:
+    """
+    Timeout (ms) of the assertions of a page class: PAGE_TIMEOUTS of the class (or of
+    the closest base class), otherwise the `timeout_factor` of the class times TIMEOUT.
+    """
+    for cls in page_class.__mro__:
+        if cls.__name__ in _page_timeouts:
+            return int(_page_timeouts[cls.__name__])
+    return int(_default_timeout * getattr(page_class, "timeout_factor", 1))
+
+
+def wait_for_conditions(
+    page: "Page", conditions: Sequence[Condition], timeout: int
+) -> Dict[str, float]:
+    """
+    Waits in the browser until every condition is true.
+
+    Returns:
+        Dict[str, float]: Milliseconds each condition took to become true.
+
+    Raises:
+        ConditionsNotMet: With the conditions still false when the timeout expired.
+    """
+    # Importado aqui: configure_timeouts roda no início de toda sessão do pytest
+    from playwright.sync_api import Error as PlaywrightError
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    spec = {
+        "id": uuid.uuid4().hex,
+        "conditions": [condition.to_spec() for condition in conditions],
+    }
+    try:
+        handle = page.wait_for_function(
+            CONDITIONS_SCRIPT, arg=spec, polling="raf", timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        try:
+            state = page.evaluate(CONDITIONS_SCRIPT, {**spec, "report": True})
+            failing = [
+                str(condition)
+                for condition, met in zip(conditions, state["met"])
+                if not met
+            ]
+        except PlaywrightError:
+            failing = [str(condition) for condition in conditions]
+        raise ConditionsNotMet(
+            f"Page conditions not met after {timeout} ms: {', '.join(failing)}"
+        ) from None
+
+    since = handle.json_value()
+    timings = {
+        str(condition): float(since.get(str(index), 0))
+        for index, condition in enumerate(conditions)
+    }
+    log_allure(
+        "\n".join(f"{name}: {ms:.0f} ms" for name, ms in timings.items()),
+        "Condition timings",
+    )
+    return timings
@@ -0,0 +1,205 @@
+"""
+Page Diagnostics Collector
+
+Keeps what is needed to debug a failed UI test without re-running it with tracing:
+console messages, page errors and the last network responses of the page, plus a
+compressed DOM snapshot taken at failure time.
+
+Classes:
+    PageDiagnostics:
+        Bounded ring buffers filled by the page events, dumped when a test fails.
+
+Behavior:
+    - The buffers are `deque(maxlen=...)`, so memory stays bounded however long the page
+      lives; only response metadata (method, url, status, resource type) is kept, never
+      bodies.
+    - Event handlers only append a small tuple; the time spent in them is measured and
+      reported as `overhead_ms` in every dump.
+    - `dump()` writes `<name>.json` (buffers) and `<name>.html.gz` (DOM) and attaches
+      both to the Allure report.
+    - A page gets a single collector (`PageDiagnostics.attach` is idempotent), so pages
+      shared between tests keep one set of listeners.
+
+Example:
+    diagnostics = PageDiagnostics.attach(page)
+    ...
+    diagnostics.dump("reports/diagnostics", "test_login")
+"""
+
+import gzip
+import json
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Dict, Union
+
+import allure
+from playwright.sync_api import ConsoleMessage, Error, Page, Request, Response
+
+from .logger import log_info
+
+
+class PageDiagnostics:
+    """
+    Ring buffers of the diagnostics events of a page.
+
+    Args:
+        page (Page): Page to watch.
+        max_console (int): Console messages kept. Defaults to 200
+        max_errors (int): Page errors kept. Defaults to 50
+        max_responses (int): Network responses kept. Defaults to 100
+    """
+
+    _attached: "weakref.WeakKeyDictionary[Page, PageDiagnostics]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        page: Page,
+        max_console: int = 200,
+        max_errors: int = 50,
+        max_responses: int = 100,
+    ):
+        self.page = page
+        self.console = deque(maxlen=max_console)
+        self.errors = deque(maxlen=max_errors)
+        self.responses = deque(maxlen=max_responses)
+        self.failed_requests = deque(maxlen=max_responses)
+        self.events = 0
+        self._handler_seconds = 0.0
+
+    @classmethod
+    def attach(cls, page: Page, **limits) -> "PageDiagnostics":
+        """Returns the collector of the page, registering the listeners on first use."""
+        diagnostics = cls._attached.get(page)
+        if diagnostics is None:
+            diagnostics = cls(page, **limits)
+            page.on("console", diagnostics._on_console)
+            page.on("pageerror", diagnostics._on_page_error)
+            page.on("response", diagnostics._on_response)
+            page.on("requestfailed", diagnostics._on_request_failed)
+            cls._attached[page] = diagnostics
+        return diagnostics
+
+    def _done(self, start: float) -> None:
+        self.events += 1
+        self._handler_seconds += time.perf_counter() - start
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        start = time.perf_counter()
+        self.console.append((time.time(), message.type, message.text))
+        self._done(start)
+
+    def _on_page_error(self, error: Error) -> None:
+        start = time.perf_counter()
+        self.errors.append((time.time(), error.name, error.message))
+        self._done(start)
+
+    def _on_response(self, response: Response) -> None:
+        start = time.perf_counter()
+        request = response.request
+        self.responses.append(
+            (
+                time.time(),
+                request.method,
+                response.url,
+                response.status,
+                request.resource_type,
+            )
+        )
+        self._done(start)
+
+    def _on_request_failed(self, request: Request) -> None:
+        start = time.perf_counter()
+        self.failed_requests.append(
+            (time.time(), request.method, request.url, request.failure)
+        )
+        self._done(start)
+
+    @property
+    def overhead_ms(self) -> float:
+        """Time spent in the event handlers since the last reset."""
+        return round(self._handler_seconds * 1000, 3)
+
+    def reset(self) -> None:
+        """Clears the buffers (start of a test on a shared page)."""
+        for buffer in (self.console, self.errors, self.responses, self.failed_requests):
+            buffer.clear()
+        self.events = 0
+        self._handler_seconds = 0.0
+
+    def snapshot(self) -> Dict:
+        """Buffers as a JSON serializable dictionary."""
+        return {
+            "url": self.page.url if not self.page.is_closed() else None,
+            "events": self.events,
+            "overhead_ms": self.overhead_ms,
+            "console": [
+                {"time": t, "type": kind, "text": text}
+                for t, kind, text in self.console
+            ],
+            "page_errors": [
+                {"time": t, "name": name, "message": message}
+                for t, name, message in self.errors
+            ],
+            "responses": [
+                {
+                    "time": t,
+                    "method": method,
+                    "url": url,
+                    "status": status,
+                    "resource_type": resource_type,
+                }
+                for t, method, url, status, resource_type in self.responses
+            ],
+            "failed_requests": [
+                {"time": t, "method": method, "url": url, "failure": failure}
+                for t, method, url, failure in self.failed_requests
+            ],
+        }
+
+    @allure.step("Save Page Diagnostics")
+    def dump(self, folder: Union[str, Path], name: str) -> Dict[str, Path]:
+        """
+        Writes the buffers (JSON) and the compressed DOM of the page and attaches them
+        to Allure.
+
+        Args:
+            folder: Directory of the files.
+            name: Base name of the files (usually the test name).
+
+        Returns:
+            Dict[str, Path]: Paths of the written files.
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        files = {"events": folder / f"{safe_name}.json"}
+
+        snapshot = self.snapshot()
+        files["events"].write_text(json.dumps(snapshot, indent=2, default=str))
+        allure.attach.file(
+            str(files["events"]),
+            name=f"{name}_diagnostics",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+        if not self.page.is_closed():
+            try:
+                dom = gzip.compress(self.page.content().encode(), compresslevel=6)
+                files["dom"] = folder / f"{safe_name}.html.gz"
+                files["dom"].write_bytes(dom)
+                allure.attach.file(
+                    str(files["dom"]), name=f"{name}_dom", extension="html.gz"
+                )
+            except Error as error:
+                # Página navegando ou contexto fechado: mantém apenas os eventos
+                log_info(f"DOM snapshot skipped: {error}")
+
+        log_info(
+            f"Diagnostics saved to {folder} ({snapshot['events']} events, "
+            f"collector overhead {snapshot['overhead_ms']} ms)"
+        )
+        return files
@@ -0,0 +1,261 @@
+"""
+Web Performance Metrics
+
+Collects load metrics of every `BasePage.navigate_to` call and compares the run
+against a stored baseline to catch frontend performance regressions.
+
+Classes:
+    PerfCollector:
+        Samples per page class and URL, per-run aggregation (median), xdist partial
+        files and the baseline comparison.
+
+Functions:
+    record_navigation(page_object):
+        Collects the metrics of the page object's page when a collector is active.
+
+Metrics:
+    - Navigation Timing: ttfb, dom_content_loaded, load, transfer_size (ms / bytes).
+    - Paint Timing: first_paint, first_contentful_paint (ms).
+    - Chromium only, CDP `Performance.getMetrics`: script_duration, layout_duration,
+      recalc_style_duration (ms), js_heap_used (bytes) and dom_nodes.
+
+Behavior:
+    - Collection is opt-in (PERF_METRICS.ENABLED or --perf-metrics); without an active
+      collector `record_navigation` returns immediately.
+    - One `page.evaluate` and, on chromium, one CDP call per navigation; the CDP session
+      is opened once per page. The time spent is reported as `collect_ms`. The browser
+      comes from the page's browser or, for persistent contexts (which have none), from
+      the collector's `browser_name`.
+    - CDP durations are cumulative for the page, so each sample is the difference from
+      the previous sample of the same page (pages shared by context_scope).
+    - A failure while collecting is logged and never fails the test; when only the CDP
+      call fails the Navigation/Paint Timing metrics are still recorded.
+    - Samples are keyed "<PageClass> <url path>"; a metric regresses when its median is
+      above baseline * (1 + tolerance) and more than the `min_delta` of its unit (ms,
+      bytes or count, see `METRIC_UNITS`) above the baseline.
+"""
+
+import json
+import statistics
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+from .logger import log_info
+
+NAVIGATION_SCRIPT = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return null;
+    const paint = {};
+    for (const entry of performance.getEntriesByType('paint')) paint[entry.name] = entry.startTime;
+    return {
+        ttfb: nav.responseStart - nav.requestStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+        load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+        transfer_size: nav.transferSize,
+        first_paint: paint['first-paint'] ?? null,
+        first_contentful_paint: paint['first-contentful-paint'] ?? null,
+    };
+}"""
+
+# Métrica CDP -> (nome no relatório, fator de conversão)
+# As durações são acumuladas pelo Chromium durante a vida da página: registra a diferença
+# desde a amostra anterior da mesma página
+CDP_METRICS = {
+    "ScriptDuration": ("script_duration", 1000),
+    "LayoutDuration": ("layout_duration", 1000),
+    "RecalcStyleDuration": ("recalc_style_duration", 1000),
+    "JSHeapUsedSize": ("js_heap_used", 1),
+    "Nodes": ("dom_nodes", 1),
+}
+CDP_CUMULATIVE = {"ScriptDuration", "LayoutDuration", "RecalcStyleDuration"}
+
+# Unidade das métricas que não são em ms: o MIN_DELTA é definido por unidade
+METRIC_UNITS = {"transfer_size": "bytes", "js_heap_used": "bytes", "dom_nodes": "count"}
+DEFAULT_MIN_DELTA = {"ms": 50, "bytes": 10240, "count": 50}
+
+PARTIAL_PREFIX = "partial_"
+RESULTS_FILE = "perf_metrics.json"
+
+_active: Optional["PerfCollector"] = None
+
+
+def set_active_collector(collector: Optional["PerfCollector"]) -> None:
+    global _active
+    _active = collector
+
+
+def record_navigation(page_object) -> None:
+    """Collects the metrics of the last navigation of `page_object.page`."""
+    if _active is None:
+        return
+    try:
+        _active.record(page_object.page, type(page_object).__name__)
+    except Exception as error:
+        log_info(f"Performance metrics not collected: {error}")
+
+
+class PerfCollector:
+    """
+    Performance samples of a run.
+
+    Args:
+        output_folder (str | Path): Folder of the partial and merged results.
+        tolerance (float): Allowed relative increase over the baseline. Defaults to 0.2
+        min_delta (dict): Minimum absolute increase reported as regression, per unit
+            ("ms", "bytes", "count"). Missing units use `DEFAULT_MIN_DELTA`
+        browser_name (str): Browser of the run, used when the page has no browser
+            (persistent contexts). Defaults to None (CDP is attempted)
+    """
+
+    def __init__(
+        self,
+        output_folder: Union[str, Path],
+        tolerance: float = 0.2,
+        min_delta: Optional[Dict[str, float]] = None,
+        browser_name: Optional[str] = None,
+    ):
+        self.output_folder = Path(output_folder)
+        self.tolerance = tolerance
+        self.min_delta = {**DEFAULT_MIN_DELTA, **(min_delta or {})}
+        self.browser_name = browser_name
+        self.samples: Dict[str, Dict[str, List[float]]] = {}
+        self.collect_seconds = 0.0
+        self._cdp_sessions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_config(
+        cls, get_config: dict, browser_name: Optional[str] = None
+    ) -> "PerfCollector":
+        settings = (get_config or {}).get("PERF_METRICS") or {}
+        return cls(
+            settings.get("FOLDER", "reports/perf"),
+            tolerance=settings.get("TOLERANCE", 0.2),
+            min_delta=settings.get("MIN_DELTA"),
+            browser_name=browser_name,
+        )
+
+    def _browser_name(self, page) -> Optional[str]:
+        browser = page.context.browser
+        return browser.browser_type.name if browser else self.browser_name
+
+    def _cdp_metrics(self, page) -> Dict[str, float]:
+        if self._browser_name(page) not in (None, "chromium"):
+            return {}
+        if page not in self._cdp_sessions:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+            self._cdp_sessions[page] = (session, {})
+        session, previous = self._cdp_sessions[page]
+
+        metrics = {}
+        for metric in session.send("Performance.getMetrics")["metrics"]:
+            if metric["name"] not in CDP_METRICS:
+                continue
+            name, factor = CDP_METRICS[metric["name"]]
+            value = metric["value"]
+            if metric["name"] in CDP_CUMULATIVE:
+                value, previous[metric["name"]] = (
+                    value - previous.get(metric["name"], 0.0),
+                    value,
+                )
+            metrics[name] = value * factor
+        return metrics
+
+    def record(self, page, page_class: str) -> None:
+        start = time.perf_counter()
+        metrics = page.evaluate(NAVIGATION_SCRIPT) or {}
+        try:
+            metrics.update(self._cdp_metrics(page))
+        except Exception as error:
+            log_info(f"CDP performance metrics not collected: {error}")
+
+        key = f"{page_class} {urlsplit(page.url).path or '/'}"
+        samples = self.samples.setdefault(key, {})
+        for name, value in metrics.items():
+            if value is not None:
+                samples.setdefault(name, []).append(float(value))
+        self.collect_seconds += time.perf_counter() - start
+
+    def save_partial(self, worker_id: str) -> Path:
+        """Writes the samples of this process (one file per xdist worker)."""
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+        path = self.output_folder / f"{PARTIAL_PREFIX}{worker_id}.json"
+        path.write_text(
+            json.dumps(
+                {"samples": self.samples, "collect_ms": self.collect_seconds * 1000}
+            )
+        )
+        return path
+
+    def merge_partials(self) -> Dict:
+        """
+        Merges the worker files into `perf_metrics.json` with the median of each metric.
+
+        Returns:
+            Dict: {"pages": {key: {metric: median}}, "navigations": n, "collect_ms": ms}
+        """
+        samples: Dict[str, Dict[str, List[float]]] = {}
+        collect_ms = 0.0
+        for path in self.output_folder.glob(f"{PARTIAL_PREFIX}*.json"):
+            partial = json.loads(path.read_text())
+            collect_ms += partial["collect_ms"]
+            for key, metrics in partial["samples"].items():
+                for name, values in metrics.items():
+                    samples.setdefault(key, {}).setdefault(name, []).extend(values)
+            path.unlink()
+
+        summary = {
+            "pages": {
+                key: {
+                    name: statistics.median(values) for name, values in metrics.items()
+                }
+                for key, metrics in sorted(samples.items())
+            },
+            "navigations": sum(
+                max(map(len, metrics.values()), default=0)
+                for metrics in samples.values()
+            ),
+            "collect_ms": round(collect_ms, 1),
+        }
+        (self.output_folder / RESULTS_FILE).write_text(json.dumps(summary, indent=2))
+        return summary
+
+    def compare(self, summary: Dict, baseline: Dict) -> List[Dict]:
+        """Metrics whose median regressed against the baseline."""
+        regressions = []
+        for key, metrics in summary["pages"].items():
+            for name, value in metrics.items():
+                expected = baseline.get("pages", {}).get(key, {}).get(name)
+                if expected is None:
+                    continue
+                limit = expected * (1 + self.tolerance)
+                min_delta = self.min_delta[METRIC_UNITS.get(name, "ms")]
+                if value > limit and value - expected > min_delta:
+                    regressions.append(
+                        {
+                            "page": key,
+                            "metric": name,
+                            "baseline": expected,
+                            "current": value,
+                            "change": (
+                                round(value / expected - 1, 3) if expected else None
+                            ),
+                        }
+                    )
+        return regressions
+
+    @staticmethod
+    def load_baseline(path: Union[str, Path]) -> Dict:
+        try:
+            return json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def save_baseline(path: Union[str, Path], summary: Dict) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"pages": summary["pages"]}, indent=2))
@@ -0,0 +1,203 @@
+"""
+Query Result Cache
+
+This module provides an opt-in read cache for `DatabaseManager`, so tests looking up the
+same reference rows do not hit the database on every call.
+
+Classes:
+    QueryCache:
+        TTL + LRU cache of query results, invalidated per table on writes.
+
+Functions:
+    normalize_sql(sql):
+        Removes comments, collapses whitespace and the trailing ';' of a statement.
+
+    is_write(sql):
+        Tells whether a statement changes data or schema.
+
+    referenced_tables(sql):
+        Returns the tables referenced by a statement.
+
+    is_cacheable_script(sql):
+        Tells whether a `.sql` file is marked with the `-- @cacheable` header comment.
+
+Behavior:
+    - Entries are keyed by normalized SQL plus parameters.
+    - Entries expire after `ttl` seconds; the least recently used entry is evicted when
+      `max_entries` is reached.
+    - The managers of the same database (host, port and schema) in a process share one
+      cache, so a write executed by any of them (e.g. the `user_factory` connection)
+      invalidates every entry reading the tables it touches. Writes whose tables cannot
+      be parsed clear the whole cache.
+    - Writes made outside these managers (other xdist workers on a shared schema,
+      `AsyncDatabaseManager`, the application under test) are not seen: only mark as
+      cacheable the reads of tables nobody writes during the run, or keep TTL short.
+    - Hit, miss, eviction and invalidation counters are available through `stats()`.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+CACHEABLE_HEADER = "@cacheable"
+
+# Caches compartilhados pelos gerenciadores do mesmo banco neste processo
+_shared_caches: Dict[Hashable, "QueryCache"] = {}
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_WRITE_KEYWORDS = {
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "REPLACE",
+    "TRUNCATE",
+    "DROP",
+    "ALTER",
+    "CREATE",
+    "RENAME",
+    "LOAD",
+}
+_TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+((?:`?\w+`?\.)?`?\w+`?)", re.IGNORECASE
+)
+
+
+def normalize_sql(sql: str) -> str:
+    """Removes comments, collapses whitespace and strips the trailing ';'."""
+    sql = _COMMENTS.sub(" ", sql)
+    return " ".join(sql.split()).rstrip(";").strip()
+
+
+def is_write(sql: str) -> bool:
+    """Returns True if the statement changes data or schema."""
+    words = normalize_sql(sql).split(" ", 1)
+    return bool(words[0]) and words[0].upper() in _WRITE_KEYWORDS
+
+
+def referenced_tables(sql: str) -> Set[str]:
+    """Returns the lower-cased table names (without schema) referenced by the statement."""
+    tables = set()
+    for reference in _TABLE_REFERENCE.findall(normalize_sql(sql)):
+        tables.add(reference.replace("`", "").split(".")[-1].lower())
+    return tables
+
+
+def is_cacheable_script(sql: str) -> bool:
+    """Returns True if the leading comment lines of the script contain `@cacheable`."""
+    for line in sql.strip().splitlines():
+        line = line.strip()
+        if not line.startswith("--"):
+            return False
+        if CACHEABLE_HEADER in line:
+            return True
+    return False
+
+
+class QueryCache:
+    """
+    Read cache of query results with TTL, LRU eviction and per-table invalidation.
+
+    Args:
+        ttl (float): Seconds an entry stays valid. Defaults to 300
+        max_entries (int): Maximum number of cached results. Defaults to 256
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Set[str], List[Dict]]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_config(
+        cls, get_config: dict, database: Optional[Hashable] = None
+    ) -> Optional["QueryCache"]:
+        """
+        Builds the cache from the QUERY_CACHE section, or None when it is disabled.
+
+        Args:
+            get_config (dict): Main configuration dictionary.
+            database (Hashable): Identity of the database, e.g. (host, port, schema).
+                Every call with the same identity returns the same shared cache.
+        """
+        cache_config = (get_config or {}).get("QUERY_CACHE") or {}
+        if not cache_config.get("ENABLED"):
+            return None
+        if database is not None and database in _shared_caches:
+            return _shared_caches[database]
+
+        cache = cls(
+            ttl=cache_config.get("TTL", 300),
+            max_entries=cache_config.get("MAX_ENTRIES", 256),
+        )
+        if database is not None:
+            _shared_caches[database] = cache
+        return cache
+
+    @staticmethod
+    def key(sql: str, params=None) -> Hashable:
+        """Cache key made of the normalized SQL and the query parameters."""
+        if isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        elif params is not None:
+            params = tuple(params)
+        return normalize_sql(sql), params
+
+    def get(self, key: Hashable) -> Optional[List[Dict]]:
+        """Returns a copy of the cached rows, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return [dict(row) for row in entry[2]]
+
+    def put(self, key: Hashable, rows: List[Dict]) -> None:
+        """Stores the rows of a read query, evicting the least recently used entry."""
+        self._entries[key] = (
+            time.monotonic(),
+            referenced_tables(key[0]),
+            [dict(row) for row in rows],
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, sql: str) -> None:
+        """Drops the entries reading the tables written by the statement."""
+        tables = referenced_tables(sql)
+        if not tables:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            return
+
+        stale = [key for key, entry in self._entries.items() if entry[1] & tables]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for tuning TTL and size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
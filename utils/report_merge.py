@@ -0,0 +1,92 @@
+"""
+Report Merge
+
+Combines the reports written by the shards of a run (`pytest --shard i/N`, one folder
+per shard) into a single result stream, Allure results folder and JUnit file. Used by
+`merge_reports.py`; the HTML report is rendered from the merged stream
+(`render_reports.py`).
+
+Functions:
+    merge_streams(sources, target):
+        Concatenates the result streams of the shards and copies their attachments.
+    merge_allure(sources, target):
+        Copies the result, container and attachment files of every shard.
+    merge_junit(sources, target):
+        Writes one <testsuites> with the <testsuite> elements of every shard.
+
+Behavior:
+    - Streaming: Allure files are copied one by one and JUnit suites are parsed with
+      `iterparse` and cleared after being written; memory does not grow with the number
+      of shards.
+    - Result stream lines are copied as they are read; attachment paths are relative to
+      the stream and named by UUID, so copying the attachment folders keeps them valid.
+    - Allure file names are UUIDs, so shards never collide; shared files such as
+      `environment.properties` are taken from the first shard that has them.
+    - The Allure results folder and the attachments folder of the target are emptied
+      first, so files of a previous merge do not show up in the new report.
+"""
+
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterable, Union
+
+from .result_stream import ATTACHMENTS_FOLDER
+
+
+def merge_streams(sources: Iterable[Union[str, Path]], target: Union[str, Path]) -> int:
+    """Writes the events of every result stream into `target`; returns the test count."""
+    target = Path(target)
+    attachments = target.parent / ATTACHMENTS_FOLDER
+    shutil.rmtree(attachments, ignore_errors=True)
+    attachments.mkdir(parents=True)
+    tests = 0
+    with open(target, "w", encoding="utf-8") as output:
+        for source in sources:
+            source = Path(source)
+            with open(source, encoding="utf-8") as file:
+                for line in file:
+                    output.write(line)
+                    tests += line.startswith('{"event": "test"')
+            folder = source.parent / ATTACHMENTS_FOLDER
+            if folder.is_dir():
+                for path in folder.iterdir():
+                    shutil.copyfile(path, attachments / path.name)
+    return tests
+
+
+def merge_allure(sources: Iterable[Union[str, Path]], target: Union[str, Path]) -> int:
+    """Copies the Allure results of the shards into `target`; returns the file count."""
+    target = Path(target)
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True)
+    copied = 0
+    for source in sources:
+        for path in Path(source).iterdir():
+            destination = target / path.name
+            if path.is_file() and not destination.exists():
+                shutil.copyfile(path, destination)
+                copied += 1
+    return copied
+
+
+def merge_junit(sources: Iterable[Union[str, Path]], target: Union[str, Path]) -> int:
+    """Writes the <testsuite> elements of every JUnit file; returns the suite count."""
+    suites = 0
+    with open(target, "wb") as output:
+        output.write(b'<?xml version="1.0" encoding="utf-8"?><testsuites>')
+        for source in sources:
+            depth = 0
+            for event, element in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if element.tag == "testsuite" and depth <= 1:
+                    output.write(
+                        ET.tostring(element, encoding="utf-8", xml_declaration=False)
+                    )
+                    element.clear()
+                    suites += 1
+        output.write(b"</testsuites>")
+    return suites
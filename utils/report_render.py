@@ -0,0 +1,316 @@
+"""
+Report Render
+
+Renders the HTML, Allure and JUnit reports from the result stream written during the run
+(`utils.result_stream`, `reports/results.jsonl`). Used by `render_reports.py`.
+
+Functions:
+    render_html(results, target):
+        Static HTML report with one collapsible entry per test and links to attachments.
+    render_junit(results, target):
+        JUnit XML (one <testsuite>) for the CI test reporters.
+    render_allure(results, target):
+        Allure results folder (result files, attachments and environment.properties).
+
+Behavior:
+    - Every renderer reads the stream line by line and writes each test as soon as it is
+      read; the totals written before the tests come from a first pass that only counts
+      outcomes, so memory does not grow with the size of the suite.
+    - Attachments are never inlined: the HTML links the files of the stream folder
+      (images are loaded lazily) and Allure gets a copy of each file.
+    - A stream with several sessions (shards merged by `merge_reports.py`) renders as a
+      single report.
+"""
+
+import hashlib
+import html
+import json
+import os
+import shutil
+import uuid
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Union
+
+from .result_stream import OUTCOMES, read_events
+
+# Status do Allure para cada resultado do stream
+ALLURE_STATUS = {
+    "passed": "passed",
+    "failed": "failed",
+    "error": "broken",
+    "skipped": "skipped",
+    "xfailed": "skipped",
+    "xpassed": "passed",
+}
+
+_HTML_STYLE = """
+body{font-family:Helvetica,Arial,sans-serif;font-size:13px;margin:16px;color:#222}
+.summary span{margin-right:12px}
+label{margin-right:10px}
+details{border:1px solid #ddd;margin:4px 0;padding:4px 8px}
+summary{cursor:pointer}
+.passed,.xpassed{color:#2e7d32}.failed,.error{color:#c62828}.skipped,.xfailed{color:#f9a825}
+pre{background:#f6f6f6;padding:8px;overflow:auto;max-height:400px}
+img{max-width:640px;display:block;margin:4px 0}
+ul{margin:2px 0 2px 16px;padding:0}
+"""
+_HTML_SCRIPT = """
+document.querySelectorAll("input[data-outcome]").forEach(function (box) {
+  box.addEventListener("change", function () {
+    document.querySelectorAll("details." + box.dataset.outcome).forEach(function (row) {
+      row.style.display = box.checked ? "" : "none";
+    });
+  });
+});
+"""
+
+
+def _summary(results: Union[str, Path]) -> Dict:
+    """Outcome counts, total duration and sessions of the stream (first pass)."""
+    summary = {
+        "counts": dict.fromkeys(OUTCOMES, 0),
+        "duration": 0.0,
+        "sessions": 0,
+        "environment": {},
+    }
+    for event in read_events(results):
+        if event["event"] == "test":
+            summary["counts"][event["outcome"]] += 1
+            summary["duration"] += event["duration"] or 0
+        elif event["event"] == "session_start":
+            summary["sessions"] += 1
+            summary["environment"] = summary["environment"] or event["environment"]
+    return summary
+
+
+def _split_nodeid(nodeid: str):
+    """(classname, name) of a node id as written by pytest's JUnit reporter."""
+    parts = nodeid.split("::")
+    module = parts[0].replace("/", ".").replace("\\", ".")
+    if module.endswith(".py"):
+        module = module[:-3]
+    return ".".join([module] + parts[1:-1]), parts[-1]
+
+
+def render_junit(results: Union[str, Path], target: Union[str, Path]) -> int:
+    """Writes the JUnit XML of the stream; returns the test count."""
+    summary = _summary(results)
+    counts = summary["counts"]
+    attributes = {
+        "name": "pytest",
+        "tests": str(sum(counts.values())),
+        "failures": str(counts["failed"]),
+        "errors": str(counts["error"]),
+        "skipped": str(counts["skipped"] + counts["xfailed"]),
+        "time": f"{summary['duration']:.3f}",
+    }
+    Path(target).parent.mkdir(parents=True, exist_ok=True)
+    tests = 0
+    with open(target, "wb") as output:
+        suite = ET.tostring(ET.Element("testsuite", attributes), encoding="utf-8")
+        output.write(b'<?xml version="1.0" encoding="utf-8"?><testsuites>')
+        output.write(suite.replace(b" />", b">"))
+        for event in read_events(results, "test"):
+            classname, name = _split_nodeid(event["nodeid"])
+            case = ET.Element(
+                "testcase",
+                classname=classname,
+                name=name,
+                time=f"{event['duration'] or 0:.3f}",
+            )
+            outcome = event["outcome"]
+            tag = {
+                "failed": "failure",
+                "error": "error",
+                "skipped": "skipped",
+                "xfailed": "skipped",
+            }.get(outcome)
+            if tag:
+                child = ET.SubElement(case, tag, message=event["message"] or "")
+                child.text = event["longrepr"]
+            output_sections = [
+                f"{name}\n{text}" for name, text in event["sections"] if text
+            ]
+            if output_sections:
+                ET.SubElement(case, "system-out").text = "\n".join(output_sections)
+            output.write(ET.tostring(case, encoding="utf-8"))
+            tests += 1
+        output.write(b"</testsuite></testsuites>")
+    return tests
+
+
+def _html_attachments(attachments, base: str) -> str:
+    items = []
+    for attachment in attachments:
+        source = html.escape(f"{base}/{attachment['source']}")
+        name = html.escape(attachment["name"])
+        if (attachment["type"] or "").startswith("image/"):
+            items.append(
+                f'<li><a href="{source}">{name}</a>'
+                f'<img loading="lazy" src="{source}" alt="{name}"></li>'
+            )
+        else:
+            items.append(f'<li><a href="{source}">{name}</a></li>')
+    return f"<ul>{''.join(items)}</ul>" if items else ""
+
+
+def _html_steps(steps, base: str) -> str:
+    items = []
+    for step in steps:
+        duration = (step.get("stop") or step["start"]) - step["start"]
+        status = step.get("status", "broken")
+        items.append(
+            f'<li><span class="{"passed" if status == "passed" else "failed"}">'
+            f"{html.escape(step['name'])}</span> ({duration:.2f}s)"
+            + (f" - {html.escape(step['message'])}" if step.get("message") else "")
+            + _html_attachments(step["attachments"], base)
+            + _html_steps(step["steps"], base)
+            + "</li>"
+        )
+    return f"<ul>{''.join(items)}</ul>" if items else ""
+
+
+def render_html(results: Union[str, Path], target: Union[str, Path]) -> int:
+    """Writes the HTML report of the stream; returns the test count."""
+    summary = _summary(results)
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Anexos referenciados a partir da pasta do relatório
+    base = Path(os.path.relpath(Path(results).parent, target.parent)).as_posix()
+    tests = 0
+    with open(target, "w", encoding="utf-8") as output:
+        output.write(
+            '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Test Report</title>'
+            f"<style>{_HTML_STYLE}</style></head><body><h1>Test Report</h1>"
+        )
+        environment = "".join(
+            f"<tr><td>{html.escape(str(key))}</td><td>{html.escape(str(value))}</td></tr>"
+            for key, value in summary["environment"].items()
+        )
+        if environment:
+            output.write(f"<h2>Environment</h2><table>{environment}</table>")
+        total = sum(summary["counts"].values())
+        output.write(
+            f"<h2>Summary</h2><p>{total} tests took {summary['duration']:.2f}s"
+            + (f" in {summary['sessions']} sessions" if summary["sessions"] > 1 else "")
+            + '.</p><p class="summary">'
+        )
+        for outcome, count in summary["counts"].items():
+            output.write(
+                f'<label class="{outcome}"><input type="checkbox" data-outcome="{outcome}"'
+                f' checked{"" if count else " disabled"}> {count} {outcome}</label>'
+            )
+        output.write("</p><h2>Results</h2>")
+
+        for event in read_events(results, "test"):
+            outcome = event["outcome"]
+            title = html.escape(event["title"] or event["nodeid"])
+            body = ""
+            if event["title"]:
+                body += f"<p>{html.escape(event['nodeid'])}</p>"
+            if event["longrepr"]:
+                body += f"<pre>{html.escape(event['longrepr'])}</pre>"
+            body += _html_steps(event["steps"], base)
+            body += _html_attachments(event["attachments"], base)
+            for name, text in event["sections"]:
+                body += f"<p>{html.escape(name)}</p><pre>{html.escape(text)}</pre>"
+            output.write(
+                f'<details class="{outcome}"><summary><span class="{outcome}">'
+                f"{outcome.upper()}</span> {title} ({event['duration']:.2f}s)</summary>"
+                f"{body}</details>"
+            )
+            tests += 1
+        output.write(f"<script>{_HTML_SCRIPT}</script></body></html>")
+    return tests
+
+
+def _allure_attachments(attachments, folder: Path, target: Path):
+    converted = []
+    for attachment in attachments:
+        source = folder / attachment["source"]
+        name = f"{uuid.uuid4()}-attachment{Path(attachment['source']).suffix}"
+        if source.exists():
+            shutil.copyfile(source, target / name)
+        converted.append(
+            {"name": attachment["name"], "source": name, "type": attachment["type"]}
+        )
+    return converted
+
+
+def _allure_steps(steps, folder: Path, target: Path):
+    converted = []
+    for step in steps:
+        status = step.get("status", "broken")
+        converted.append(
+            {
+                "name": step["name"],
+                "status": status,
+                "statusDetails": (
+                    {"message": step["message"]} if step.get("message") else {}
+                ),
+                "start": int(step["start"] * 1000),
+                "stop": int((step.get("stop") or step["start"]) * 1000),
+                "steps": _allure_steps(step["steps"], folder, target),
+                "attachments": _allure_attachments(step["attachments"], folder, target),
+            }
+        )
+    return converted
+
+
+def render_allure(results: Union[str, Path], target: Union[str, Path]) -> int:
+    """
+    Writes the Allure results of the stream into `target` (cleaned first, like
+    --clean-alluredir); returns the test count.
+    """
+    folder = Path(results).parent
+    target = Path(target)
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True)
+    tests = 0
+    environment = {}
+    for event in read_events(results):
+        if event["event"] == "session_start":
+            environment = environment or event["environment"]
+            continue
+        if event["event"] != "test":
+            continue
+
+        classname, name = _split_nodeid(event["nodeid"])
+        module = event["nodeid"].split("::")[0]
+        labels = [
+            {"name": "suite", "value": classname.rsplit(".", 1)[-1]},
+            {"name": "parentSuite", "value": classname.rsplit(".", 1)[0]},
+            {"name": "framework", "value": "pytest"},
+            {"name": "language", "value": "python"},
+        ]
+        if event["worker"]:
+            labels.append({"name": "thread", "value": str(event["worker"])})
+        labels += [{"name": "tag", "value": marker} for marker in event["markers"]]
+        start = event["start"] or 0
+        result = {
+            "uuid": str(uuid.uuid4()),
+            "historyId": hashlib.md5(event["nodeid"].encode()).hexdigest(),
+            "testCaseId": hashlib.md5(event["nodeid"].encode()).hexdigest(),
+            "fullName": f"{module[:-3].replace('/', '.')}#{name}",
+            "name": event["title"] or name,
+            "status": ALLURE_STATUS[event["outcome"]],
+            "statusDetails": {
+                "message": event["message"],
+                "trace": event["longrepr"],
+            },
+            "start": int(start * 1000),
+            "stop": int((event["stop"] or start + event["duration"]) * 1000),
+            "labels": labels,
+            "steps": _allure_steps(event["steps"], folder, target),
+            "attachments": _allure_attachments(event["attachments"], folder, target),
+        }
+        with open(target / f"{result['uuid']}-result.json", "w") as file:
+            json.dump(result, file)
+        tests += 1
+
+    if environment:
+        (target / "environment.properties").write_text(
+            "".join(f"{key}={value}\n" for key, value in environment.items())
+        )
+    return tests
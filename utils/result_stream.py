@@ -0,0 +1,253 @@
+"""
+Result Stream
+
+Single source of the test reports: every test result is appended once, as a JSON line,
+to `reports/results.jsonl` while the suite runs. The HTML, Allure and JUnit reports are
+rendered from it afterwards (`render_reports.py`), instead of three reporters each
+keeping and serializing every result and attachment during the run.
+
+Classes:
+    StreamCollector:
+        allure_commons listener of the process running the tests: keeps the step tree
+        of the current test and writes every attachment (allure.attach, log_allure,
+        screenshots) to the attachments folder.
+    ResultStreamWriter:
+        Appends the session and test events to the stream (main process only).
+
+Functions:
+    read_events(path):
+        Iterates over the events of a stream without loading the file.
+
+Events:
+    - {"event": "session_start", "time", "environment", "args"}
+    - {"event": "test", "nodeid", "title", "outcome", "start", "stop", "duration",
+      "worker", "markers", "properties", "message", "longrepr", "sections", "steps", "attachments"}
+    - {"event": "session_finish", "time", "exitstatus", "counts"}
+
+Behavior:
+    - Attachments are files in `<stream folder>/attachments/` referenced by relative
+      path, never inlined, so memory and stream size stay flat with the suite size.
+    - Outcomes follow pytest-html: a setup/teardown failure is an "error"; xfail and
+      xpass are kept apart from failed and passed.
+    - Each line is written as soon as the test ends; a run killed midway still leaves a
+      readable stream.
+"""
+
+import json
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import allure_commons
+from allure_commons.types import AttachmentType
+
+ATTACHMENTS_FOLDER = "attachments"
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+
+
+class StreamCollector:
+    """
+    Steps and attachments of the running test, received from allure_commons.
+
+    Args:
+        folder (str | Path): Folder of the stream; attachments go to `attachments/`.
+    """
+
+    def __init__(self, folder: Union[str, Path]):
+        self.folder = Path(folder)
+        self.attachments_folder = self.folder / ATTACHMENTS_FOLDER
+        self.active = False
+        self._steps: List[Dict] = []
+        self._attachments: List[Dict] = []
+        self._stack: List[Dict] = []
+
+    def start_test(self) -> None:
+        self.active = True
+        self._steps, self._attachments, self._stack = [], [], []
+
+    def stop_test(self) -> None:
+        self.active = False
+
+    def take(self) -> Dict:
+        """Steps and attachments recorded since the last call (one test phase)."""
+        data = {"steps": self._steps, "attachments": self._attachments}
+        self._steps, self._attachments = [], []
+        return data
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        if not self.active:
+            return
+        step = {"name": title, "start": time.time(), "steps": [], "attachments": []}
+        (self._stack[-1]["steps"] if self._stack else self._steps).append(step)
+        self._stack.append(step)
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        if not self.active or not self._stack:
+            return
+        step = self._stack.pop()
+        step["stop"] = time.time()
+        if exc_type is None:
+            step["status"] = "passed"
+        else:
+            step["status"] = (
+                "failed" if issubclass(exc_type, AssertionError) else "broken"
+            )
+            step["message"] = f"{exc_type.__name__}: {exc_val}"
+
+    def _add_attachment(self, name, attachment_type, extension) -> Path:
+        if isinstance(attachment_type, AttachmentType):
+            mime_type, extension = attachment_type.mime_type, attachment_type.extension
+        else:
+            mime_type = attachment_type
+        file_name = f"{uuid.uuid4().hex}.{extension or 'attach'}"
+        attachment = {
+            "name": name or file_name,
+            "source": f"{ATTACHMENTS_FOLDER}/{file_name}",
+            "type": mime_type,
+        }
+        (self._stack[-1]["attachments"] if self._stack else self._attachments).append(
+            attachment
+        )
+        self.attachments_folder.mkdir(parents=True, exist_ok=True)
+        return self.attachments_folder / file_name
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        if not self.active:
+            return
+        path = self._add_attachment(name, attachment_type, extension)
+        path.write_bytes(body.encode("utf-8") if isinstance(body, str) else body)
+
+    @allure_commons.hookimpl
+    def attach_file(self, source, name, attachment_type, extension):
+        if not self.active:
+            return
+        shutil.copyfile(source, self._add_attachment(name, attachment_type, extension))
+
+
+def _outcome(reports: Dict) -> str:
+    for when in ("setup", "call", "teardown"):
+        report = reports.get(when)
+        if report is None:
+            continue
+        if hasattr(report, "wasxfail"):
+            return "xfailed" if report.skipped else "xpassed"
+        if report.failed:
+            return "failed" if when == "call" else "error"
+        if report.skipped:
+            return "skipped"
+    return "passed"
+
+
+class ResultStreamWriter:
+    """
+    Writes the stream of a session.
+
+    Args:
+        path (str | Path): JSONL file of the stream.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Uma linha por evento, gravada assim que escrita (buffer de linha)
+        self.file = open(self.path, "w", buffering=1, encoding="utf-8")
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self._phases: Dict[str, Dict] = {}
+
+    def write(self, event: Dict) -> None:
+        self.file.write(json.dumps(event, default=str) + "\n")
+
+    def session_start(self, environment: Dict, args: List[str]) -> None:
+        self.write(
+            {
+                "event": "session_start",
+                "time": time.time(),
+                "environment": environment,
+                "args": args,
+            }
+        )
+
+    def add_report(self, report) -> None:
+        """Collects the phase reports of a test and writes the test after teardown."""
+        reports = self._phases.setdefault(report.nodeid, {})
+        reports[report.when] = report
+        if report.when != "teardown":
+            return
+        self._write_test(report.nodeid, self._phases.pop(report.nodeid))
+
+    def _write_test(self, nodeid: str, reports: Dict) -> None:
+        outcome = _outcome(reports)
+        self.counts[outcome] += 1
+        steps, attachments, sections = [], [], []
+        title = None
+        longrepr, message = "", ""
+        for when in ("setup", "call", "teardown"):
+            report = reports.get(when)
+            if report is None:
+                continue
+            data = getattr(report, "stream_data", None) or {}
+            title = title or data.get("title")
+            steps.extend(data.get("steps", []))
+            attachments.extend(data.get("attachments", []))
+            if (report.failed or report.skipped) and report.longrepr and not longrepr:
+                if isinstance(report.longrepr, tuple):
+                    # Skip: (arquivo, linha, motivo)
+                    longrepr = message = report.longrepr[2]
+                    continue
+                longrepr = str(report.longrepr)
+                message = getattr(report.longrepr, "reprcrash", None)
+                message = message.message if message else longrepr.splitlines()[-1]
+        # As seções capturadas (stdout, stderr, log) se acumulam até o teardown
+        last = reports.get("teardown") or reports.get("call") or reports["setup"]
+        sections = [[name, text] for name, text in last.sections]
+
+        first = reports.get("setup") or last
+        self.write(
+            {
+                "event": "test",
+                "nodeid": nodeid,
+                "title": title,
+                "outcome": outcome,
+                "start": getattr(first, "start", None),
+                "stop": getattr(last, "stop", None),
+                "duration": round(sum(r.duration for r in reports.values()), 3),
+                "worker": getattr(last, "worker_id", None)
+                or getattr(last, "node", None),
+                "markers": (getattr(first, "stream_data", None) or {}).get(
+                    "markers", []
+                ),
+                "properties": dict(last.user_properties),
+                "message": message,
+                "longrepr": longrepr,
+                "sections": sections,
+                "steps": steps,
+                "attachments": attachments,
+            }
+        )
+
+    def session_finish(self, exitstatus: int) -> None:
+        self.write(
+            {
+                "event": "session_finish",
+                "time": time.time(),
+                "exitstatus": int(exitstatus),
+                "counts": self.counts,
+            }
+        )
+        self.file.close()
+
+
+def read_events(path: Union[str, Path], event: Optional[str] = None) -> Iterator[Dict]:
+    """Events of the stream, one line at a time (optionally only one event type)."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if event is None or data["event"] == event:
+                yield data
@@ -0,0 +1,344 @@
+"""
+Database Connection Retry Engine
+
+This module provides the retry logic shared by `DatabaseManager.connect`,
+`AsyncDatabaseManager.connect` and `DatabaseInitializer._connect_with_retry`.
+
+Classes:
+    RetryPolicy:
+        Timeout and exponential backoff (with jitter) settings.
+
+    DatabaseDownFlag:
+        File flag telling the other xdist workers that the database is down.
+
+    DatabaseConnectionError:
+        Raised when this process could not connect (fatal error or timeout).
+
+    DatabaseUnavailableError:
+        Raised without trying when another worker already flagged the database as down.
+
+Functions:
+    probe_tcp(host, port, timeout):
+        Cheap TCP-level readiness check, done before the full MySQL handshake.
+
+    mysql_errno(error):
+        MySQL error number of a mysql.connector or pymysql/aiomysql error.
+
+    is_fatal_error(error):
+        Tells whether a connection error will not be fixed by retrying.
+
+    connect_with_retry(connect, host, port, policy, log):
+        Runs `connect()` with probing, backoff, error classification and the shared flag.
+
+    connect_with_retry_async(connect, host, port, policy, log):
+        Same as `connect_with_retry` for coroutine functions (aiomysql pools).
+
+Behavior:
+    - Waits grow exponentially from `initial_delay` up to `max_delay`, with random jitter
+      so the workers do not retry in lockstep.
+    - The handshake is only attempted once the port accepts TCP connections.
+    - Bad credentials, unknown database and unknown host fail immediately; a temporary
+      DNS failure (EAI_AGAIN) is retried.
+    - When a process gives up, the flag is set and the other workers of the same run
+      (same PYTEST_XDIST_TESTRUNUID) fail fast instead of waiting for the full timeout,
+      including the workers already retrying, which check the flag before each wait.
+    - Host-level failures (host unknown or unreachable) flag the whole host:port;
+      credential and schema errors only flag that database and user.
+"""
+
+import asyncio
+import json
+import os
+import random
+import socket
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# MySQL error numbers that retrying cannot fix, limited to one database and user
+SCHEMA_ERRNOS = {
+    1044,  # ER_DBACCESS_DENIED_ERROR
+    1045,  # ER_ACCESS_DENIED_ERROR
+    1049,  # ER_BAD_DB_ERROR
+    1251,  # CR_AUTH_PLUGIN_CANNOT_LOAD / client does not support auth protocol
+    1698,  # ER_ACCESS_DENIED_NO_PASSWORD_ERROR
+}
+# MySQL error numbers that retrying cannot fix, for every database of the host
+HOST_ERRNOS = {
+    2005,  # CR_UNKNOWN_HOST
+}
+FATAL_ERRNOS = SCHEMA_ERRNOS | HOST_ERRNOS
+
+
+class DatabaseConnectionError(RuntimeError):
+    """The database could not be reached by this process."""
+
+
+class DatabaseUnavailableError(DatabaseConnectionError):
+    """Another worker of the same run already flagged the database as down."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry settings.
+
+    Args:
+        timeout (float): Total time budget in seconds. Defaults to 60
+        initial_delay (float): First wait between attempts in seconds. Defaults to 0.25
+        max_delay (float): Upper bound of a single wait in seconds. Defaults to 5
+        multiplier (float): Backoff growth factor. Defaults to 2
+        jitter (float): Random fraction added/removed from each wait. Defaults to 0.3
+        probe_timeout (float): TCP probe timeout in seconds. Defaults to 1
+    """
+
+    timeout: float = 60
+    initial_delay: float = 0.25
+    max_delay: float = 5
+    multiplier: float = 2
+    jitter: float = 0.3
+    probe_timeout: float = 1
+
+    def delay(self, attempt: int) -> float:
+        """Wait before the next attempt (attempt starts at 1)."""
+        base = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        return max(0.0, base * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+def _safe(value) -> str:
+    return "".join(c if c.isalnum() else "_" for c in str(value))
+
+
+class DatabaseDownFlag:
+    """
+    Flag file shared by the workers of a run, keyed by database host and port, and by
+    database and user when given.
+
+    Args:
+        host (str): Database host.
+        port (int): Database port.
+        run_id (str): Run identifier. Defaults to PYTEST_XDIST_TESTRUNUID; without it
+            (no xdist) the flag is disabled, since there are no other workers to warn.
+        database (str): Database (schema) name. Defaults to None (whole host)
+        user (str): Database user. Defaults to None (whole host)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        run_id: Optional[str] = None,
+        database: Optional[str] = None,
+        user: Optional[str] = None,
+    ):
+        run_id = run_id or os.getenv("PYTEST_XDIST_TESTRUNUID")
+        self.path: Optional[Path] = None
+        if run_id:
+            name = f"db_down_{run_id}_{_safe(host)}_{port}"
+            if database is not None or user is not None:
+                name += f"_{_safe(database)}_{_safe(user)}"
+            self.path = Path(tempfile.gettempdir()) / name
+
+    def reason(self) -> Optional[str]:
+        """Returns why the database was flagged as down, or None if it was not."""
+        if not self.path or not self.path.exists():
+            return None
+        try:
+            return json.loads(self.path.read_text())["reason"]
+        except (OSError, ValueError, KeyError):
+            return "unknown"
+
+    def set(self, reason: str) -> None:
+        if self.path:
+            self.path.write_text(json.dumps({"reason": reason, "time": time.time()}))
+
+    def clear(self) -> None:
+        if self.path and self.path.exists():
+            self.path.unlink(missing_ok=True)
+
+
+def probe_tcp(host: str, port: int, timeout: float = 1) -> bool:
+    """
+    Returns True if the host accepts TCP connections on the port.
+
+    Raises:
+        socket.gaierror: If the host name cannot be resolved.
+    """
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except socket.gaierror:
+        raise
+    except OSError:
+        return False
+
+
+def mysql_errno(error: Exception) -> Optional[int]:
+    """
+    MySQL error number of a connection error: `errno` for mysql.connector, the first
+    argument for pymysql/aiomysql (which have no `errno`).
+    """
+    errno = getattr(error, "errno", None)
+    if errno is None and error.args and isinstance(error.args[0], int):
+        errno = error.args[0]
+    return errno
+
+
+def is_fatal_error(error: Exception) -> bool:
+    """Returns True for errors retrying cannot fix (credentials, database, host)."""
+    if isinstance(error, socket.gaierror):
+        # Falha temporária de DNS: uma nova tentativa pode resolver
+        return error.errno != socket.EAI_AGAIN
+    return mysql_errno(error) in FATAL_ERRNOS
+
+
+def is_host_error(error: Exception) -> bool:
+    """Returns True for fatal errors affecting every database of the host."""
+    return isinstance(error, socket.gaierror) or mysql_errno(error) in HOST_ERRNOS
+
+
+class _RetryLoop:
+    """Attempt count, deadline and error handling shared by the sync and async loops."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        policy: RetryPolicy,
+        log,
+        database: Optional[str],
+        user: Optional[str],
+    ):
+        self.host = host
+        self.port = port
+        self.policy = policy
+        self.log = log
+        self.host_flag = DatabaseDownFlag(host, port)
+        self.flag = DatabaseDownFlag(host, port, database=database, user=user)
+        self.deadline = time.monotonic() + policy.timeout
+        self.attempt = 0
+        self.last_error = "no attempt made"
+
+    def check_flag(self) -> None:
+        reason = self.host_flag.reason() or self.flag.reason()
+        if reason:
+            raise DatabaseUnavailableError(
+                f"Database {self.host}:{self.port} flagged as down by another worker: "
+                f"{reason}"
+            )
+
+    def connecting(self) -> None:
+        self.log(
+            f"Attempt #{self.attempt}: Connecting to MySQL at {self.host}:{self.port}..."
+        )
+
+    def unreachable(self) -> None:
+        self.last_error = f"{self.host}:{self.port} is not accepting TCP connections"
+        self.log(f"⚠️ Attempt #{self.attempt}: {self.last_error}")
+
+    def succeeded(self) -> None:
+        self.host_flag.clear()
+        self.flag.clear()
+
+    def failed(self, error: Exception) -> None:
+        self.last_error = str(error)
+        if is_fatal_error(error):
+            (self.host_flag if is_host_error(error) else self.flag).set(self.last_error)
+            raise DatabaseConnectionError(
+                f"Fatal database error, not retrying: {error}"
+            ) from error
+        self.log(f"⚠️ Connection attempt failed: {error}")
+
+    def next_delay(self) -> float:
+        """
+        Wait before the next attempt; raises when the time budget is spent or another
+        worker flagged the database as down in the meantime.
+        """
+        self.check_flag()
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            self.host_flag.set(self.last_error)
+            raise DatabaseConnectionError(
+                f"Failed to connect to database after {self.policy.timeout} seconds: "
+                f"{self.last_error}"
+            )
+        return min(self.policy.delay(self.attempt), remaining)
+
+
+def connect_with_retry(
+    connect: Callable[[], T],
+    host: str,
+    port: int,
+    policy: RetryPolicy = RetryPolicy(),
+    log: Callable[[str], None] = print,
+    database: Optional[str] = None,
+    user: Optional[str] = None,
+) -> T:
+    """
+    Calls `connect()` until it succeeds, a fatal error happens or the timeout expires.
+
+    Args:
+        connect: Function opening and returning the connection.
+        host: Database host, used for the TCP probe and the shared flag.
+        port: Database port, used for the TCP probe and the shared flag.
+        policy: Timeout and backoff settings.
+        log: Function used to report each attempt.
+        database: Database name, scoping the shared flag of credential/schema errors.
+        user: Database user, scoping the shared flag of credential/schema errors.
+
+    Returns:
+        The value returned by `connect()`.
+
+    Raises:
+        DatabaseUnavailableError: If another worker already flagged the database as down.
+        DatabaseConnectionError: If a fatal error happens or the timeout expires.
+    """
+    loop = _RetryLoop(host, port, policy, log, database, user)
+    loop.check_flag()
+    while True:
+        loop.attempt += 1
+        try:
+            if probe_tcp(host, port, policy.probe_timeout):
+                loop.connecting()
+                connection = connect()
+                loop.succeeded()
+                return connection
+            loop.unreachable()
+        except Exception as error:
+            loop.failed(error)
+        time.sleep(loop.next_delay())
+
+
+async def connect_with_retry_async(
+    connect: Callable[[], Awaitable[T]],
+    host: str,
+    port: int,
+    policy: RetryPolicy = RetryPolicy(),
+    log: Callable[[str], None] = print,
+    database: Optional[str] = None,
+    user: Optional[str] = None,
+) -> T:
+    """
+    Awaits `connect()` with the same probing, backoff and shared flag as
+    `connect_with_retry`; the TCP probe runs in a thread to keep the event loop free.
+    """
+    loop = _RetryLoop(host, port, policy, log, database, user)
+    loop.check_flag()
+    while True:
+        loop.attempt += 1
+        try:
+            if await asyncio.to_thread(probe_tcp, host, port, policy.probe_timeout):
+                loop.connecting()
+                connection = await connect()
+                loop.succeeded()
+                return connection
+            loop.unreachable()
+        except Exception as error:
+            loop.failed(error)
+        await asyncio.sleep(loop.next_delay())
@@ -0,0 +1,138 @@
+"""
+Shard Planner
+
+Splits the collected tests across several CI nodes (`pytest --shard i/N`) so every node
+gets about the same amount of work, using the durations of previous runs.
+
+Classes:
+    DurationHistory:
+        Average duration of each test (JSON file), updated at the end of every run.
+
+Functions:
+    parse_shard(value):
+        Parses "i/N" (1-based) into (index, total).
+    partition(nodeids, durations, shards, default):
+        Longest-processing-time split of the tests into `shards` groups.
+
+Behavior:
+    - The split only depends on the node ids and the durations file, so every node
+      computes the same partition without talking to the others.
+    - Tests without history get the median of the known durations (or `default`).
+    - Longest tests are assigned first, each to the least loaded shard (ties broken by
+      shard index and node id), which keeps the slowest shard within a few percent of
+      the average.
+    - Durations are an exponential moving average, so one slow run does not unbalance
+      the next ones; the file is merged and written atomically like the flaky history.
+    - Shards must all see the same file, so a shard only writes its own durations to its
+      report folder and `merge_reports.py` adds them to the history.
+"""
+
+import heapq
+import json
+import os
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+# Peso da execução mais recente na média móvel das durações
+SMOOTHING = 0.3
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parses "i/N" into (i, N), with 1 <= i <= N."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N such as 1/4") from None
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}': i must be between 1 and N")
+    return index, total
+
+
+def partition(
+    nodeids: Sequence[str],
+    durations: Dict[str, float],
+    shards: int,
+    default: float = 5.0,
+) -> List[List[str]]:
+    """
+    Splits the tests into `shards` groups of similar total duration.
+
+    Returns:
+        List[List[str]]: Node ids of each shard, in the order received.
+    """
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    fallback = statistics.median(known) if known else default
+    weights = {nodeid: durations.get(nodeid, fallback) for nodeid in nodeids}
+
+    loads = [(0.0, shard) for shard in range(shards)]
+    assigned: Dict[str, int] = {}
+    for nodeid in sorted(nodeids, key=lambda nodeid: (-weights[nodeid], nodeid)):
+        load, shard = heapq.heappop(loads)
+        assigned[nodeid] = shard
+        heapq.heappush(loads, (load + weights[nodeid], shard))
+
+    groups: List[List[str]] = [[] for _ in range(shards)]
+    for nodeid in nodeids:
+        groups[assigned[nodeid]].append(nodeid)
+    return groups
+
+
+class DurationHistory:
+    """
+    Average duration (setup + call + teardown, in seconds) of each test.
+
+    Args:
+        path (str | Path): JSON file of the durations.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.durations: Dict[str, float] = self._read()
+        self.new_durations: Dict[str, float] = {}
+
+    def _read(self) -> Dict[str, float]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def add(self, nodeid: str, seconds: float) -> None:
+        """Adds the duration of a test phase in this run."""
+        self.new_durations[nodeid] = self.new_durations.get(nodeid, 0.0) + seconds
+
+    def save_run(self, path: Union[str, Path]) -> None:
+        """Writes only this run's durations (a shard), merged later with `merge_run`."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.new_durations, indent=1, sort_keys=True))
+
+    def merge_run(self, path: Union[str, Path]) -> None:
+        """Adds the durations written by `save_run` to this run."""
+        for nodeid, seconds in json.loads(Path(path).read_text()).items():
+            self.add(nodeid, seconds)
+
+    def save(self) -> None:
+        """Merges this run's durations into the file on disk and writes it atomically."""
+        if not self.new_durations:
+            return
+        merged = self._read()
+        for nodeid, seconds in self.new_durations.items():
+            previous = merged.get(nodeid)
+            merged[nodeid] = round(
+                (
+                    seconds
+                    if previous is None
+                    else previous + SMOOTHING * (seconds - previous)
+                ),
+                3,
+            )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump(merged, file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.durations = merged
+        self.new_durations = {}
@@ -7,6 +7,10 @@ Functions:
     replace_string(for_replaced: str, replaced_item: str, item_for_replace):
         Replaces occurrences of a substring in a given string with one or more replacement values.
 
+    replace_values(for_replaced: str, replaced_item: str, item_for_replace):
+        Same replacement without the Allure step and log, for code running outside the test
+        thread (e.g. the coroutines of AsyncDatabaseManager).
+
 Args:
     for_replaced (str): The original string where replacements will be performed.
     replaced_item (str): The substring to be replaced.
@@ -26,6 +30,16 @@ import allure
 from .logger import log_allure
 
 
+def replace_values(for_replaced: str, replaced_item: str, item_for_replace) -> str:
+    """Performs the replacements of `replace_string` without reporting them."""
+    if isinstance(item_for_replace, list):
+        for replacement in item_for_replace:
+            for_replaced = for_replaced.replace(replaced_item, replacement, 1)
+    else:
+        for_replaced = for_replaced.replace(replaced_item, item_for_replace)
+    return for_replaced
+
+
 @allure.step("Replace String")
 def replace_string(for_replaced: str, replaced_item: str, item_for_replace):
     """
@@ -47,11 +61,6 @@ def replace_string(for_replaced: str, replaced_item: str, item_for_replace):
             replace_string("A B C D", "B", ["X", "Y", "Z"])
             -> "A X C D" (only the first occurrence is replaced in this case)
     """
-    if isinstance(item_for_replace, list):
-        for replacement in item_for_replace:
-            for_replaced = for_replaced.replace(replaced_item, replacement, 1)
-    else:
-        for_replaced = for_replaced.replace(replaced_item, item_for_replace)
-
+    for_replaced = replace_values(for_replaced, replaced_item, item_for_replace)
     log_allure(f"Replaced String: {for_replaced}")
     return for_replaced
@@ -17,25 +17,33 @@ def set_pytest_config(config: Config):
 
 
 @allure.step("Get Base URL")
-def get_base_url() -> str:
+def get_base_url(env_config=None) -> str:
     """
     Returns the base URL in the following order:
-    1. Environment variable 'URL'
-    2. pytest.ini configuration 'base_url'
-    3. Raises error if neither is found
+    1. Variable 'URL' of the environment config (when given)
+    2. Environment variable 'URL'
+    3. pytest.ini configuration 'base_url'
+    4. Raises error if neither is found
     """
     try:
-        # 1. Tenta obter do ambiente
+        # 1. Tenta obter da configuração do ambiente em execução
+        if env_config and env_config.base_url:
+            log_allure(
+                f"Set base_url by {env_config.name} environment: {env_config.base_url}"
+            )
+            return env_config.base_url
+
+        # 2. Tenta obter do ambiente
         if "URL" in os.environ:
             log_allure(f"Set base_url by environment: {os.environ['URL']}")
             return os.environ["URL"]
 
-        # 2. Tenta obter do pytest.ini
+        # 3. Tenta obter do pytest.ini
         if _config and _config.inicfg.get("base_url"):
             log_allure(f"Set base_url by pytestini: {_config.inicfg['base_url']}")
             return _config.inicfg["base_url"]
 
-        # 3. Se não encontrar em nenhum lugar, lança exceção
+        # 4. Se não encontrar em nenhum lugar, lança exceção
         raise KeyError(
             "Base URL not found. Please set either:\n"
             "1. Environment variable 'URL'\n"
@@ -0,0 +1,377 @@
+"""
+Visual Regression Comparison
+
+Compares page screenshots with stored baselines using NumPy arrays, so a full-HD capture
+is compared in milliseconds instead of a Python loop over millions of pixels.
+
+Classes:
+    VisualChecker:
+        Takes the screenshots during the tests, stores missing baselines and compares
+        the pending screenshots in a process pool at the end of the session.
+
+Functions:
+    compare_images(actual, expected, ...):
+        Vectorized diff of two RGB arrays with color threshold, anti-aliasing tolerance
+        and ignore regions.
+    compare_files(job):
+        Compares a screenshot file with its baseline (runs in the worker processes).
+    check_visual(page_object, name, ignore):
+        Checkpoint used by `BasePage.check_visual` when a checker is active.
+
+Behavior:
+    - Baselines are stored per checkpoint name, device profile (viewport and pixel
+      ratio) and browser: `<BASELINE_FOLDER>/<browser>/<profile>/<name>.png`. Without a
+      name the checkpoint is named after the test node id and its position in the test.
+    - Screenshots of the run are stored per test,
+      `<OUTPUT_FOLDER>/<browser>/<profile>/<test node id>/<name>.png`, so tests using the
+      same checkpoint name do not overwrite each other.
+    - Prefilter: byte- or pixel-identical images are accepted without the diff; images
+      whose perceptual difference hash (dHash of HASH_SIZE x HASH_SIZE, ignore regions
+      blanked) differs in more than `max_hash_distance` of the bits are rejected
+      without the anti-aliasing analysis. A matching hash never accepts an image, as it
+      cannot see small changes such as a different text or color.
+    - A pixel differs when the largest channel difference is above `threshold` (0-1).
+      With anti-aliasing tolerance, a differing pixel whose color is inside the range of
+      its 3x3 neighbourhood in the other image (an edge moved by one pixel) is ignored.
+    - The comparison fails when the ratio of differing pixels is above `max_diff_ratio`;
+      a diff image (differences in red over the dimmed screenshot) is written.
+"""
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from .logger import log_info
+
+Region = Tuple[int, int, int, int]  # x, y, largura, altura em pixels da imagem
+
+PARTIAL_PREFIX = "partial_"
+RESULTS_FILE = "visual_results.json"
+
+_active: Optional["VisualChecker"] = None
+
+
+def set_active_checker(checker: Optional["VisualChecker"]) -> None:
+    global _active
+    _active = checker
+
+
+def decode(path: Union[str, Path]) -> np.ndarray:
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def dhash(image: np.ndarray, size: int = 16) -> np.ndarray:
+    """Difference hash: sign of the horizontal gradient of a size x size thumbnail."""
+    thumbnail = Image.fromarray(image).convert("L").resize((size + 1, size))
+    pixels = np.asarray(thumbnail, dtype=np.int16)
+    return pixels[:, 1:] > pixels[:, :-1]
+
+
+def hash_distance(
+    actual: np.ndarray,
+    expected: np.ndarray,
+    size: int = 16,
+    ignore_regions: Sequence[Region] = (),
+) -> float:
+    """Fraction of differing dHash bits (0 similar, ~0.5 unrelated images)."""
+    if ignore_regions:
+        actual, expected = actual.copy(), expected.copy()
+        for image in (actual, expected):
+            for x, y, width, height in ignore_regions:
+                image[max(y, 0) : y + height, max(x, 0) : x + width] = 0
+    return float((dhash(actual, size) != dhash(expected, size)).mean())
+
+
+def _neighbourhood_range(
+    image: np.ndarray, ys: np.ndarray, xs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Min and max color of the 3x3 neighbourhood of the given pixels."""
+    padded = np.pad(image, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    neighbours = np.stack(
+        [padded[ys + dy, xs + dx] for dy in range(3) for dx in range(3)]
+    )
+    return neighbours.min(axis=0), neighbours.max(axis=0)
+
+
+def compare_images(
+    actual: np.ndarray,
+    expected: np.ndarray,
+    threshold: float = 0.1,
+    anti_aliasing: bool = True,
+    ignore_regions: Sequence[Region] = (),
+) -> Tuple[np.ndarray, str]:
+    """
+    Pixel diff of two RGB images.
+
+    Returns:
+        Tuple[np.ndarray, str]: Boolean mask of the differing pixels and, when the images
+        cannot be compared (different sizes), the reason.
+    """
+    if actual.shape != expected.shape:
+        return np.ones(actual.shape[:2], dtype=bool), (
+            f"size {actual.shape[1]}x{actual.shape[0]} differs from baseline "
+            f"{expected.shape[1]}x{expected.shape[0]}"
+        )
+
+    limit = threshold * 255
+    # |a - b| em uint8 (max - min) sem converter a imagem inteira para int16
+    delta = np.maximum(actual, expected)
+    delta -= np.minimum(actual, expected)
+    mask = np.maximum(np.maximum(delta[..., 0], delta[..., 1]), delta[..., 2]) > limit
+    for x, y, width, height in ignore_regions:
+        mask[max(y, 0) : y + height, max(x, 0) : x + width] = False
+
+    if anti_aliasing and mask.any():
+        ys, xs = np.nonzero(mask)
+        anti_aliased = np.ones(len(ys), dtype=bool)
+        for image, other in ((expected, actual), (actual, expected)):
+            low, high = _neighbourhood_range(image, ys, xs)
+            color = other[ys, xs].astype(np.int16)
+            anti_aliased &= (
+                (color >= low.astype(np.int16) - limit)
+                & (color <= high.astype(np.int16) + limit)
+            ).all(axis=1)
+        mask[ys[anti_aliased], xs[anti_aliased]] = False
+    return mask, ""
+
+
+def diff_image(actual: np.ndarray, mask: np.ndarray) -> Image.Image:
+    """Dimmed screenshot with the differing pixels in red."""
+    image = (actual // 3 + 170).astype(np.uint8)
+    image[mask] = (255, 0, 0)
+    return Image.fromarray(image)
+
+
+def compare_files(job: Dict) -> Dict:
+    """Compares `job["actual"]` with `job["baseline"]` (picklable, for the process pool)."""
+    start = time.perf_counter()
+    result = {
+        "name": job["name"],
+        "test": job["test"],
+        "baseline": job["baseline"],
+        "actual": job["actual"],
+        "passed": True,
+        "diff_ratio": 0.0,
+        "prefilter": None,
+        "reason": "",
+    }
+    if Path(job["actual"]).read_bytes() == Path(job["baseline"]).read_bytes():
+        result["prefilter"] = "identical"
+        result["compare_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    actual, expected = decode(job["actual"]), decode(job["baseline"])
+    if actual.shape == expected.shape and np.array_equal(actual, expected):
+        result["prefilter"] = "identical"
+        result["compare_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    ignore_regions = job.get("ignore_regions", ())
+    anti_aliasing = job.get("anti_aliasing", True)
+    reason = ""
+    hash_size = job.get("hash_size", 16)
+    if hash_size and actual.shape == expected.shape:
+        distance = hash_distance(actual, expected, hash_size, ignore_regions)
+        if distance > job.get("max_hash_distance", 0.2):
+            # Layout diferente: reprova sem a análise de anti-aliasing pixel a pixel
+            result["prefilter"] = "dhash"
+            reason = f"perceptual hash distance {distance:.0%}"
+            anti_aliasing = False
+
+    mask, size_reason = compare_images(
+        actual,
+        expected,
+        threshold=job.get("threshold", 0.1),
+        anti_aliasing=anti_aliasing,
+        ignore_regions=ignore_regions,
+    )
+    ratio = float(mask.mean())
+    result["diff_ratio"] = round(ratio, 6)
+    result["reason"] = size_reason or reason
+    result["passed"] = not result["reason"] and ratio <= job.get(
+        "max_diff_ratio", 0.001
+    )
+    if not result["passed"]:
+        diff_path = Path(job["actual"]).with_suffix(".diff.png")
+        diff_image(actual, mask).save(diff_path)
+        result["diff"] = str(diff_path)
+    result["compare_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+
+def check_visual(
+    page_object, name: Optional[str] = None, ignore: Sequence = ()
+) -> None:
+    """Screenshot checkpoint of a page object (no-op without an active checker)."""
+    if _active is None:
+        return
+    _active.capture(page_object.page, name, ignore)
+
+
+class VisualChecker:
+    """
+    Visual checkpoints of a test session.
+
+    Args:
+        baseline_folder (str | Path): Folder of the baselines.
+        output_folder (str | Path): Folder of the screenshots and diff images of the run.
+        update (bool): Replace the baselines with the new screenshots. Defaults to False
+        workers (int): Processes of the comparison pool. Defaults to 2
+        **options: threshold, max_diff_ratio, anti_aliasing, hash_size and
+            max_hash_distance of the jobs.
+    """
+
+    def __init__(
+        self,
+        baseline_folder: Union[str, Path],
+        output_folder: Union[str, Path],
+        update: bool = False,
+        workers: int = 2,
+        **options,
+    ):
+        self.baseline_folder = Path(baseline_folder)
+        self.output_folder = Path(output_folder)
+        self.update = update
+        self.workers = workers
+        self.options = options
+        self.current_test = ""
+        self.pending: List[Dict] = []
+        self._checkpoints: Dict[str, int] = {}
+        self.new_baselines: List[str] = []
+        self.results: List[Dict] = []
+
+    @classmethod
+    def from_config(cls, get_config: dict, update: bool = False) -> "VisualChecker":
+        settings = (get_config or {}).get("VISUAL") or {}
+        return cls(
+            settings.get("BASELINE_FOLDER", "resources/visual_baselines"),
+            settings.get("OUTPUT_FOLDER", "reports/visual"),
+            update=update,
+            workers=settings.get("WORKERS", 2),
+            threshold=settings.get("THRESHOLD", 0.1),
+            max_diff_ratio=settings.get("MAX_DIFF_RATIO", 0.001),
+            anti_aliasing=settings.get("ANTI_ALIASING", True),
+            hash_size=settings.get("HASH_SIZE", 16),
+            max_hash_distance=settings.get("MAX_HASH_DISTANCE", 0.2),
+        )
+
+    @staticmethod
+    def profile(page) -> Tuple[str, str, float]:
+        """(browser, device profile, pixel ratio) of the page."""
+        viewport = page.viewport_size or {"width": 0, "height": 0}
+        ratio = page.evaluate("() => window.devicePixelRatio")
+        browser = page.context.browser
+        browser_name = browser.browser_type.name if browser else "browser"
+        return (
+            browser_name,
+            f"{viewport['width']}x{viewport['height']}@{ratio:g}x",
+            ratio,
+        )
+
+    def _regions(self, page, ignore: Sequence, ratio: float) -> List[Region]:
+        """Ignore regions in image pixels; selectors are resolved to their boxes."""
+        regions = []
+        for item in ignore:
+            if isinstance(item, str):
+                for locator in page.locator(item).all():
+                    box = locator.bounding_box()
+                    if box:
+                        regions.append(
+                            tuple(
+                                int(round(box[key] * ratio))
+                                for key in ("x", "y", "width", "height")
+                            )
+                        )
+            else:
+                regions.append(tuple(int(value) for value in item))
+        return regions
+
+    def checkpoint_name(self, name: Optional[str] = None) -> str:
+        """
+        Name of the next checkpoint of the current test: `name` or, when omitted,
+        "<test node id>-<n>" (n-th unnamed checkpoint of the test).
+
+        Raises:
+            ValueError: If no name is given outside a test.
+        """
+        if name:
+            return name
+        if not self.current_test:
+            raise ValueError("A visual checkpoint outside a test needs a name")
+        count = self._checkpoints.get(self.current_test, 0) + 1
+        self._checkpoints[self.current_test] = count
+        return f"{self.current_test}-{count}"
+
+    def capture(self, page, name: Optional[str] = None, ignore: Sequence = ()) -> None:
+        name = self.checkpoint_name(name)
+        browser_name, profile, ratio = self.profile(page)
+        safe_name = _safe_name(name)
+        baseline = self.baseline_folder / browser_name / profile / f"{safe_name}.png"
+        actual = (
+            self.output_folder
+            / browser_name
+            / profile
+            / _safe_name(self.current_test or "session")
+            / f"{safe_name}.png"
+        )
+        actual.parent.mkdir(parents=True, exist_ok=True)
+        page.screenshot(path=str(actual))
+
+        if self.update or not baseline.exists():
+            baseline.parent.mkdir(parents=True, exist_ok=True)
+            baseline.write_bytes(actual.read_bytes())
+            self.new_baselines.append(str(baseline))
+            log_info(f"Visual baseline saved: {baseline}")
+            return
+
+        self.pending.append(
+            {
+                "name": name,
+                "test": self.current_test,
+                "baseline": str(baseline),
+                "actual": str(actual),
+                "ignore_regions": self._regions(page, ignore, ratio),
+                **self.options,
+            }
+        )
+
+    def run_pending(self) -> List[Dict]:
+        """Compares the pending screenshots in a process pool."""
+        jobs, self.pending = self.pending, []
+        if self.workers <= 1 or len(jobs) <= 1:
+            results = [compare_files(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+                results = list(pool.map(compare_files, jobs))
+        self.results.extend(results)
+        return results
+
+    def save_partial(self, worker_id: str) -> Path:
+        """Writes the results of this process (one file per xdist worker)."""
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+        path = self.output_folder / f"{PARTIAL_PREFIX}{worker_id}.json"
+        path.write_text(
+            json.dumps({"results": self.results, "new_baselines": self.new_baselines})
+        )
+        return path
+
+    def merge_partials(self) -> Dict:
+        """Merges the worker files into `visual_results.json`."""
+        merged = {"results": [], "new_baselines": []}
+        for path in sorted(self.output_folder.glob(f"{PARTIAL_PREFIX}*.json")):
+            partial = json.loads(path.read_text())
+            merged["results"].extend(partial["results"])
+            merged["new_baselines"].extend(partial["new_baselines"])
+            path.unlink()
+        (self.output_folder / RESULTS_FILE).write_text(json.dumps(merged, indent=2))
+        return merged
@@ -0,0 +1,134 @@
+"""
+Per-Worker Database Schemas
+
+With pytest-xdist every worker shares the same `DB_NAME`, so tests changing the same
+tables collide. When `DB_PER_WORKER` is enabled, each worker gets its own schema
+(`testdb_<run>_gw0`, `testdb_<run>_gw1`, ...) cloned from the template schema, and the
+database managers route to it automatically once it was created.
+
+Classes:
+    WorkerSchema:
+        Creates a worker schema as a copy of the template schema and drops it.
+
+Functions:
+    worker_id():
+        xdist worker id of the current process (None outside xdist).
+
+    is_per_worker_enabled(get_config):
+        Tells whether the per-worker schemas are enabled (config.yaml or --db-per-worker).
+
+    worker_schema_name(database, worker):
+        Schema name of the worker in this run.
+
+    routed_schema(database):
+        Schema the database managers of this process connect to.
+
+Behavior:
+    - The schemas are seeded in parallel, each worker cloning the template on its own
+      connection (`CREATE TABLE ... LIKE` + `INSERT ... SELECT`).
+    - Snapshot tables (`__snap_*`, see `utils/DatabaseSnapshot.py`) are copied too, so
+      `pytest --db-restore` restores each worker schema from its own snapshot.
+    - The name carries a token of the run (PYTEST_XDIST_TESTRUNUID), so two pytest
+      processes on the same database (e.g. `make lanes`) never drop each other's schemas.
+      Schemas left by an interrupted run are not removed automatically.
+    - Managers only route to the worker schema after `WorkerSchema.create()` ran in the
+      same process; before that (or without xdist) the template schema itself is used.
+    - The database user needs privileges on the worker schemas, e.g.
+      GRANT ALL ON `testdb\\_%`.* TO 'testuser'@'%'
+"""
+
+import os
+import time
+from typing import Callable, Dict, Optional
+
+from .DatabaseSnapshot import DatabaseSnapshot
+
+PER_WORKER_ENV = "DB_PER_WORKER"
+# Schemas de worker criados neste processo, por schema modelo
+_created_schemas: Dict[str, str] = {}
+
+
+def worker_id() -> Optional[str]:
+    """xdist worker id (gw0, gw1, ...) of the current process."""
+    return os.getenv("PYTEST_XDIST_WORKER")
+
+
+def is_per_worker_enabled(get_config: Optional[dict]) -> bool:
+    """Enabled by DB_PER_WORKER in config.yaml or by the DB_PER_WORKER variable."""
+    value = os.getenv(PER_WORKER_ENV, (get_config or {}).get("DB_PER_WORKER", False))
+    return value.lower() == "true" if isinstance(value, str) else bool(value)
+
+
+def run_token() -> str:
+    """Short id of the pytest run (shared by its workers), or of this process."""
+    return (os.getenv("PYTEST_XDIST_TESTRUNUID") or f"p{os.getpid()}")[:8]
+
+
+def worker_schema_name(database: str, worker: Optional[str] = None) -> str:
+    """Schema of the worker in this run, or the template schema itself outside xdist."""
+    worker = worker or worker_id()
+    return f"{database}_{run_token()}_{worker}" if worker else database
+
+
+def routed_schema(database: str) -> str:
+    """Worker schema created by this process from `database`, otherwise `database`."""
+    return _created_schemas.get(database, database)
+
+
+class WorkerSchema:
+    """
+    Schema of an xdist worker, cloned from the template schema.
+
+    Args:
+        connection: Open DB-API connection (mysql.connector) to the template schema.
+        template (str): Template schema name (DB_NAME).
+        name (str): Worker schema name.
+        log (Callable): Function used to report progress. Defaults to print
+    """
+
+    def __init__(
+        self, connection, template: str, name: str, log: Callable[[str], None] = print
+    ):
+        self.connection = connection
+        self.template = template
+        self.name = name
+        self.log = log
+
+    def create(self) -> float:
+        """
+        (Re)creates the worker schema with a copy of every template table.
+
+        Returns:
+            float: Creation time in seconds.
+        """
+        start = time.perf_counter()
+        tables = DatabaseSnapshot(self.connection, self.template).all_tables()
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{self.name}`")
+            cursor.execute(f"CREATE DATABASE `{self.name}`")
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            for table in tables:
+                cursor.execute(
+                    f"CREATE TABLE `{self.name}`.`{table}` LIKE `{self.template}`.`{table}`"
+                )
+                cursor.execute(
+                    f"INSERT INTO `{self.name}`.`{table}` "
+                    f"SELECT * FROM `{self.template}`.`{table}`"
+                )
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        self.connection.commit()
+        _created_schemas[self.template] = self.name
+
+        elapsed = time.perf_counter() - start
+        self.log(
+            f"✅ Worker schema '{self.name}' created from '{self.template}' "
+            f"in {elapsed * 1000:.0f} ms ({len(tables)} tables)"
+        )
+        return elapsed
+
+    def drop(self) -> None:
+        if _created_schemas.get(self.template) == self.name:
+            del _created_schemas[self.template]
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{self.name}`")
+        self.log(f"Worker schema '{self.name}' dropped")